@@ -606,6 +606,7 @@ array_significant_figures_stack = []
 array_decimal_values_stack = []
 warning_level_stack = []
 nan_policy_stack = []
+nan_check_interval_stack = []
 dynamic_backend_stack = []
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
@@ -756,7 +757,7 @@ invalid_float_dtypes = ()
 invalid_uint_dtypes = ()
 invalid_complex_dtypes = ()
 
-locks = {"backend_setter": threading.Lock()}
+locks = {"backend_setter": threading.Lock(), "backend_compiler": threading.Lock()}
 
 
 from .func_wrapper import *
@@ -792,6 +793,9 @@ from ivy.utils.backend import (
     backend_stack,
     choose_random_backend,
     unset_backend,
+    set_local_backend,
+    previous_local_backend,
+    local_backend,
 )
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
@@ -802,7 +806,7 @@ from . import stateful
 from .stateful import *
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
-add_array_specs()
+add_array_specs(ivy)
 
 _imported_frameworks_before_compiler = list(sys.modules.keys())
 
@@ -965,6 +969,8 @@ globals_vars = GlobalsDict(
         "show_func_wrapper_trace_mode_stack": (
             general.show_func_wrapper_trace_mode_stack
         ),
+        "compose_wrappers_mode_stack": general.compose_wrappers_mode_stack,
+        "lazy_wrapping_mode_stack": general.lazy_wrapping_mode_stack,
         "min_denominator_stack": general.min_denominator_stack,
         "min_base_stack": general.min_base_stack,
         "tmp_dir_stack": general.tmp_dir_stack,
@@ -976,6 +982,7 @@ globals_vars = GlobalsDict(
         "default_int_dtype_stack": data_type.default_int_dtype_stack,
         "default_uint_dtype_stack": data_type.default_uint_dtype_stack,
         "nan_policy_stack": nan_policy_stack,
+        "nan_check_interval_stack": nan_check_interval_stack,
         "dynamic_backend_stack": dynamic_backend_stack,
     }
 )
@@ -1159,6 +1166,41 @@ def unset_nan_policy():
         ivy.__setattr__("nan_policy", warn_level, True)
 
 
+# nan check interval #
+ivy.nan_check_interval = nan_check_interval_stack[-1] if nan_check_interval_stack else 1
+
+
+def set_nan_check_interval(interval):
+    """
+    Set the interval of the calls for which the nan policy is applied, such that only
+    every `interval`-th call of a function is checked for nans. This trades how
+    quickly nans are caught for the overhead of the checks.
+
+    Parameters
+    ----------
+    interval
+        positive integer, the number of calls between two checks for nans.
+    """
+    if not isinstance(interval, int) or interval < 1:
+        raise ivy.utils.exceptions.IvyException(
+            "nan_check_interval must be a positive integer"
+        )
+    global nan_check_interval_stack
+    nan_check_interval_stack.append(interval)
+    ivy.__setattr__("nan_check_interval", interval, True)
+    ivy.func_wrapper._nan_check_interval_generation += 1
+
+
+def unset_nan_check_interval():
+    """Unset the currently set nan check interval."""
+    global nan_check_interval_stack
+    if nan_check_interval_stack:
+        nan_check_interval_stack.pop(-1)
+        interval = nan_check_interval_stack[-1] if nan_check_interval_stack else 1
+        ivy.__setattr__("nan_check_interval", interval, True)
+        ivy.func_wrapper._nan_check_interval_generation += 1
+
+
 # Dynamic Backend
 
 
@@ -1437,11 +1479,14 @@ GLOBAL_PROPS = [
     "array_decimal_values",
     "warning_level",
     "nan_policy",
+    "nan_check_interval",
     "array_mode",
     "nestable_mode",
     "inplace_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
+    "compose_wrappers_mode",
+    "lazy_wrapping_mode",
     "min_denominator",
     "min_base",
     "queue_timeout",
@@ -1511,7 +1556,7 @@ class LoggingMode:
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
         previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        filename = previous_frame.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
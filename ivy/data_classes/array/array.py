@@ -28,6 +28,7 @@ from .set import _ArrayWithSet
 from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
+from ivy import func_wrapper
 from ivy.func_wrapper import handle_view_indexing
 from .experimental import (
     _ArrayWithSearchingExperimental,
@@ -160,7 +161,9 @@ class Array(
         self._dev_str = None
         self._pre_repr = None
         self._post_repr = None
-        self._backend = ivy.backend
+        self._backend = backend = ivy.backend
+        self._backend_generation = func_wrapper._backend_generation
+        self._backend_ref = func_wrapper._register_array(self, backend)
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
@@ -193,6 +196,9 @@ class Array(
 
         if value == False:
             self._backend = _determine_backend_from_args(self).backend
+            self._backend_ref = func_wrapper._register_array(
+                self, self._backend, self._backend_ref
+            )
 
         else:
             ivy_backend = ivy.with_backend(self._backend)
@@ -471,6 +477,7 @@ class Array(
         ivy.previous_backend()
 
         self.__dict__ = ivy_array.__dict__
+        self._backend_ref = func_wrapper._register_array(self, self._backend)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
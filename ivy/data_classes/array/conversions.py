@@ -40,7 +40,8 @@ def _to_ivy(x: Any) -> Any:
     elif isinstance(x, ivy.NativeShape):
         return ivy.Shape(x)
     elif isinstance(x, ivy.Container):
-        return x.to_ivy()
+        # the leaves of packed containers are ivy arrays already
+        return x if x.cont_is_packed else x.to_ivy()
     if ivy.is_native_array(x) or isinstance(x, np.ndarray):
         return ivy.Array(x)
     return x
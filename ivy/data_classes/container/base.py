@@ -20,6 +20,7 @@ except ModuleNotFoundError:
     h5py = None
 import pickle
 import random
+import weakref
 from operator import mul
 from functools import reduce as _reduce
 from typing import Union, Tuple
@@ -30,6 +31,8 @@ import ivy
 
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# the first bytes of containers saved with cont_to_disk_as_mmap
+_MMAP_MAGIC = b"IVYCONT1"
 
 
 def _is_jsonable(x):
@@ -40,6 +43,35 @@ def _is_jsonable(x):
         return False
 
 
+def _set_at_key_chain(dict_in, key_chain, value):
+    for key in key_chain[:-1]:
+        dict_in = dict_in.setdefault(key, dict())
+    dict_in[key_chain[-1]] = value
+
+
+class _PackedLayout:
+    # the layout of the leaves of a packed container in its flat buffers, shared by
+    # the containers packed like it
+
+    __slots__ = ("leaves", "groups", "segment_ids")
+
+    def __init__(self, leaves, groups):
+        # the keys, buffer index, start, stop and shape of each leaf in iteration
+        # order, with a buffer index of None for the empty sub-containers
+        self.leaves = leaves
+        # the key-chains, shapes and sizes of the leaves in each buffer
+        self.groups = groups
+        self.segment_ids = None
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, _PackedLayout) and self.leaves == other.leaves
+        )
+
+    def __hash__(self):
+        return id(self)
+
+
 def _repr(x):
     try:
         return x.__repr__()
@@ -47,10 +79,75 @@ def _repr(x):
         return str(x)
 
 
+class _LazyArrayMixin:
+    # an ivy array which only reads its data from disk when the data is first used,
+    # taking its shape and dtype from the file until then. The array is initialized
+    # once its data is loaded, and any attribute missing until then loads it
+
+    def __init__(self, load_fn, shape, dtype, ivyh):
+        self._load_fn = load_fn
+        self._disk_shape = shape
+        self._disk_dtype = ivyh.as_ivy_dtype(dtype)
+        self._ivyh = ivyh
+
+    def __getattr__(self, item):
+        if not self.is_loaded and not item.startswith("__"):
+            self._data
+            return getattr(self, item)
+        return super().__getattr__(item)
+
+    @property
+    def _data(self):
+        if not self.is_loaded:
+            super().__init__(self._ivyh.asarray(self._load_fn()).data)
+        return self._loaded
+
+    @_data.setter
+    def _data(self, data):
+        self._loaded = data
+
+    @property
+    def is_loaded(self):
+        return "_loaded" in self.__dict__
+
+    @property
+    def shape(self):
+        if not self.is_loaded and self._disk_shape is not None:
+            return self._ivyh.Shape(self._disk_shape)
+        return super().shape
+
+    @property
+    def dtype(self):
+        if not self.is_loaded:
+            return self._disk_dtype
+        return super().dtype
+
+
+# the lazy array class of the array class of each ivy handle, so that the arrays
+# loaded with a handle are arrays of that handle
+_lazy_array_classes = weakref.WeakKeyDictionary()
+
+
+def _lazy_array(load_fn, shape, dtype, ivyh):
+    array_class = ivyh.Array
+    lazy_array_class = _lazy_array_classes.get(array_class)
+    if lazy_array_class is None:
+        lazy_array_class = type("_LazyArray", (_LazyArrayMixin, array_class), {})
+        _lazy_array_classes[array_class] = lazy_array_class
+    return lazy_array_class(load_fn, shape, dtype, ivyh)
+
+
 # noinspection PyMissingConstructor
 
 
 class ContainerBase(dict, abc.ABC):
+    # the index of the key-chains of the container, built when first needed, and the
+    # containers whose indices cover this one, which are invalidated when it changes
+    _key_chain_index = None
+    _key_chain_index_owners = None
+    # the layout and flat buffers of a packed container, dropped along with the index
+    _packed = None
+
     def __init__(
         self,
         dict_in=None,
@@ -705,6 +802,21 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container
         """
+        if key_chain == "" and all(isinstance(c, ivy.Container) for c in containers):
+            # containers with the same leaves are mapped over their indices at once
+            indices = [c._cont_key_chain_index() for c in containers]
+            if indices and all(
+                index and index[1] == indices[0][1] for index in indices
+            ):
+                return ivy.Container._cont_multi_map_indices(
+                    func,
+                    indices,
+                    key_chains,
+                    to_apply,
+                    prune_unapplied,
+                    ivy.default(config, containers[0].cont_config),
+                    map_nests,
+                )
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -723,6 +835,7 @@ class ContainerBase(dict, abc.ABC):
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
         return_dict = dict()
+        prefixes = None if key_chains is None else tuple(key_chains)
 
         for key in keys:
             values = []
@@ -735,17 +848,8 @@ class ContainerBase(dict, abc.ABC):
             if len(values) >= 1:
                 this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
                 is_container = [ivy.is_ivy_container(x) for x in values]
-
-                def _found_in_key_chains(this_key_chain, key_chains):
-                    if key_chains is None:
-                        return False
-                    for key_chain in key_chains:
-                        if this_key_chain.startswith(key_chain):
-                            return True
-                    return False
-
                 if not assert_identical and not all(is_container) and any(is_container):
-                    found = _found_in_key_chains(this_key_chain, key_chains)
+                    found = prefixes is not None and this_key_chain.startswith(prefixes)
                     if key_chains is not None:
                         if (found and not to_apply) or (not found and to_apply):
                             if prune_unapplied:
@@ -778,7 +882,9 @@ class ContainerBase(dict, abc.ABC):
                             continue
                         return_dict[key] = ret
                     else:
-                        found = _found_in_key_chains(this_key_chain, key_chains)
+                        found = prefixes is not None and this_key_chain.startswith(
+                            prefixes
+                        )
                         if key_chains is not None:
                             if (found and not to_apply) or (not found and to_apply):
                                 if prune_unapplied:
@@ -1147,12 +1253,18 @@ class ContainerBase(dict, abc.ABC):
             return ivy.Container.cont_from_disk_as_pickled(filepath)
         elif format == "h5py":
             return ivy.Container.cont_from_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            return ivy.Container.cont_from_disk_as_mmap(filepath)
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1170,6 +1282,10 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to only read each of the datasets from the file when the data of its
+            array is first used, keeping the file open until then. Default is
+            ``False``.
 
         Returns
         -------
@@ -1191,18 +1307,97 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh=ivyh, lazy=lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                ivy_ = ivy.default(ivyh, ivy)
+                if lazy:
+                    shape = None
+                    if isinstance(slice_obj, slice):
+                        shape = list(value.shape)
+                        shape[0] = len(range(*slice_obj.indices(shape[0])))
+                    container_dict[key] = _lazy_array(
+                        lambda value=value: value[slice_obj],
+                        shape,
+                        str(value.dtype),
+                        ivy_,
+                    )
+                else:
+                    # the dataset is read straight into a numpy array, which the
+                    # backend can then use without copying where possible
+                    container_dict[key] = ivy_.asarray(value[slice_obj])
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_mmap(filepath, lazy=True, alphabetical_keys=True, ivyh=None):
+        """
+        Load container object from disk at the specified filepath, as saved by
+        :meth:`cont_to_disk_as_mmap`. The file is memory-mapped copy-on-write, so that
+        the arrays are views of the mapped file rather than copies of it, and
+        processes loading the same file share its pages until they write to them.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        lazy
+            Whether to only convert each of the mapped arrays to the backend when the
+            data of its ivy array is first used. Default is ``True``.
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, rather than keeping the
+            order they were saved in. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(filepath, "rb") as f:
+            if f.read(len(_MMAP_MAGIC)) != _MMAP_MAGIC:
+                raise ivy.utils.exceptions.IvyException(
+                    "{} is not a container saved with cont_to_disk_as_mmap.".format(
+                        filepath
+                    )
+                )
+            header_size = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            header = json.loads(f.read(header_size).decode("utf-8"))
+        alignment = header["alignment"]
+        data_start = -(-(len(_MMAP_MAGIC) + 8 + header_size) // alignment) * alignment
+        ivy_ = ivy.default(ivyh, ivy)
+        mapped = np.memmap(filepath, dtype=np.uint8, mode="c")
+        container_dict = dict()
+        # the leaves are set in the order they were saved in, so that the key order
+        # survives the round trip
+        for key_chain, kind, *leaf in header["leaves"]:
+            if kind == "array":
+                dtype, shape, offset = leaf
+                dtype = np.dtype(dtype)
+                start = data_start + offset
+                view = (
+                    mapped[start : start + dtype.itemsize * _reduce(mul, shape, 1)]
+                    .view(dtype)
+                    .reshape(shape)
+                )
+                value = (
+                    _lazy_array(lambda view=view: view, shape, dtype.name, ivy_)
+                    if lazy
+                    else ivy_.asarray(view)
+                )
+            elif kind == "value":
+                value = leaf[0]
+            else:
+                value = dict()
+            _set_at_key_chain(container_dict, key_chain, value)
+        return ivy.Container(
+            container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh
+        )
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """
@@ -1563,6 +1758,97 @@ class ContainerBase(dict, abc.ABC):
             return sub_devs[0]
         return None
 
+    def _cont_key_chain_index(self):
+        """
+        Get the index of the key-chains of the container, building it if needed.
+
+        The index is a dict from every key-chain of the container, sub-containers
+        included, to its value, along with the key-chains of the leaves, with and
+        without the empty sub-containers, in iteration order. It's kept until the
+        container or any of its sub-containers is changed.
+
+        Returns
+        -------
+        ret
+            the index, or ``False`` if a key isn't a string which can be part of a
+            key-chain, in which case the key-chains need to be walked instead.
+        """
+        if self._key_chain_index is not None:
+            return self._key_chain_index
+        nodes = dict()
+        leaves = list()
+        leaves_and_empty = list()
+        owner = weakref.ref(self)
+
+        def _index(cont, key_chain):
+            if cont._key_chain_index_owners is None:
+                cont._key_chain_index_owners = dict()
+            cont._key_chain_index_owners[id(self)] = owner
+            for key, value in cont.items():
+                if not isinstance(key, str) or not key or "/" in key or "." in key:
+                    return False
+                kc = key_chain + key
+                nodes[kc] = value
+                if isinstance(value, ivy.Container):
+                    # empty sub-containers are walked too, to track their changes
+                    if not _index(value, kc + "/"):
+                        return False
+                    if not value:
+                        leaves_and_empty.append(kc)
+                else:
+                    leaves.append(kc)
+                    leaves_and_empty.append(kc)
+            return True
+
+        if _index(self, ""):
+            self._key_chain_index = (nodes, leaves, leaves_and_empty)
+        else:
+            self._key_chain_index = False
+        return self._key_chain_index
+
+    def _cont_invalidate_key_chain_index(self):
+        # the packing is dropped too, as the leaves might not be views of the buffers
+        if self._key_chain_index is not None:
+            self._key_chain_index = None
+        if self._packed is not None:
+            self._packed = None
+        owners = self._key_chain_index_owners
+        if owners:
+            self._key_chain_index_owners = None
+            for owner in owners.values():
+                owner = owner()
+                if owner is None:
+                    continue
+                if owner._key_chain_index is not None:
+                    owner._key_chain_index = None
+                if owner._packed is not None:
+                    owner._packed = None
+
+    @staticmethod
+    def _cont_multi_map_indices(
+        func, indices, key_chains, to_apply, prune_unapplied, config, map_nests
+    ):
+        # cont_multi_map over containers with the same leaves, given their indices
+        prefixes = None if key_chains is None else tuple(key_chains)
+        nodes = [index[0] for index in indices]
+        return_dict = dict()
+        for kc in indices[0][1]:
+            values = [n[kc] for n in nodes]
+            if any(isinstance(x, (list, tuple)) for x in values) and map_nests:
+                ret = ivy.nested_multi_map(
+                    lambda x, _: func(x, None), values, to_ivy=False
+                )
+                if prune_unapplied and not ret:
+                    continue
+            elif key_chains is not None and kc.startswith(prefixes) != bool(to_apply):
+                if prune_unapplied:
+                    continue
+                ret = values[0]
+            else:
+                ret = func(values, kc)
+            _set_at_key_chain(return_dict, kc.split("/"), ret)
+        return ivy.Container(return_dict, **config)
+
     def _cont_at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
         return_cont = ivy.Container(dict(), **self._config)
         for kc in key_chains:
@@ -1595,10 +1881,39 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(return_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_seq(self, key_chains):
-        return_cont = self.cont_copy()
+        if not key_chains:
+            return self.cont_copy()
+        # a trie of the key-chains, with None marking the end of a key-chain
+        trie = dict()
         for kc in key_chains:
-            return_cont = return_cont.cont_prune_key_chain(kc)
-        return return_cont
+            node = trie
+            for key in re.split("[/.]", kc):
+                if None in node:
+                    # a key-chain this one continues is already pruned
+                    break
+                node = node.setdefault(key, dict())
+            else:
+                node.clear()
+                node[None] = None
+        return self._cont_prune_key_chains_trie(trie)
+
+    def _cont_prune_key_chains_trie(self, trie):
+        # prune all the key-chains at once, like pruning them one after the other
+        out_dict = dict()
+        for key, value in self.items():
+            node = trie.get(key)
+            if node is not None and None in node:
+                continue
+            if isinstance(value, ivy.Container):
+                if node is not None:
+                    new_val = value._cont_prune_key_chains_trie(node)
+                    if len(new_val) > 0:
+                        out_dict[key] = new_val
+                elif len(value) > 0:
+                    out_dict[key] = value.cont_to_dict()
+            else:
+                out_dict[key] = value
+        return ivy.Container(out_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_dict(self, key_chains, return_cont=None):
         if return_cont is None:
@@ -2019,11 +2334,20 @@ class ContainerBase(dict, abc.ABC):
             self.cont_to_disk_as_pickled(filepath)
         elif format == "h5py":
             self.cont_to_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            self.cont_to_disk_as_mmap(filepath)
         else:
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
@@ -2041,6 +2365,17 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Number of batch entries in each chunk of the datasets created in the file,
+            with each chunk spanning the remaining dimensions in full. ``False``
+            stores the datasets contiguously, in which case they can't be appended to
+            later. Default is ``None``, which lets h5py guess the chunk shapes.
+        compression
+            Compression filter of the datasets created in the file, such as
+            ``"gzip"`` or ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+            Default is ``None``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2060,7 +2395,13 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
                 value_as_np = self._cont_ivy.to_numpy(value)
@@ -2074,15 +2415,88 @@ class ContainerBase(dict, abc.ABC):
                 if key not in h5_obj.keys():
                     dataset_shape = [max_bs] + list(value_shape[1:])
                     maxshape = [None for _ in dataset_shape]
+                    dataset_chunks = chunks
+                    if chunks is False:
+                        # datasets are only stored contiguously if they can't be
+                        # resized
+                        maxshape, dataset_chunks = None, None
+                    elif isinstance(chunks, int) and not isinstance(chunks, bool):
+                        dataset_chunks = (max(min(chunks, max_bs), 1), *value_shape[1:])
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=dataset_chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
                 space_left = max_bs - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+                # the rows are written as a single slab rather than one at a time
+                h5_obj[key][starting_index : starting_index + amount_to_write] = (
+                    value_as_np[:amount_to_write]
+                )
+        if isinstance(h5_obj_or_filepath, str):
+            h5_obj.close()
+
+    def cont_to_disk_as_mmap(self, filepath, alignment=64):
+        """
+        Save container object to disk at the specified filepath, as a json header
+        indexing the key chains of the leaves in order, empty sub-containers
+        included, followed by the raw buffers of the arrays, each aligned to
+        ``alignment`` bytes. The file can then be memory-mapped by
+        :meth:`cont_from_disk_as_mmap`.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        alignment
+            The number of bytes to align the start of each array buffer to.
+            Default is ``64``.
+        """
+        leaves = list()
+        buffers = list()
+        offset = 0
+        for key_chain, value in self.cont_to_iterator(include_empty=True):
+            key_chain = key_chain.split("/")
+            value_as_np = (
+                np.asarray(self._cont_ivy.to_numpy(value), order="C")
+                if ivy.is_array(value)
+                else None
+            )
+            if isinstance(value, ivy.Container):
+                leaves.append([key_chain, "empty"])
+            elif value_as_np is not None and not value_as_np.dtype.hasobject:
+                leaves.append(
+                    [
+                        key_chain,
+                        "array",
+                        value_as_np.dtype.str,
+                        list(value_as_np.shape),
+                        offset,
+                    ]
+                )
+                buffers.append((offset, value_as_np))
+                offset = -(-(offset + value_as_np.nbytes) // alignment) * alignment
+            elif _is_jsonable(value):
+                leaves.append([key_chain, "value", value])
+            else:
+                raise ivy.utils.exceptions.IvyException(
+                    "Leaf {} of type {} is neither a numeric array nor jsonable."
+                    .format("/".join(key_chain), type(value))
+                )
+        header = json.dumps({"alignment": alignment, "leaves": leaves}).encode("utf-8")
+        data_start = -(-(len(_MMAP_MAGIC) + 8 + len(header)) // alignment) * alignment
+        with open(filepath, "wb") as f:
+            f.write(_MMAP_MAGIC)
+            f.write(np.array(len(header), dtype="<u8").tobytes())
+            f.write(header)
+            for buffer_offset, value_as_np in buffers:
+                f.seek(data_start + buffer_offset)
+                f.write(value_as_np.data)
+            f.truncate(data_start + offset)
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
@@ -2289,6 +2703,216 @@ class ContainerBase(dict, abc.ABC):
             new_dict[key] = new_value
         return ivy.Container(new_dict, **self._config)
 
+    def cont_pack(self, like=None):
+        """
+        Pack the arrays of the container into flat buffers, one for each dtype and
+        device, returning a container whose leaves are views into these buffers.
+
+        Elementwise operations on packed containers, such as the arithmetic operators
+        and the optimizer updates, are then run once on each buffer rather than once
+        for each leaf. The packing is dropped once the structure of the container or
+        any of its leaves is changed, and the leaves are only views on the backends
+        which support them, so in-place updates of the leaves only reach the buffers
+        with these backends.
+
+        Parameters
+        ----------
+        like
+            a packed container whose layout to pack the container into, such that
+            both can be operated on together. Default is ``None``, in which case the
+            layout is created from the container.
+
+        Returns
+        -------
+        ret
+            the packed container, which is the container itself if it's already
+            packed like ``like``.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> y = x.cont_pack()
+        >>> print(y.cont_packed_buffers)
+        (ivy.array([1., 2., 3.]),)
+        >>> print((y * 2).b.c)
+        ivy.array([[6.]])
+        """
+        index = self._cont_key_chain_index()
+        if not index:
+            raise ivy.utils.exceptions.IvyException(
+                "the keys of packed containers must be strings which can be part of "
+                "key-chains"
+            )
+        nodes, leaf_key_chains, key_chains = index
+        if like is None:
+            if self._cont_get_packed() is not None:
+                return self
+            groups = dict()
+            for kc in leaf_key_chains:
+                x = nodes[kc]
+                if not ivy.is_array(x):
+                    raise ivy.utils.exceptions.IvyException(
+                        "only containers of arrays can be packed, but found {} at "
+                        "key-chain {}".format(type(x), kc)
+                    )
+                groups.setdefault((ivy.dtype(x), ivy.dev(x)), list()).append(kc)
+            positions = dict()
+            layout_groups = list()
+            for i, group in enumerate(groups.values()):
+                shapes = tuple(tuple(nodes[kc].shape) for kc in group)
+                sizes = tuple(_reduce(mul, shape, 1) for shape in shapes)
+                start = 0
+                for kc, shape, size in zip(group, shapes, sizes):
+                    positions[kc] = (i, start, start + size, shape)
+                    start += size
+                layout_groups.append((tuple(group), shapes, sizes))
+            layout = _PackedLayout(
+                tuple(
+                    (tuple(kc.split("/")),) + positions.get(kc, (None,) * 4)
+                    for kc in key_chains
+                ),
+                tuple(layout_groups),
+            )
+        else:
+            like_packed = like._cont_get_packed()
+            if like_packed is None:
+                raise ivy.utils.exceptions.IvyException(
+                    "the container to pack like isn't packed"
+                )
+            layout = like_packed[0]
+            packed = self._cont_get_packed()
+            if packed is not None and packed[0] == layout:
+                return self
+            if len(leaf_key_chains) != sum(len(g[0]) for g in layout.groups):
+                raise ivy.utils.exceptions.IvyException(
+                    "the container doesn't have the same leaves as the container to "
+                    "pack like"
+                )
+        buffers = list()
+        for group, shapes, _ in layout.groups:
+            try:
+                leaves = [nodes[kc] for kc in group]
+            except KeyError as e:
+                raise ivy.utils.exceptions.IvyException(
+                    "the container doesn't have the key-chain {} of the container to "
+                    "pack like".format(e)
+                )
+            leaves = [x.data if isinstance(x, ivy.Array) else x for x in leaves]
+            if any(
+                tuple(x.shape) != shape or x.dtype != leaves[0].dtype
+                for x, shape in zip(leaves, shapes)
+            ):
+                raise ivy.utils.exceptions.IvyException(
+                    "the arrays to pack into a buffer must have the same dtype and "
+                    "the shapes of the container to pack like"
+                )
+            reshape = ivy.current_backend(leaves[0]).reshape
+            buffers.append(ivy.concat([reshape(x, (-1,)) for x in leaves]))
+        return self._cont_from_packed(layout, buffers)
+
+    def _cont_from_packed(self, layout, buffers):
+        backend = ivy.current_backend(buffers[0]) if buffers else None
+        natives = [ivy.to_native(x) for x in buffers]
+        ret = ivy.Container(dict(), **self._config)
+        # the sub-containers take the attributes of the new root rather than being
+        # built from dicts, which takes far longer than creating the views
+        container_class = type(ret)
+        attributes = dict(ret.__dict__)
+
+        def _new_container():
+            cont = container_class.__new__(container_class)
+            cont.__dict__.update(attributes)
+            cont._config = dict(ret._config)
+            return cont
+
+        views = list()
+        for keys, i, start, stop, shape in layout.leaves:
+            cont = ret
+            for key in keys[:-1]:
+                sub_cont = dict.get(cont, key)
+                if sub_cont is None:
+                    sub_cont = _new_container()
+                    dict.__setitem__(cont, key, sub_cont)
+                cont = sub_cont
+            if i is None:
+                value = _new_container()
+            else:
+                view = backend.reshape(natives[i][start:stop], shape)
+                value = ivy.Array(view)
+                views.append((value, view))
+            dict.__setitem__(cont, keys[-1], value)
+        # the sub-containers are indexed to drop the packing once any is changed
+        ret._cont_key_chain_index()
+        ret._packed = (layout, tuple(buffers), tuple(views))
+        return ret
+
+    def _cont_get_packed(self):
+        # the packing of the container, dropped once the data of any leaf has been
+        # replaced, as ivy.inplace_update does on the backends without views, so that
+        # the buffers would no longer hold the values of the leaves
+        packed = self._packed
+        if packed is not None and any(x.data is not view for x, view in packed[2]):
+            self._packed = packed = None
+        return packed
+
+    def cont_from_packed_buffers(self, buffers):
+        """
+        Return a packed container with the same layout as this packed container, but
+        with its leaves being views into the given flat buffers.
+
+        Parameters
+        ----------
+        buffers
+            the flat buffers, one for each buffer of the container, with the same
+            sizes as them.
+
+        Returns
+        -------
+        ret
+            the packed container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3.])).cont_pack()
+        >>> y = x.cont_from_packed_buffers([ivy.array([4., 5., 6.])])
+        >>> print(y.b)
+        ivy.array([6.])
+        """
+        packed = self._cont_get_packed()
+        if packed is None:
+            raise ivy.utils.exceptions.IvyException("the container isn't packed")
+        layout, own_buffers, _ = packed
+        buffers = [x if isinstance(x, ivy.Array) else ivy.Array(x) for x in buffers]
+        if len(buffers) != len(own_buffers) or any(
+            tuple(x.shape) != tuple(y.shape) for x, y in zip(buffers, own_buffers)
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "the buffers must have the same sizes as those of the container"
+            )
+        return self._cont_from_packed(layout, buffers)
+
+    def _cont_packed_op(self, fn, *others):
+        # apply fn to the buffers of the packed container and of the others, which
+        # are either containers packed alike or scalars, returning None if it can't be
+        packed = self._cont_get_packed()
+        if packed is None:
+            return None
+        layout, buffers, _ = packed
+        args = list()
+        for other in others:
+            if isinstance(other, ivy.Container):
+                other_packed = other._cont_get_packed()
+                if other_packed is None or other_packed[0] != layout:
+                    return None
+                args.append(other_packed[1])
+            elif isinstance(other, (bool, int, float, complex)) or (
+                ivy.is_array(other) and len(other.shape) == 0
+            ):
+                args.append([other] * len(buffers))
+            else:
+                return None
+        return self._cont_from_packed(layout, [fn(*xs) for xs in zip(buffers, *args)])
+
     def cont_has_key(self, query_key):
         """
         Determine whether container object has specified key somewhere in the nested
@@ -2338,6 +2962,9 @@ class ContainerBase(dict, abc.ABC):
         ret
             Boolean
         """
+        index = self._key_chain_index
+        if index and key_chain.replace(".", "/") in index[0]:
+            return True
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2601,6 +3228,11 @@ class ContainerBase(dict, abc.ABC):
         ret
             sub-container or value at specified key chain
         """
+        if self._key_chain_index:
+            nodes = self._key_chain_index[0]
+            key_chain = key_chain.replace(".", "/")
+            if key_chain in nodes:
+                return nodes[key_chain]
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2659,6 +3291,9 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
+        index = self._cont_key_chain_index()
+        if index:
+            return list(index[2] if include_empty else index[1])
         return [kc for kc, v in self.cont_to_iterator(include_empty=include_empty)]
 
     def cont_key_chains_containing(self, sub_str, include_empty=False):
@@ -4180,8 +4815,33 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            self._cont_invalidate_key_chain_index()
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_invalidate_key_chain_index()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._cont_invalidate_key_chain_index()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.popitem(self)
+
+    def setdefault(self, *args):
+        self._cont_invalidate_key_chain_index()
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_key_chain_index()
+        return dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.clear(self)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4211,6 +4871,9 @@ class ContainerBase(dict, abc.ABC):
             else None
         )
         state_dict["_config"] = config
+        state_dict.pop("_key_chain_index", None)
+        state_dict.pop("_key_chain_index_owners", None)
+        state_dict.pop("_packed", None)
         return state_dict
 
     def __setstate__(self, state_dict):
@@ -4311,6 +4974,46 @@ class ContainerBase(dict, abc.ABC):
     def cont_config(self):
         return self._config
 
+    @property
+    def cont_is_packed(self):
+        """Whether the container is packed into flat buffers."""
+        return self._cont_get_packed() is not None
+
+    @property
+    def cont_packed_buffers(self):
+        """
+        The flat buffers of the packed container, one for each dtype and device.
+
+        None is returned if the container isn't packed.
+        """
+        packed = self._cont_get_packed()
+        return None if packed is None else packed[1]
+
+    @property
+    def cont_packed_segment_ids(self):
+        """
+        The index of the leaf which each element of the flat buffers of the packed
+        container belongs to, along with the number of leaves, for each buffer.
+
+        None is returned if the container isn't packed.
+        """
+        packed = self._cont_get_packed()
+        if packed is None:
+            return None
+        layout, buffers, _ = packed
+        if layout.segment_ids is None:
+            layout.segment_ids = tuple(
+                (
+                    ivy.repeat(
+                        ivy.arange(len(sizes), dtype=ivy.int64, device=ivy.dev(x)),
+                        list(sizes),
+                    ),
+                    len(sizes),
+                )
+                for x, (_, _, sizes) in zip(buffers, layout.groups)
+            )
+        return layout.segment_ids
+
     @property
     def cont_max_depth(self):
         kcs = [kc for kc in self.cont_to_iterator_keys(include_empty=True)]
@@ -138,6 +138,9 @@ class Container(
         return self
 
     def __neg__(self):
+        packed = self._cont_packed_op(operator.neg)
+        if packed is not None:
+            return packed
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
     def __pow__(self, power):
@@ -179,6 +182,9 @@ class Container(
             b: ivy.array([11.52153397, 30.13532257])
         }
         """
+        packed = self._cont_packed_op(operator.pow, power)
+        if packed is not None:
+            return packed
         if isinstance(power, ivy.Container):
             return ivy.Container.cont_multi_map(
                 lambda xs, _: operator.pow(xs[0], xs[1]), [self, power], map_nests=True
@@ -186,6 +192,9 @@ class Container(
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
     def __rpow__(self, power):
+        packed = self._cont_packed_op(lambda x, y: operator.pow(y, x), power)
+        if packed is not None:
+            return packed
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
     def __ipow__(self, power):
@@ -256,6 +265,9 @@ class Container(
                           [8.1, 9.3, 3.4]])
         }
         """
+        packed = self._cont_packed_op(operator.add, other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
@@ -290,6 +302,9 @@ class Container(
             b: 5
         }
         """
+        packed = self._cont_packed_op(lambda x, y: operator.add(y, x), other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.add(xs[0], xs[1]), [other, self], map_nests=True
         )
@@ -360,6 +375,9 @@ class Container(
                           [5.9, 4.7, 10.6]])
         }
         """
+        packed = self._cont_packed_op(operator.sub, other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.sub(xs[0], xs[1]), [self, other], map_nests=True
         )
@@ -399,16 +417,25 @@ class Container(
             b: -3
         }
         """
+        packed = self._cont_packed_op(lambda x, y: operator.sub(y, x), other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
     def __mul__(self, other):
+        packed = self._cont_packed_op(operator.mul, other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
     def __rmul__(self, other):
+        packed = self._cont_packed_op(lambda x, y: operator.mul(y, x), other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
         )
@@ -497,11 +524,17 @@ class Container(
             b: ivy.array([0.66666669, 0.60000002, 0.5])
         }
         """
+        packed = self._cont_packed_op(operator.truediv, other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
     def __rtruediv__(self, other):
+        packed = self._cont_packed_op(lambda x, y: operator.truediv(y, x), other)
+        if packed is not None:
+            return packed
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
         )
@@ -595,6 +628,9 @@ class Container(
             b: ivy.array([1, 0, 5])
         }
         """
+        packed = self._cont_packed_op(operator.abs)
+        if packed is not None:
+            return packed
         return self.cont_map(lambda x, kc: operator.abs(x), map_sequences=True)
 
     def __lt__(self, other):
@@ -768,7 +768,7 @@ class _ContainerWithLayers(ContainerBase):
         value: Union[ivy.Array, ivy.NativeArray, ivy.Container],
         /,
         *,
-        scale: Union[float, ivy.Container],
+        scale: Optional[Union[float, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         dropout_p: Optional[float] = 0.0,
         is_causal: Optional[bool] = False,
@@ -891,7 +891,7 @@ class _ContainerWithLayers(ContainerBase):
         value: Union[ivy.Array, ivy.NativeArray, ivy.Container],
         /,
         *,
-        scale: Union[float, ivy.Container],
+        scale: Optional[Union[float, ivy.Container]] = None,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         dropout_p: Optional[float] = 0.0,
         is_causal: Optional[bool] = False,
@@ -9,8 +9,9 @@ from types import FunctionType
 from typing import Callable, Literal
 import inspect
 import numpy as np
+from collections import UserDict
 
-from ivy.utils.exceptions import IvyValueError
+from ivy.utils.exceptions import IvyValueError, handle_exceptions
 
 
 # for wrapping (sequence matters)
@@ -268,6 +269,31 @@ def _build_view(original, view, fn, args, kwargs, index=None):
 _torch_non_native_view_functions = ("flip", "flipud", "rot90", "fliplr")
 
 
+def _views_from_ret(ret, fn_name, args, kwargs):
+    if ("copy" in kwargs and kwargs["copy"]) or not ivy.is_ivy_array(args[0]):
+        return ret
+    original = args[0]
+    if isinstance(ret, (list, tuple)):
+        for i, view in enumerate(ret):
+            ret[i] = _build_view(original, view, fn_name, args, kwargs, i)
+    else:
+        ret = _build_view(original, ret, fn_name, args, kwargs, None)
+    return ret
+
+
+def _indexing_view_from_ret(ret, args, kwargs):
+    if ("copy" in kwargs and kwargs["copy"]) or not ivy.is_ivy_array(args[0]):
+        return ret
+    query = kwargs["query"] if "query" in kwargs else args[1]
+    query = query if isinstance(query, tuple) else (query,)
+    if [i for i in query if not isinstance(i, (slice, int))]:
+        return ret
+    original = args[0]
+    # ToDo: Remove hard coding of only function with this wrapper
+    #  Need general way to convert special method to function found in ivy.__dict__
+    return _build_view(original, ret, "get_item", args, kwargs)
+
+
 def _check_in_nested_sequence(sequence, value=None, _type=None):
     """
     Check `sequence` for either a `value` or a value of type `_type`.
@@ -305,10 +331,135 @@ def _get_preferred_device(args, kwargs):
     return ivy.default_device(as_native=True)
 
 
+# maximum number of argument signatures remembered by each conversion wrapper
+_conversion_cache_size = 64
+
+# marks a signature whose conversion can't be replayed from index chains
+_unplannable = object()
+
+
+def _nest_signature(x, derived_tuple=False):
+    """
+    Summarise the nesting structure of `x` together with the types of its leaves.
+
+    Two nests with the same signature are traversed by `ivy.nested_map` in exactly the
+    same way, so the positions of the leaves to be converted can be reused between them.
+    """
+    t = type(x)
+    if t is tuple or t is list or (derived_tuple and isinstance(x, tuple)):
+        return (t, *[_nest_signature(v, derived_tuple) for v in x])
+    if t is dict:
+        return (t, *[(k, _nest_signature(v, derived_tuple)) for k, v in x.items()])
+    if t is slice:
+        return (t, type(x.start), type(x.stop), type(x.step))
+    return t
+
+
+def _conversion_plan(signature, leaf_fn):
+    """
+    Build the tree of index chains to the leaves described by `signature` for which
+    `leaf_fn` returns ``True``.
+
+    Returns ``None`` when no leaf needs converting, ``True`` when the nest itself is a
+    leaf to be converted, and ``_unplannable`` for structures which `ivy.nested_map`
+    treats specially (slices holding arrays, user dicts).
+    """
+    if not isinstance(signature, tuple):
+        if issubclass(signature, UserDict):
+            return _unplannable
+        return True if leaf_fn(signature) else None
+    t, *children = signature
+    if t is slice:
+        return None if all(c in _passthrough_types for c in children) else _unplannable
+    if t is dict:
+        children = dict(children)
+    else:
+        children = dict(enumerate(children))
+    plan = dict()
+    for idx, child in children.items():
+        child_plan = _conversion_plan(child, leaf_fn)
+        if child_plan is _unplannable:
+            return _unplannable
+        if child_plan is not None:
+            plan[idx] = child_plan
+    return plan or None
+
+
+def _apply_conversion_plan(x, plan, convert_fn):
+    """Convert the leaves of `x` along `plan`, copying only the nests on the way."""
+    if plan is True:
+        return convert_fn(x)
+    t = type(x)
+    if t is dict:
+        x = dict(x)
+        for k, child_plan in plan.items():
+            x[k] = _apply_conversion_plan(x[k], child_plan, convert_fn)
+        return x
+    items = list(x)
+    for i, child_plan in plan.items():
+        items[i] = _apply_conversion_plan(items[i], child_plan, convert_fn)
+    if t is list:
+        return items
+    if hasattr(x, "_fields"):
+        return t(*items)
+    return t(items)
+
+
+def _is_ivy_convertible_type(t):
+    return t not in _passthrough_types and not issubclass(t, ivy.Array)
+
+
+def _is_native_convertible_type(t):
+    return issubclass(t, (ivy.Array, ivy.Container)) or t is ivy.Shape
+
+
+def _leaf_to_native(x):
+    return x.data if isinstance(x, ivy.Array) else ivy.arr_conversions._to_native(x)
+
+
+def _leaf_to_ivy(x):
+    return ivy.arr_conversions._to_ivy(x)
+
+
+def _cached_nest_converter(convert_fn, leaf_fn, fallback_fn, derived_tuple=False):
+    """
+    Create a converter which applies `convert_fn` to the leaves of a nest for which
+    `leaf_fn` returns ``True`` when given their type.
+
+    The positions of these leaves are learnt once per nest signature and replayed on
+    later calls, such that only the leaves which need converting are visited.
+    Structures which can't be replayed are passed on to `fallback_fn`.
+    """
+    plans = dict()
+
+    def _convert(x):
+        signature = _nest_signature(x, derived_tuple)
+        try:
+            plan = plans[signature]
+        except KeyError:
+            if len(plans) >= _conversion_cache_size:
+                plans.clear()
+            plan = plans[signature] = _conversion_plan(signature, leaf_fn)
+        if plan is None:
+            return x
+        if plan is _unplannable:
+            return fallback_fn(x)
+        return _apply_conversion_plan(x, plan, convert_fn)
+
+    _convert.plans = plans
+    return _convert
+
+
 # Array Handling #
 # ---------------#
 
 
+def _is_packed_container(x):
+    # packed containers are passed on as they are, to keep their leaves as views,
+    # and the leaves are all ivy arrays
+    return isinstance(x, ivy.Container) and x.cont_is_packed
+
+
 def handle_array_function(fn):
     """
     Wrap a function `fn` to be passed to array_function method.
@@ -340,7 +491,7 @@ def handle_array_function(fn):
                                     index = i
                                     break
                             overloaded_args.insert(index, arg)
-                elif isinstance(arg, ivy.Container):
+                elif isinstance(arg, ivy.Container) and not _is_packed_container(arg):
                     arg = ivy.Container.cont_flatten_key_chains(arg)
                     indices = ivy.nested_argwhere(
                         arg, lambda x: hasattr(x, "__ivy_array_function__")
@@ -374,6 +525,18 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _is_array_like_parameter(parameter, annotation):
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
@@ -391,26 +554,18 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
         for i, (annotation, parameter, arg) in enumerate(
             zip(annotations, parameters, args)
         ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
+            if _is_array_like_parameter(parameter, annotation):
                 if i < num_args:
                     # Fix for ellipsis, slices for numpy's __getitem__
                     # No need to try and convert them into arrays
                     # since asarray throws unpredictable bugs
                     if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
                         continue
-                    if not ivy.is_array(arg):
+                    if not ivy.is_array(arg) and not _is_packed_container(arg):
                         args[i] = ivy.array(arg, device=device)
                 elif parameters in kwargs:
                     kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
+                    if not ivy.is_array(kwarg) and not _is_packed_container(kwarg):
                         kwargs[parameter] = ivy.array(kwarg, device=device)
 
         return fn(*args, **kwargs)
@@ -449,12 +604,17 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
             del kwargs["out"]
             has_out = True
         # convert all arrays in the inputs to ivy.NativeArray instances
-        new_args, new_kwargs = ivy.args_to_native(*args, **kwargs)
+        new_args, new_kwargs = _args_to_native((args, kwargs))
         # add the original out argument back to the keyword arguments
         if has_out:
             new_kwargs["out"] = out
         return fn(*new_args, **new_kwargs)
 
+    _args_to_native = _cached_nest_converter(
+        _leaf_to_native,
+        _is_native_convertible_type,
+        lambda x: ivy.args_to_native(*x[0], **x[1]),
+    )
     _inputs_to_native_arrays.inputs_to_native_arrays = True
     return _inputs_to_native_arrays
 
@@ -491,13 +651,17 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
             out = kwargs["out"]
             has_out = True
         # convert all arrays in the inputs to ivy.Array instances
-        ivy_args, ivy_kwargs = ivy.args_to_ivy(
-            *args, **kwargs, include_derived={"tuple": True}
-        )
+        ivy_args, ivy_kwargs = _args_to_ivy((args, kwargs))
         if has_out:
             ivy_kwargs["out"] = out
         return fn(*ivy_args, **ivy_kwargs)
 
+    _args_to_ivy = _cached_nest_converter(
+        _leaf_to_ivy,
+        _is_ivy_convertible_type,
+        lambda x: ivy.args_to_ivy(*x[0], **x[1], include_derived={"tuple": True}),
+        derived_tuple=True,
+    )
     _inputs_to_ivy_arrays.inputs_to_ivy_arrays = True
     return _inputs_to_ivy_arrays
 
@@ -561,12 +725,14 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         # call unmodified function
         ret = fn(*args, **kwargs)
         # convert all arrays in the return to `ivy.Array` instances
-        return (
-            ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
-            if ivy.array_mode
-            else ret
-        )
+        return _ret_to_ivy(ret) if ivy.array_mode else ret
 
+    _ret_to_ivy = _cached_nest_converter(
+        _leaf_to_ivy,
+        _is_ivy_convertible_type,
+        lambda x: ivy.to_ivy(x, nested=True, include_derived={"tuple": True}),
+        derived_tuple=True,
+    )
     _outputs_to_ivy_arrays.outputs_to_ivy_arrays = True
     return _outputs_to_ivy_arrays
 
@@ -659,15 +825,7 @@ def handle_view(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_view(*args, **kwargs):
         ret = fn(*args, **kwargs)
-        if ("copy" in kwargs and kwargs["copy"]) or not ivy.is_ivy_array(args[0]):
-            return ret
-        original = args[0]
-        if isinstance(ret, (list, tuple)):
-            for i, view in enumerate(ret):
-                ret[i] = _build_view(original, view, fn.__name__, args, kwargs, i)
-        else:
-            ret = _build_view(original, ret, fn.__name__, args, kwargs, None)
-        return ret
+        return _views_from_ret(ret, fn.__name__, args, kwargs)
 
     _handle_view.handle_view = True
     return _handle_view
@@ -692,17 +850,7 @@ def handle_view_indexing(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_view_indexing(*args, **kwargs):
         ret = fn(*args, **kwargs)
-        if ("copy" in kwargs and kwargs["copy"]) or not ivy.is_ivy_array(args[0]):
-            return ret
-        query = kwargs["query"] if "query" in kwargs else args[1]
-        query = query if isinstance(query, tuple) else (query,)
-        if [i for i in query if not isinstance(i, (slice, int))]:
-            return ret
-        original = args[0]
-        # ToDo: Remove hard coding of only function with this wrapper
-        #  Need general way to convert special method to function found in ivy.__dict__
-        ret = _build_view(original, ret, "get_item", args, kwargs)
-        return ret
+        return _indexing_view_from_ret(ret, args, kwargs)
 
     _handle_view_indexing.handle_view_indexing = True
     return _handle_view_indexing
@@ -924,8 +1072,37 @@ def _update_torch_references(x, visited_view=None):
 # ------------------#
 
 
+def _has_containers(nest):
+    """
+    Check whether any item of `nest` is or contains a container, only recursing into
+    the items which are themselves lists, tuples or dicts.
+    """
+    for x in nest:
+        # `issubclass` on the type skips the `__class__` lookup which `isinstance`
+        # does through the python level `__getattribute__` of ivy arrays
+        cls = type(x)
+        if issubclass(cls, ivy.Container):
+            return True
+        if issubclass(cls, dict):
+            if _has_containers(x.values()):
+                return True
+        elif issubclass(cls, (list, tuple)) and _has_containers(x):
+            return True
+    return False
+
+
+def _container_fn(fn):
+    """Get the container's version of `fn`, mapping `fn` to the leaves if none."""
+    static_fn = getattr(ivy.Container, f"_static_{fn.__name__}", None)
+    if static_fn is not None:
+        return static_fn
+    return functools.partial(ivy.Container.cont_multi_map_in_function, fn)
+
+
 def handle_nestable(fn: Callable) -> Callable:
-    fn_name = fn.__name__
+    # the container's version of the function is resolved once, unless the
+    # container class isn't defined yet, in which case it's resolved on first use
+    cont_fn = _container_fn(fn) if hasattr(ivy, "Container") else None
 
     @functools.wraps(fn)
     def _handle_nestable(*args, **kwargs):
@@ -946,19 +1123,15 @@ def handle_nestable(fn: Callable) -> Callable:
         -------
             The return of the function, with the nestable property handled correctly.
         """
+        nonlocal cont_fn
         # if any of the arguments or keyword arguments passed to the function contains
-        # a container, get the container's version of the function and call it using
-        # the passed arguments.
-        if hasattr(ivy.Container, f"_static_{fn_name}"):
-            cont_fn = getattr(ivy.Container, f"_static_{fn_name}")
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
+        # a container, call the container's version of the function using the passed
+        # arguments.
         if ivy.nestable_mode and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            _has_containers(args) or _has_containers(kwargs.values())
         ):
+            if cont_fn is None:
+                cont_fn = _container_fn(fn)
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -1028,6 +1201,226 @@ def handle_partial_mixed_function(fn) -> Callable:
     return _handle_partial_mixed_function
 
 
+# Wrapper Composition #
+# --------------------#
+
+# the name of the wrapper function created by each of the FN_DECORATORS
+_wrapper_names = {f"_{attr}": attr for attr in FN_DECORATORS}
+_wrapper_names["_output_to_native_arrays"] = "outputs_to_native_arrays"
+
+# wrappers which are left in place, along with all the wrappers below them
+_non_composable_wrappers = ("handle_partial_mixed_function", "handle_complex_input")
+
+# leaf types which none of the wrappers act upon
+_passthrough_types = {bool, int, float, complex, str, slice, type(None), type(...)}
+
+# returned by the composed wrapper when the call needs the full wrapper chain
+_use_wrapper_chain = object()
+
+
+def _get_composable_wrappers(fn):
+    wrappers = dict()
+    idx = len(FN_DECORATORS)
+    while hasattr(fn, "__wrapped__") and hasattr(fn, "__code__"):
+        attr = _wrapper_names.get(fn.__code__.co_name)
+        if attr is None or attr in _non_composable_wrappers:
+            break
+        # only wrappers applied in the order used by _wrap_function are composed
+        attr_idx = FN_DECORATORS.index(attr)
+        if attr_idx >= idx:
+            break
+        wrappers[attr] = fn
+        idx = attr_idx
+        fn = fn.__wrapped__
+    return wrappers, fn
+
+
+def _array_like_positions(fn):
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    return tuple(
+        i
+        for i, (parameter, param) in enumerate(type_hints.items())
+        if _is_array_like_parameter(parameter, param.annotation)
+    )
+
+
+def _compose_wrappers(fn: Callable) -> Callable:
+    """
+    Compose the chain of wrappers around `fn` into a single wrapper.
+
+    Each wrapper applied by `_wrap_function` runs in its own frame and walks the
+    arguments again. The composed wrapper walks the top level of the arguments
+    once, does the work of all the wrappers in that one pass and skips the ones
+    which have nothing to do for the call. Calls which need more than a single
+    top level pass, such as ones with nested or container arguments, an `out`
+    argument or an active nan policy, are handed over to the original chain.
+
+    Parameters
+    ----------
+    fn
+        the fully wrapped function.
+
+    Returns
+    -------
+    ret
+        the composed wrapper, or `fn` itself if there is nothing to compose.
+    """
+    wrappers, inner_fn = _get_composable_wrappers(fn)
+    # a lone exception handler is already a single cheap frame
+    if set(wrappers).issubset({"handle_exceptions"}):
+        return fn
+    check_nans = "handle_nans" in wrappers
+    check_backend = "handle_backend_invalid" in wrappers
+    handle_out = "handle_out_argument" in wrappers
+    to_ivy = "inputs_to_ivy_arrays" in wrappers
+    to_native = "inputs_to_native_arrays" in wrappers
+    to_native_shapes = (
+        "inputs_to_native_shapes" in wrappers or "outputs_to_ivy_shapes" in wrappers
+    )
+    ret_to_ivy = "outputs_to_ivy_arrays" in wrappers
+    ret_to_native = "outputs_to_native_arrays" in wrappers
+    infer = "infer_dtype" in wrappers
+    handle_dev = "handle_device" in wrappers
+    view = "handle_view" in wrappers
+    view_indexing = "handle_view_indexing" in wrappers
+    array_like_positions = (
+        _array_like_positions(
+            wrappers["handle_array_like_without_promotion"].__wrapped__
+        )
+        if "handle_array_like_without_promotion" in wrappers
+        else ()
+    )
+
+    def _convert(x, is_native):
+        if type(x) in _passthrough_types:
+            return x
+        if isinstance(x, ivy.Array):
+            if check_backend and _mixed_backend_arrays:
+                _check_array_backend(x)
+            return x.data if to_native else x
+        if is_native(x) or isinstance(x, np.ndarray):
+            return ivy.Array(x) if to_ivy and not to_native else x
+        if isinstance(x, (list, tuple)):
+            if all(type(v) in _passthrough_types for v in x):
+                return x
+            return _use_wrapper_chain
+        if isinstance(x, (dict, ivy.NestedArray)) or hasattr(
+            x, "__ivy_array_function__"
+        ):
+            return _use_wrapper_chain
+        if isinstance(x, ivy.Shape):
+            if to_native_shapes or (to_native and type(x) is ivy.Shape):
+                return x.shape
+        elif to_ivy and isinstance(x, ivy.NativeShape):
+            return ivy.Shape(x)
+        return x
+
+    @functools.wraps(fn)
+    def _composed_call(*args, **kwargs):
+        if not ivy.array_mode or (check_nans and ivy.nan_policy != "nothing"):
+            return _use_wrapper_chain
+        is_native = ivy.current_backend().is_native_array
+        for i in array_like_positions:
+            if i < len(args):
+                arg = args[i]
+                if not (
+                    isinstance(arg, ivy.Array)
+                    or is_native(arg)
+                    or _check_in_nested_sequence(arg, value=Ellipsis, _type=slice)
+                ):
+                    return _use_wrapper_chain
+
+        # single pass over the arguments
+        new_args = []
+        for x in args:
+            x = _convert(x, is_native)
+            if x is _use_wrapper_chain:
+                return x
+            new_args.append(x)
+        new_kwargs = {}
+        for k, x in kwargs.items():
+            x = _convert(x, is_native)
+            if x is _use_wrapper_chain:
+                return x
+            new_kwargs[k] = x
+        if handle_out:
+            new_kwargs["out"] = None
+
+        if infer:
+            dtype = new_kwargs.pop("dtype", None)
+            arr = None
+            if not ivy.exists(dtype):
+                arr = next(
+                    (
+                        x
+                        for x in (*new_args, *new_kwargs.values())
+                        if isinstance(x, ivy.Array) or is_native(x)
+                    ),
+                    None,
+                )
+            dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+            ivy.utils.assertions._check_jax_x64_flag(dtype)
+            new_kwargs["dtype"] = dtype
+
+        if handle_dev:
+            dev = None
+            if new_kwargs.get("device") is not None:
+                dev = ivy.as_native_dev(new_kwargs["device"])
+            if not ivy.soft_device_mode:
+                devices = set(
+                    ivy.dev(x)
+                    for x in (*new_args, *new_kwargs.values())
+                    if is_native(x)
+                )
+                if len(devices) > 1:
+                    return _use_wrapper_chain
+                if dev is None and devices:
+                    dev = next(iter(devices))
+            with ivy.DefaultDevice(ivy.default_device(dev)):
+                ret = ivy.handle_soft_device_variable(
+                    *new_args, fn=inner_fn, **new_kwargs
+                )
+        else:
+            ret = inner_fn(*new_args, **new_kwargs)
+
+        if ret_to_ivy:
+            ret = ivy.to_ivy(
+                ret,
+                nested=isinstance(ret, (list, tuple, dict)),
+                include_derived={"tuple": True},
+            )
+        if ret_to_native:
+            ret = ivy.to_native(
+                ret,
+                nested=isinstance(ret, (list, tuple, dict)),
+                include_derived={"tuple": True},
+            )
+        if view_indexing:
+            ret = _indexing_view_from_ret(ret, args, kwargs)
+        if view:
+            ret = _views_from_ret(
+                ret, wrappers["handle_view"].__wrapped__.__name__, args, kwargs
+            )
+        return ret
+
+    if "handle_exceptions" in wrappers:
+        _composed_call = handle_exceptions(_composed_call)
+
+    @functools.wraps(fn)
+    def _composed(*args, **kwargs):
+        if kwargs.get("out") is not None:
+            return fn(*args, **kwargs)
+        ret = _composed_call(*args, **kwargs)
+        if ret is _use_wrapper_chain:
+            return fn(*args, **kwargs)
+        return ret
+
+    return _composed
+
+
 # Functions #
 
 
@@ -1039,7 +1432,8 @@ def _wrap_function(
     `original` is also wrapped, and if `to_wrap` is not already wrapped. Attributes
     `handle_nestable` etc are set during wrapping, hence indicate to us whether a
     certain function has been wrapped or not. Also handles wrapping of the `linalg`
-    namespace.
+    namespace. If `ivy.compose_wrappers_mode` is set, the resulting chain of wrappers
+    is composed into a single wrapper.
 
     Parameters
     ----------
@@ -1122,27 +1516,56 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        # the mode is read from its stack, as the module attribute is restored
+        # from the original ivy dict while the backend is being set
+        if ivy.compose_wrappers_mode_stack and ivy.compose_wrappers_mode_stack[-1]:
+            to_wrap = _compose_wrappers(to_wrap)
     return to_wrap
 
 
+# the dtypes each function can't be called with once casting is enabled, resolved once
+# per (function, backend, backend version, device) and cleared whenever the backend is
+# set or unset
+_casting_unsupported_dtypes = {}
+
+
+def _clear_casting_unsupported_dtypes():
+    _casting_unsupported_dtypes.clear()
+
+
+def _resolve_casting_unsupported_dtypes(fn, device):
+    invalid_dtypes = set(ivy.invalid_dtypes)
+    # we first check if it has unsupported/supported dtypes uniquely added to it
+    intersect = set(ivy.function_unsupported_dtypes(fn)).difference(invalid_dtypes)
+    if not intersect:
+        # doesn't have unsupported dtypes specified
+        # so check if it's one of the device_and_dtype one
+        intersect = set(
+            ivy.function_unsupported_devices_and_dtypes(fn).get(device, ())
+        ).difference(invalid_dtypes)
+    return frozenset(intersect)
+
+
 def casting_modes_ops(fn):
     @functools.wraps(fn)
     def method(*args, **kwargs):
-        # we first check if it has unsupported/supported dtypes uniquely added to it
-        intersect = set(ivy.function_unsupported_dtypes(fn)).difference(
-            set(ivy.invalid_dtypes)
+        device = ivy.default_device().split(":")[0]
+        key = (
+            fn,
+            ivy.current_backend_str(),
+            ivy.backend_version.get("version"),
+            device,
         )
-        if not intersect:
-            # doesn't have unsupported dtypes specified
-            # so check if it's one of the device_and_dtype one
-            intersect = set(
-                ivy.function_unsupported_devices_and_dtypes(fn).get(
-                    ivy.default_device().split(":")[0], {None}
-                )
-            ).difference(set(ivy.invalid_dtypes))
-            if not intersect:
-                # no unsupported dtype specified
-                return fn(*args, **kwargs)
+        intersect = _casting_unsupported_dtypes.get(key)
+        if intersect is None:
+            intersect = _casting_unsupported_dtypes[key] = (
+                _resolve_casting_unsupported_dtypes(fn, device)
+            )
+        if not intersect or not (
+            ivy.upcast_dtypes or ivy.downcast_dtypes or ivy.crosscast_dtypes
+        ):
+            # no unsupported dtype specified, or no casting mode to cast them with
+            return fn(*args, **kwargs)
 
         if "dtype" in kwargs and kwargs["dtype"] is not None:
             dtype = caster(kwargs["dtype"], intersect)
@@ -1164,6 +1587,26 @@ def casting_modes_ops(fn):
     return method
 
 
+@functools.lru_cache(maxsize=None)
+def _version_tuple(version):
+    return tuple(map(int, version.split(".")))
+
+
+# Parses a version key such as "2.0.1 and below" into its kind and bounds, which is
+# only done once per key rather than every time a versioned attribute is read
+@functools.lru_cache(maxsize=None)
+def _version_range(key):
+    kl = key.split(" ")
+    k1 = _version_tuple(kl[0])
+    if "above" in key:
+        return "above", k1, None
+    if "below" in key:
+        return "below", k1, None
+    if "to" in key:
+        return "to", k1, _version_tuple(kl[2])
+    return None, k1, None
+
+
 # Gets dtype from a version dictionary
 def _dtype_from_version(dic, version):
     # if version is a string, it's a frontend function
@@ -1181,7 +1624,7 @@ def _dtype_from_version(dic, version):
     if version in dic:
         return dic[version]
 
-    version_tuple = tuple(map(int, version.split(".")))
+    version_tuple = _version_tuple(version)
 
     # If key is not in the dictionary, check if it's in any range
     # three formats are supported:
@@ -1189,13 +1632,12 @@ def _dtype_from_version(dic, version):
     # 2. x.y.z and below
     # 3. x.y.z to x.y.z
     for key in dic.keys():
-        kl = key.split(" ")
-        k1 = tuple(map(int, kl[0].split(".")))
-        if "above" in key and k1 <= version_tuple:
+        kind, k1, k2 = _version_range(key)
+        if kind == "above" and k1 <= version_tuple:
             return dic[key]
-        if "below" in key and k1 >= version_tuple:
+        if kind == "below" and k1 >= version_tuple:
             return dic[key]
-        if "to" in key and k1 <= version_tuple <= tuple(map(int, kl[2].split("."))):
+        if kind == "to" and k1 <= version_tuple <= k2:
             return dic[key]
 
     # if no version is found, we return empty tuple
@@ -1310,22 +1752,78 @@ def _dtype_device_wrapper_creator(attrib, t):
 # nans Handling #
 # --------------#
 
+# increased whenever `ivy.nan_check_interval` is set, restarting the count of the calls
+# of each function
+_nan_check_interval_generation = 0
+
 
-def _leaf_has_nans(x):
-    if isinstance(x, ivy.Container):
-        return x.has_nans()
-    elif ivy.is_array(x):
-        return ivy.isnan(x).any()
-    elif x == float("nan"):
+def _collect_nan_leaves(x, leaves, is_native):
+    """
+    Collect the native float and complex arrays of the nest `x` into `leaves`,
+    skipping the leaves which can't hold nans without dispatching any function.
+
+    Returns whether a python scalar of the nest is a nan, in which case the
+    collection stops as the nest is known to have nans.
+    """
+    if isinstance(x, (list, tuple)):
+        return any(_collect_nan_leaves(v, leaves, is_native) for v in x)
+    if isinstance(x, dict):
+        return any(_collect_nan_leaves(v, leaves, is_native) for v in x.values())
+    if isinstance(x, ivy.Array):
+        x = x.data
+    elif isinstance(x, (float, complex)):
+        # nan is the only value which isn't equal to itself
+        return x != x
+    dtype = getattr(x, "dtype", None)
+    if dtype is not None and is_native(x):
+        dtype = str(dtype)
+        if "float" in dtype or "complex" in dtype:
+            leaves.append(x)
+    return False
+
+
+def _nest_has_nans(*nests):
+    """
+    Check whether any of `nests` has nans, with the float arrays of each dtype and
+    device flattened into one, which is reduced once in the backend.
+    """
+    backend = ivy.current_backend()
+    leaves = []
+    if _collect_nan_leaves(nests, leaves, backend.is_native_array):
         return True
+    groups = dict()
+    for x in leaves:
+        key = (str(x.dtype), str(getattr(x, "device", None)))
+        groups.setdefault(key, []).append(backend.reshape(x, (-1,)))
+    for (dtype, _), group in groups.items():
+        x = group[0] if len(group) == 1 else backend.concat(group, axis=0)
+        if "complex" in dtype:
+            x = backend.concat([backend.real(x), backend.imag(x)], axis=0)
+        if bool(backend.any(backend.isnan(x))):
+            return True
     return False
 
 
-def _nest_has_nans(x):
-    return ivy.nested_any(x, _leaf_has_nans)
+def _skip_nan_check(calls):
+    """
+    Whether to skip the nan check of this call, as per `ivy.nan_check_interval`,
+    given the generation of the interval and the number of calls it was checked for
+    with the function.
+    """
+    interval = ivy.nan_check_interval
+    if interval == 1:
+        return False
+    if calls[0] != _nan_check_interval_generation:
+        calls[:] = [_nan_check_interval_generation, 0]
+    calls[1] += 1
+    return (calls[1] - 1) % interval != 0
 
 
 def handle_nans(fn: Callable) -> Callable:
+    # the calls of the function are counted on their own, so that the calls of other
+    # functions in between don't change which of its calls are checked
+    calls = [None, 0]
+
     @functools.wraps(fn)
     def _handle_nans(*args, **kwargs):
         """
@@ -1338,6 +1836,10 @@ def handle_nans(fn: Callable) -> Callable:
         warns: warns a user in case nans are present
         nothing: does nothing
 
+        Only every `ivy.nan_check_interval` call of the function is checked, and the
+        float arrays of `args` and `kwargs` of each dtype are checked at once by the
+        backend.
+
         Parameters
         ----------
         args
@@ -1352,11 +1854,11 @@ def handle_nans(fn: Callable) -> Callable:
         """
         nan_policy = ivy.nan_policy
         # skip the check if the current nan policy is `nothing``
-        if nan_policy == "nothing":
+        if nan_policy == "nothing" or _skip_nan_check(calls):
             return fn(*args, **kwargs)
 
         # check all args and kwards for presence of nans
-        result = _nest_has_nans(args) or _nest_has_nans(kwargs)
+        result = _nest_has_nans(args, kwargs)
 
         if result:
             # handle nans based on the selected policy
@@ -1509,6 +2011,99 @@ def handle_complex_input(fn: Callable) -> Callable:
     return _handle_complex_input
 
 
+# the generation of the backend, increased whenever the backend changes. Arrays record
+# the generation they were created in, so that the ones created since the last change
+# are known to belong to the current backend without inspecting their data
+_backend_generation = 0
+# the number of live arrays of each backend, "" standing for no backend set, along with
+# the weak references which count the arrays off once they're deleted
+_array_backends = dict()
+_array_refs = dict()
+# the current global backend, and whether any backend is set locally
+_current_backend = ""
+_local_backends = False
+# whether arrays of a backend other than the current one may exist, which is the only
+# case in which the arrays passed to the functions have their backend checked
+_mixed_backend_arrays = False
+
+
+def _update_mixed_backend_arrays():
+    global _mixed_backend_arrays
+    _mixed_backend_arrays = _local_backends or (
+        _current_backend != ""
+        and any(backend != _current_backend for backend in list(_array_backends))
+    )
+
+
+def _backend_changed(backend, local_backends):
+    """Record a change of the global backend or of the backends set locally."""
+    global _backend_generation, _current_backend, _local_backends
+    _backend_generation += 1
+    _current_backend = backend
+    _local_backends = local_backends
+    _update_mixed_backend_arrays()
+
+
+class _ArrayRef(weakref.ref):
+    __slots__ = ("backend",)
+
+
+def _count_off_array(backend):
+    count = _array_backends.get(backend, 0) - 1
+    if count > 0:
+        _array_backends[backend] = count
+    else:
+        _array_backends.pop(backend, None)
+        _update_mixed_backend_arrays()
+
+
+def _array_deleted(ref):
+    # the references are kept by id, as they hash as the arrays
+    if _array_refs.pop(id(ref), None) is ref:
+        _count_off_array(ref.backend)
+
+
+def _register_array(x, backend, old_ref=None):
+    """
+    Count an array as a live array of `backend` until it's deleted, in place of the
+    reference `old_ref` it was counted through before, returning the new reference.
+    """
+    if old_ref is not None and _array_refs.pop(id(old_ref), None) is old_ref:
+        _count_off_array(old_ref.backend)
+    ref = _ArrayRef(x, _array_deleted)
+    ref.backend = backend
+    _array_refs[id(ref)] = ref
+    count = _array_backends.get(backend, 0) + 1
+    _array_backends[backend] = count
+    if count == 1:
+        _update_mixed_backend_arrays()
+    return ref
+
+
+def _check_array_backend(x):
+    # arrays created since the last change of the backend belong to the current one,
+    # unless the backend can differ between threads
+    generation = getattr(x, "_backend_generation", None)
+    if generation == _backend_generation and not _local_backends:
+        return x
+    target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
+    if (
+        target_backend is not None
+        and ivy.backend != ""
+        and ivy.current_backend_str() != target_backend.backend
+    ):
+        raise ivy.utils.exceptions.IvyInvalidBackendException(
+            "Operation not allowed. Array was instantiated with backend"
+            f" {target_backend.backend}. But current backend is"
+            f" {ivy.backend}. Please set dynamic=True"
+            " for the array if you want to convert it to the target"
+            " backend"
+        )
+    if generation is not None and not _local_backends:
+        x._backend_generation = _backend_generation
+    return x
+
+
 def handle_backend_invalid(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_backend_invalid(*args, **kwargs):
@@ -1531,28 +2126,14 @@ def handle_backend_invalid(fn: Callable) -> Callable:
             backend matches the argument backend.
             If not, it raises an InvalidBackendException
         """
-        array_indices = ivy.nested_argwhere(
-            [args, kwargs], lambda x: isinstance(x, ivy.Array)
-        )
-        array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
-
-        def func(x):
-            target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
-            if (
-                target_backend is not None
-                and ivy.backend != ""
-                and ivy.current_backend_str() != target_backend.backend
-            ):
-                raise ivy.utils.exceptions.IvyInvalidBackendException(
-                    "Operation not allowed. Array was instantiated with backend"
-                    f" {target_backend.backend}. But current backend is"
-                    f" {ivy.backend}. Please set dynamic=True"
-                    " for the array if you want to convert it to the target"
-                    " backend"
-                )
-            return x
-
-        ivy.nested_map(func, array_vals, include_derived=True)
+        # the arrays can only belong to another backend if the backend has changed
+        # while arrays of the previous one were alive
+        if _mixed_backend_arrays:
+            array_indices = ivy.nested_argwhere(
+                [args, kwargs], lambda x: isinstance(x, ivy.Array)
+            )
+            array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
+            ivy.nested_map(_check_array_backend, array_vals, include_derived=True)
 
         return fn(*args, **kwargs)
 
@@ -455,3 +455,47 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    biases = [b for b in (bias, recurrent_bias) if b is not None]
+    dtype = jnp.result_type(x, init_h, init_c, kernel, recurrent_kernel, *biases)
+    out_channels = init_h.shape[-1]
+    # as sigmoid(x) = (tanh(x / 2) + 1) / 2, all the gates are activated by a single
+    # tanh per step once the kernels and biases of the sigmoid gates are halved
+    scale = jnp.full(4 * out_channels, 0.5, dtype=dtype)
+    scale = scale.at[2 * out_channels : 3 * out_channels].set(1)
+    Wh = recurrent_kernel.astype(dtype) * scale
+    # input kernel projections of all the timesteps at once, time major
+    Wi_x = jnp.matmul(jnp.moveaxis(x, -2, 0).astype(dtype), kernel * scale)
+    for b in biases:
+        Wi_x = Wi_x + b * scale
+
+    def _lstm_step(carry, Wi_xt):
+        ht, ct = carry
+        zt = jnp.tanh(Wi_xt + jnp.matmul(ht, Wh))
+        st = zt * 0.5 + 0.5
+        ct = (
+            st[..., out_channels : 2 * out_channels] * ct
+            + st[..., :out_channels] * zt[..., 2 * out_channels : 3 * out_channels]
+        )
+        ht = st[..., 3 * out_channels :] * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    (_, ct), hts = jlax.scan(
+        _lstm_step, (init_h.astype(dtype), init_c.astype(dtype)), Wi_x
+    )
+    return jnp.moveaxis(hts, 0, -2), ct
+
+
+lstm_update.partial_mixed_handler = lambda x, *args, **kwargs: "float" in str(x.dtype)
@@ -150,13 +150,10 @@ def unsorted_segment_sum(
         data, segment_ids, num_segments
     )
 
+    # the elements with negative segment ids are dropped, as in tensorflow
+    mask = segment_ids >= 0
     res = np.zeros((num_segments,) + data.shape[1:], dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.sum(data[mask_index], axis=0)
-
+    np.add.at(res, segment_ids[mask], data[mask])
     return res
 
 
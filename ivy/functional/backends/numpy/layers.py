@@ -550,3 +550,43 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    biases = [b for b in (bias, recurrent_bias) if b is not None]
+    dtype = np.result_type(x, init_h, init_c, kernel, recurrent_kernel, *biases)
+    out_channels = init_h.shape[-1]
+    # as sigmoid(x) = (tanh(x / 2) + 1) / 2, all the gates are activated by a single
+    # tanh per step once the kernels and biases of the sigmoid gates are halved
+    scale = np.full(4 * out_channels, 0.5, dtype=dtype)
+    scale[2 * out_channels : 3 * out_channels] = 1
+    Wh = recurrent_kernel * scale
+    # input kernel projections of all the timesteps at once, time major
+    Wi_x = np.matmul(np.moveaxis(x, -2, 0), kernel * scale).astype(dtype, copy=False)
+    for b in biases:
+        Wi_x += b * scale
+    hts = np.empty((x.shape[-2], *x.shape[:-2], out_channels), dtype=dtype)
+    ht = init_h
+    ct = init_c.astype(dtype, copy=False)
+    for t, Wi_xt in enumerate(Wi_x):
+        zt = np.tanh(Wi_xt + np.matmul(ht, Wh))
+        st = zt * 0.5 + 0.5
+        ct = (
+            st[..., out_channels : 2 * out_channels] * ct
+            + st[..., :out_channels] * zt[..., 2 * out_channels : 3 * out_channels]
+        )
+        ht = hts[t] = st[..., 3 * out_channels :] * np.tanh(ct)
+    return np.moveaxis(hts, 0, -2), ct
+
+
+lstm_update.partial_mixed_handler = lambda x, *args, **kwargs: "float" in str(x.dtype)
@@ -184,16 +184,12 @@ def unsorted_segment_sum(
         data, segment_ids, num_segments
     )
 
+    # the elements with negative segment ids are dropped, as in tensorflow
+    mask = segment_ids >= 0
     res = torch.zeros(
         (num_segments,) + data.shape[1:], dtype=data.dtype, device=data.device
     )
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if torch.any(mask_index):
-            res[i] = torch.sum(data[mask_index], dim=0)
-
-    return res
+    return res.index_add_(0, segment_ids[mask], data[mask])
 
 
 def trilu(
@@ -547,15 +547,77 @@ def conv_general_transpose(
 
 
 def scaled_dot_product_attention_v_2p0p0_and_above(
-    q,
-    k,
-    v,
-    scale: float,
+    query: torch.Tensor,
+    key: torch.Tensor,
+    value: torch.Tensor,
     /,
     *,
-    mask=None,
-    out=None,
-):
-    if isinstance(mask, torch.Tensor):
-        mask = torch.where(mask == 0, -torch.inf, 0)
-    return torch.nn.functional.scaled_dot_product_attention(q, k, v, attn_mask=mask)
+    scale: Optional[float] = None,
+    mask: Optional[torch.Tensor] = None,
+    dropout_p: Optional[float] = 0.0,
+    is_causal: Optional[bool] = False,
+    training: Optional[bool] = False,
+    out: Optional[torch.Tensor] = None,
+) -> torch.Tensor:
+    if scale:
+        # torch scales the similarities by 1 / sqrt(embed_dim)
+        query = query * (scale * query.shape[-1] ** 0.5)
+    if isinstance(mask, torch.Tensor) and mask.dtype != torch.bool:
+        mask = mask != 0
+    return torch.nn.functional.scaled_dot_product_attention(
+        query,
+        key,
+        value,
+        attn_mask=mask,
+        dropout_p=dropout_p if training else 0.0,
+        is_causal=is_causal,
+    )
+
+
+# ivy applies dropout to the similarities rather than to the attention weights
+scaled_dot_product_attention_v_2p0p0_and_above.partial_mixed_handler = (
+    lambda *args, dropout_p=0.0, training=False, **kwargs: not (training and dropout_p)
+)
+
+
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    dtype = x.dtype
+    for arg in (init_h, init_c, kernel, recurrent_kernel, bias, recurrent_bias):
+        if arg is not None:
+            dtype = torch.promote_types(dtype, arg.dtype)
+    batch_shape = x.shape[:-2]
+    # the fused lstm takes a single batch dimension and states stacked over layers
+    x = x.reshape(-1, *x.shape[-2:]).to(dtype)
+    hx = tuple(s.reshape(1, -1, s.shape[-1]).to(dtype) for s in (init_h, init_c))
+    # torch orders the gates like ivy, with the kernels transposed
+    params = [kernel.T.to(dtype), recurrent_kernel.T.to(dtype)]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            (
+                torch.zeros(kernel.shape[-1], dtype=dtype, device=x.device)
+                if b is None
+                else b.to(dtype)
+            )
+            for b in (bias, recurrent_bias)
+        ]
+    hts, _, c_n = torch.lstm(x, hx, params, has_biases, 1, 0.0, False, False, True)
+    return (
+        hts.reshape(*batch_shape, *hts.shape[-2:]),
+        c_n.reshape(*batch_shape, c_n.shape[-1]),
+    )
+
+
+lstm_update.partial_mixed_handler = lambda x, *args, **kwargs: ivy.as_ivy_dtype(
+    x.dtype
+) in ["float32", "float64"]
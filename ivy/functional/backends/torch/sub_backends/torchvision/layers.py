@@ -1,3 +1,4 @@
+from torchvision.ops import batched_nms as torch_batched_nms
 from torchvision.ops import nms as torch_nms
 import torch
 
@@ -35,3 +36,20 @@ def nms(
         ret = torch.tensor(nonzero[ret], dtype=torch.int64).flatten()
 
     return ret.flatten()[:max_output_size]
+
+
+def batched_nms(
+    boxes,
+    scores,
+    idxs,
+    /,
+    *,
+    iou_threshold=0.5,
+    max_output_size=None,
+    score_threshold=float("-inf"),
+):
+    nonzero = torch.nonzero(scores > score_threshold).flatten()
+    ret = torch_batched_nms(
+        boxes[nonzero], scores[nonzero], idxs[nonzero], iou_threshold
+    )
+    return nonzero[ret].to(torch.int64)[:max_output_size]
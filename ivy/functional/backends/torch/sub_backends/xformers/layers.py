@@ -8,12 +8,24 @@ def scaled_dot_product_attention(
     q,
     k,
     v,
-    scale: float,
     /,
     *,
+    scale=None,
     mask=None,
+    dropout_p=0.0,
+    is_causal=False,
+    training=False,
     out=None,
 ):
     if isinstance(mask, torch.Tensor):
         mask = torch.where(mask == 0, -torch.inf, 0)
-    return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
+    elif is_causal:
+        mask = xops.LowerTriangularMask()
+    return xops.memory_efficient_attention(
+        q,
+        k,
+        v,
+        attn_bias=mask,
+        p=dropout_p if training else 0.0,
+        scale=scale if scale else None,
+    )
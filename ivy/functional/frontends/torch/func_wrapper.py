@@ -1,10 +1,16 @@
 # global
 import functools
+import inspect
+import math
 from typing import Callable
 
 # local
 import ivy
 import ivy.functional.frontends.torch as torch_frontend
+from ivy.functional.ivy.data_type import (
+    default_float_dtype_stack,
+    default_int_dtype_stack,
+)
 
 
 numpy_compatible_args = {
@@ -16,6 +22,13 @@ numpy_compatible_args = {
     "x2": "other",
 }
 
+# the default int and float dtypes of the frontend for each backend and default
+# float dtype of the frontend, resolved once on their first use
+_frontend_default_dtypes = {}
+
+# the types of the arguments which are never arrays, such as shapes and scalars
+_non_array_types = (bool, int, float, complex, str, tuple, list, type(None))
+
 
 class AccumulateGrad:
     def __init__(self) -> None:
@@ -29,56 +42,57 @@ class AccumulateGrad:
         return self.__name__ == __value
 
     def __call__(self, grads):
-        for i in range(self.__self__.ndim):
-            grads = grads.sum(-1)
+        if self.__self__._grads is not None:
+            grads = self.__self__._grads + grads
         self.__self__._grads = grads
         return None
 
 
 class GradFn:
-    def __init__(self, fn, inputs) -> None:
-        self._inputs = []
-        self._fns = []
+    def __init__(self, fn, inputs, kwargs=None) -> None:
+        self._fn = fn
+        self._inputs = [
+            (
+                ivy.stop_gradient(i.ivy_array, preserve_type=False)
+                if isinstance(i, torch_frontend.Tensor)
+                else i
+            )
+            for i in inputs
+        ]
+        self._kwargs = kwargs if kwargs is not None else {}
+        # the indices of the inputs which the gradients are propagated to, aligned
+        # with the next functions
+        self._idxs = []
         self.next_functions = []
-        assert len(inputs) <= 2
-        if len(inputs) == 1 and isinstance(inputs[0], torch_frontend.Tensor):
-            self._inputs.append(inputs[0].detach())
-            d_fn = lambda x: fn(x)
-            self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-            if inputs[0].grad_fn is not None:
-                self.next_functions.append(inputs[0].grad_fn)
-            elif inputs[0].requires_grad and inputs[0].is_leaf:
+        for idx, input in enumerate(inputs):
+            if not isinstance(input, torch_frontend.Tensor):
+                continue
+            if input.grad_fn is not None:
+                self.next_functions.append(input.grad_fn)
+            elif input.requires_grad and input.is_leaf:
                 acc_grad = AccumulateGrad()
-                acc_grad.__self__ = inputs[0]
+                acc_grad.__self__ = input
                 self.next_functions.append(acc_grad)
-        elif len(inputs) == 2:
-            if isinstance(inputs[0], torch_frontend.Tensor):
-                self._inputs.append(inputs[0].detach())
-                d_fn = lambda x: fn(x, inputs[1])
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[0].grad_fn is not None:
-                    self.next_functions.append(inputs[0].grad_fn)
-                elif inputs[0].requires_grad and inputs[0].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[0]
-                    self.next_functions.append(acc_grad)
-            if isinstance(inputs[1], torch_frontend.Tensor):
-                self._inputs.append(inputs[1].detach())
-                d_fn = lambda x: fn(inputs[0], x)
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[1].grad_fn is not None:
-                    self.next_functions.append(inputs[1].grad_fn)
-                elif inputs[1].requires_grad and inputs[1].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[1]
-                    self.next_functions.append(acc_grad)
+            else:
+                continue
+            self._idxs.append(idx)
         self.__name__ = fn.__name__.capitalize() + "Backward"
 
     def __call__(self, prev_grads):
-        return [
-            jac_fn(input_tensor) * prev_grads
-            for input_tensor, jac_fn in zip(self._inputs, self._fns)
-        ]
+        prev_grads = _to_ivy_array(prev_grads)
+        ret = _to_ivy_array(self.__self__)
+        vjp_rule = _vjp_rules.get(self._fn.__name__, None)
+        grads = []
+        for idx in self._idxs:
+            if vjp_rule is not None:
+                grad = vjp_rule(prev_grads, self._inputs, self._kwargs, ret, idx)
+            else:
+                grad = _backend_vjp(
+                    self._fn, prev_grads, self._inputs, self._kwargs, idx
+                )
+            grad = _unbroadcast(grad, ivy.shape(self._inputs[idx]))
+            grads.append(_from_ivy_array_to_torch_frontend_tensor(grad))
+        return grads
 
     def __repr__(self):
         return self.__name__
@@ -91,6 +105,18 @@ class GradFn:
 # --------------- #
 
 
+def _backend_vjp(fn, grads, inputs, kwargs, idx):
+    # the vector-Jacobian product is the gradient of the sum of the outputs weighted
+    # by their gradients, computed with a single backward pass of the backend
+    def _weighted_sum(x):
+        args = list(inputs)
+        args[idx] = x
+        return ivy.sum(ivy.multiply(_to_ivy_array(fn(*args, **kwargs)), grads))
+
+    _, ret = ivy.execute_with_gradients(_weighted_sum, inputs[idx])
+    return ret if ret is not None else ivy.zeros_like(inputs[idx])
+
+
 def _from_ivy_array_to_torch_frontend_tensor(
     x, nested=False, include_derived=None, requires_grad=False
 ):
@@ -109,6 +135,45 @@ def _from_ivy_array_to_torch_frontend_tensor(
     return x
 
 
+@functools.lru_cache(maxsize=None)
+def _is_creation_op(fn_name):
+    # resolved on the first call, as the creation ops aren't all defined yet when
+    # the functions are wrapped
+    return fn_name in dir(torch_frontend.creation_ops)
+
+
+def _set_frontend_default_dtypes():
+    # push the default dtypes of the frontend, unless they are already the defaults
+    # of ivy, such as within the outermost creation function, returning whether
+    # they have been pushed
+    backend = ivy.current_backend_str()
+    key = (backend, torch_frontend.get_default_dtype())
+    if backend == "jax":
+        import jax
+
+        # checked on every call, as x64 can be turned off again after the dtypes
+        # are cached
+        if not jax.config.jax_enable_x64:
+            jax.config.update("jax_enable_x64", True)
+    dtypes = _frontend_default_dtypes.get(key, None)
+    if dtypes is None:
+        dtypes = _frontend_default_dtypes[key] = (
+            ivy.IntDtype("int64"),
+            ivy.FloatDtype(ivy.as_ivy_dtype(key[1])),
+        )
+    int_dtype, float_dtype = dtypes
+    if (
+        default_int_dtype_stack
+        and default_float_dtype_stack
+        and default_int_dtype_stack[-1] == int_dtype
+        and default_float_dtype_stack[-1] == float_dtype
+    ):
+        return False
+    default_int_dtype_stack.append(int_dtype)
+    default_float_dtype_stack.append(float_dtype)
+    return True
+
+
 def _to_ivy_array(x):
     # if x is a native array return it as an ivy array
     if isinstance(x, ivy.NativeArray):
@@ -122,6 +187,157 @@ def _to_ivy_array(x):
     return x
 
 
+def _unbroadcast(grads, shape):
+    # sum the gradients over the dimensions the input was broadcast along
+    shape = tuple(shape)
+    if tuple(grads.shape) == shape:
+        return grads
+    if grads.ndim > len(shape):
+        grads = ivy.sum(grads, axis=tuple(range(grads.ndim - len(shape))))
+    axes = tuple(i for i, dim in enumerate(shape) if dim == 1 and grads.shape[i] != 1)
+    if axes:
+        grads = ivy.sum(grads, axis=axes, keepdims=True)
+    return grads
+
+
+def _vjp_abs(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ivy.sign(inputs[0]))
+
+
+def _vjp_add(grads, inputs, kwargs, ret, idx):
+    return grads if idx == 0 else ivy.multiply(grads, kwargs.get("alpha", 1))
+
+
+def _vjp_cos(grads, inputs, kwargs, ret, idx):
+    return ivy.negative(ivy.multiply(grads, ivy.sin(inputs[0])))
+
+
+def _vjp_div(grads, inputs, kwargs, ret, idx):
+    if kwargs.get("rounding_mode", None) is not None:
+        return ivy.zeros_like(inputs[idx])
+    if idx == 0:
+        return ivy.divide(grads, inputs[1])
+    return ivy.negative(ivy.divide(ivy.multiply(grads, ret), inputs[1]))
+
+
+def _vjp_exp(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ret)
+
+
+def _vjp_log(grads, inputs, kwargs, ret, idx):
+    return ivy.divide(grads, inputs[0])
+
+
+def _vjp_matmul(grads, inputs, kwargs, ret, idx):
+    x, y = inputs
+    # vectors are promoted to matrices as in the forward pass
+    x_ = ivy.expand_dims(x, axis=0) if x.ndim == 1 else x
+    y_ = ivy.expand_dims(y, axis=-1) if y.ndim == 1 else y
+    if y.ndim == 1:
+        grads = ivy.expand_dims(grads, axis=-1)
+    if x.ndim == 1:
+        grads = ivy.expand_dims(grads, axis=-2)
+    if idx == 0:
+        ret = ivy.matmul(grads, ivy.swapaxes(y_, -1, -2))
+        return ivy.reshape(_unbroadcast(ret, x_.shape), x.shape)
+    ret = ivy.matmul(ivy.swapaxes(x_, -1, -2), grads)
+    return ivy.reshape(_unbroadcast(ret, y_.shape), y.shape)
+
+
+def _vjp_mean(grads, inputs, kwargs, ret, idx):
+    num_reduced = math.prod(ivy.shape(inputs[0])) // max(math.prod(ivy.shape(ret)), 1)
+    return ivy.divide(_vjp_sum(grads, inputs, kwargs, ret, idx), num_reduced)
+
+
+def _vjp_mul(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, inputs[1 - idx])
+
+
+def _vjp_negative(grads, inputs, kwargs, ret, idx):
+    return ivy.negative(grads)
+
+
+def _vjp_pow(grads, inputs, kwargs, ret, idx):
+    x, exponent = inputs
+    if idx == 0:
+        return ivy.multiply(
+            ivy.multiply(grads, exponent), ivy.pow(x, ivy.subtract(exponent, 1))
+        )
+    return ivy.multiply(ivy.multiply(grads, ret), ivy.log(x))
+
+
+def _vjp_reciprocal(grads, inputs, kwargs, ret, idx):
+    return ivy.negative(ivy.multiply(grads, ivy.square(ret)))
+
+
+def _vjp_relu(grads, inputs, kwargs, ret, idx):
+    return ivy.where(inputs[0] > 0, grads, ivy.zeros_like(grads))
+
+
+def _vjp_sigmoid(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ivy.multiply(ret, ivy.subtract(1, ret)))
+
+
+def _vjp_sin(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ivy.cos(inputs[0]))
+
+
+def _vjp_sqrt(grads, inputs, kwargs, ret, idx):
+    return ivy.divide(grads, ivy.multiply(ret, 2))
+
+
+def _vjp_square(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ivy.multiply(inputs[0], 2))
+
+
+def _vjp_subtract(grads, inputs, kwargs, ret, idx):
+    return (
+        grads if idx == 0 else ivy.negative(ivy.multiply(grads, kwargs.get("alpha", 1)))
+    )
+
+
+def _vjp_sum(grads, inputs, kwargs, ret, idx):
+    x = inputs[0]
+    dim = kwargs.get("dim", inputs[1] if len(inputs) > 1 else None)
+    keepdim = kwargs.get("keepdim", inputs[2] if len(inputs) > 2 else False)
+    if dim is not None and not keepdim:
+        dim = [dim] if isinstance(dim, int) else list(dim)
+        grads = ivy.expand_dims(grads, axis=sorted(d % x.ndim for d in dim))
+    return ivy.broadcast_to(grads, x.shape)
+
+
+def _vjp_tanh(grads, inputs, kwargs, ret, idx):
+    return ivy.multiply(grads, ivy.subtract(1, ivy.square(ret)))
+
+
+# analytic vector-Jacobian products of the common functions, computed from the
+# gradients of the output, the inputs, the keyword arguments and the output
+_vjp_rules = {
+    "abs": _vjp_abs,
+    "add": _vjp_add,
+    "cos": _vjp_cos,
+    "div": _vjp_div,
+    "exp": _vjp_exp,
+    "log": _vjp_log,
+    "matmul": _vjp_matmul,
+    "mean": _vjp_mean,
+    "mm": _vjp_matmul,
+    "mul": _vjp_mul,
+    "negative": _vjp_negative,
+    "pow": _vjp_pow,
+    "reciprocal": _vjp_reciprocal,
+    "relu": _vjp_relu,
+    "sigmoid": _vjp_sigmoid,
+    "sin": _vjp_sin,
+    "sqrt": _vjp_sqrt,
+    "square": _vjp_square,
+    "subtract": _vjp_subtract,
+    "sum": _vjp_sum,
+    "tanh": _vjp_tanh,
+    "true_divide": _vjp_div,
+}
+
+
 # --- Main --- #
 # ------------ #
 
@@ -165,6 +381,12 @@ def numpy_to_torch_style_args(func):  # noqa
 
 
 def outputs_to_frontend_arrays(fn: Callable) -> Callable:
+    # whether the function can be called inplace, resolved once at wrapping time
+    code = inspect.unwrap(fn).__code__
+    accepts_inplace = bool(code.co_flags & inspect.CO_VARKEYWORDS) or (
+        "inplace" in code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    )
+
     @functools.wraps(fn)
     def outputs_to_frontend_arrays_torch(*args, **kwargs):
         """
@@ -173,43 +395,45 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         Call the function, and then convert all `ivy.Array` instances returned by the
         function into `Tensor` instances.
         """
+        # scan the arguments once for arrays and for tensors which require grad or
+        # are the output of a tracked function
+        has_array = requires_grad = in_graph = False
+        for arg in args:
+            if isinstance(arg, torch_frontend.Tensor):
+                has_array = True
+                if arg.requires_grad:
+                    requires_grad = in_graph = True
+                    break
+                if arg.grad_fn:
+                    in_graph = True
+            elif (
+                not has_array
+                and not isinstance(arg, _non_array_types)
+                and (ivy.is_array(arg) or hasattr(arg, "ivy_array"))
+            ):
+                has_array = True
+
         # call unmodified function
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
         set_default_dtype = False
-        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and all(
-            [not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args]
-        ):
-            if ivy.current_backend_str() == "jax":
-                import jax
-
-                jax.config.update("jax_enable_x64", True)
-            ivy.set_default_int_dtype("int64")
-            ivy.set_default_float_dtype(torch_frontend.get_default_dtype())
-            set_default_dtype = True
+        if not has_array and not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])):
+            set_default_dtype = _set_frontend_default_dtypes()
         try:
             ret = fn(*args, **kwargs)
         finally:
             if set_default_dtype:
-                ivy.unset_default_int_dtype()
-                ivy.unset_default_float_dtype()
+                default_int_dtype_stack.pop(-1)
+                default_float_dtype_stack.pop(-1)
         # convert all arrays in the return to `torch_frontend.Tensor` instances
         ret = _from_ivy_array_to_torch_frontend_tensor(
             ret,
             nested=True,
             include_derived={"tuple": True},
-            requires_grad=kwargs.get(
-                "requires_grad",
-                any(
-                    [
-                        isinstance(i, torch_frontend.Tensor) and i.requires_grad
-                        for i in args
-                    ]
-                ),
-            ),
+            requires_grad=kwargs.get("requires_grad", requires_grad),
         )
-        array_fn = lambda x: ivy.is_array(x) or hasattr(x, "ivy_array")
-        if "inplace" in kwargs and kwargs["inplace"]:
+        if accepts_inplace and kwargs.get("inplace", False):
+            array_fn = lambda x: ivy.is_array(x) or hasattr(x, "ivy_array")
             first_array = ivy.func_wrapper._get_first_array(
                 *args, array_fn=array_fn, **kwargs
             )
@@ -223,24 +447,11 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
 
         # logic for setting is_leaf
         if ret is not None and isinstance(ret, torch_frontend.Tensor):
-            if fn.__name__ in dir(torch_frontend.creation_ops):
-                ret.is_leaf = True
-            elif all(
-                [
-                    not isinstance(i, torch_frontend.Tensor)
-                    or (not i.requires_grad and not i.grad_fn)
-                    for i in args
-                ]
-            ):
-                ret.is_leaf = True
-            else:
-                ret.is_leaf = False
+            ret.is_leaf = _is_creation_op(fn.__name__) or not in_graph
         # set grad_fn
-        if any(
-            [isinstance(i, torch_frontend.Tensor) and i.requires_grad for i in args]
-        ):
+        if requires_grad:
             # ToDo: Implement for unbind
-            grad_fn = GradFn(fn, args)
+            grad_fn = GradFn(fn, args, kwargs)
             grad_fn.__self__ = ret
             ret.grad_fn = grad_fn
 
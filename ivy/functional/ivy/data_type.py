@@ -1,8 +1,11 @@
 # global
 import ast
+import json
 import logging
 import inspect
 import math
+import os
+import sys
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable, Iterable, Any
 import numpy as np
@@ -75,8 +78,85 @@ def _lstrip_lines(source: str) -> str:
     return source
 
 
-# Get the list of function used the function
-def _get_function_list(func):
+# the names of the functions called by each compositional function of ivy, keyed by
+# the module and qualified name of the function, along with its source file, the
+# modification time of the file and its first line. These are parsed from the source of
+# each function only once, and are persisted to disk by build_function_call_index
+_function_call_index = None
+_function_call_index_path = os.path.join(
+    os.path.expanduser("~"),
+    ".cache",
+    "ivy",
+    f"function_call_index_{ivy.__version__}.json",
+)
+# the modification times of the source files, looked up once per file
+_source_mtimes = {}
+
+
+def _function_call_key(func):
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    # only the functions of ivy are indexed, and lambdas and local functions don't
+    # have a unique name to be indexed with
+    if (
+        not module
+        or not (module == "ivy" or module.startswith("ivy."))
+        or not qualname
+        or "<" in qualname
+    ):
+        return None
+    return f"{module}:{qualname}"
+
+
+def _function_stamp(func):
+    # the entry of a function is parsed again once its source file is changed
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return None
+    filename = code.co_filename
+    if filename not in _source_mtimes:
+        try:
+            _source_mtimes[filename] = os.stat(filename).st_mtime_ns
+        except OSError:
+            _source_mtimes[filename] = None
+    mtime = _source_mtimes[filename]
+    return None if mtime is None else [filename, mtime, code.co_firstlineno]
+
+
+def _load_function_call_index(path=None):
+    try:
+        with open(path or _function_call_index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != ivy.__version__:
+        return {}
+    functions = index.get("functions")
+    if not isinstance(functions, dict):
+        return {}
+    return {
+        k: v
+        for k, v in functions.items()
+        if isinstance(v, dict) and "stamp" in v and "calls" in v
+    }
+
+
+def _save_function_call_index(path=None):
+    path = path or _function_call_index_path
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"version": ivy.__version__, "functions": _function_call_index}, f
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        # the index is rebuilt on first use when it can't be persisted
+        return
+
+
+def _parse_function_calls(func):
     tree = ast.parse(_lstrip_lines(inspect.getsource(func)))
     names = {}
     # Extract all the call names
@@ -84,15 +164,7 @@ def _get_function_list(func):
         if isinstance(node, ast.Call):
             nodef = node.func
             if isinstance(nodef, ast.Name):
-                names[nodef.id] = getattr(
-                    func,
-                    "__self__",
-                    getattr(
-                        importlib.import_module(func.__module__),
-                        func.__qualname__.split(".")[0],
-                        None,
-                    ),
-                )
+                names[nodef.id] = None
             elif isinstance(nodef, ast.Attribute):
                 if (
                     hasattr(nodef, "value")
@@ -100,17 +172,38 @@ def _get_function_list(func):
                     and nodef.value.id not in ["ivy", "self"]
                 ):
                     continue
-                names[nodef.attr] = getattr(
-                    func,
-                    "__self__",
-                    getattr(
-                        importlib.import_module(func.__module__),
-                        func.__qualname__.split(".")[0],
-                        None,
-                    ),
-                )
+                names[nodef.attr] = None
+    return list(names)
+
+
+def _function_calls(func):
+    global _function_call_index
+    if _function_call_index is None:
+        _function_call_index = _load_function_call_index()
+    key = _function_call_key(func)
+    stamp = _function_stamp(func) if key else None
+    entry = _function_call_index.get(key) if stamp else None
+    if entry is not None and entry["stamp"] == stamp:
+        return entry["calls"]
+    calls = _parse_function_calls(func)
+    if stamp:
+        _function_call_index[key] = {"stamp": stamp, "calls": calls}
+    return calls
 
-    return names
+
+# Get the list of function used the function
+def _get_function_list(func):
+    # all the called functions are looked up from the module of the function
+    owner = getattr(
+        func,
+        "__self__",
+        getattr(
+            importlib.import_module(func.__module__),
+            func.__qualname__.split(".")[0],
+            None,
+        ),
+    )
+    return dict.fromkeys(_function_calls(func), owner)
 
 
 # Get the reference of the functions from string
@@ -1001,6 +1094,62 @@ def as_native_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype], /) -> ivy.Nativ
     return current_backend(None).as_native_dtype(dtype_in)
 
 
+@handle_exceptions
+def build_function_call_index(
+    fns: Optional[Iterable[Callable]] = None, /, *, path: Optional[str] = None
+) -> int:
+    """
+    Build the index of the functions called by each compositional function, which is
+    read by recursive queries such as ``ivy.function_supported_dtypes(fn)`` instead of
+    parsing the source of every function visited. The index is persisted to disk for
+    the installed version of ivy, and is otherwise built on first use in each session.
+    Only the functions of ivy are indexed, and the entry of each is parsed again
+    once its source file is changed.
+
+    Parameters
+    ----------
+    fns
+        The functions to index. Default is ``None``, in which case all the functions
+        of the ivy functional API are indexed.
+    path
+        The json file to read the index from and to persist it to. Default is
+        ``None``, in which case the index is persisted to the ivy cache directory of
+        the user, which the recursive queries read the index from in later sessions.
+
+    Returns
+    -------
+    ret
+        The number of functions in the index.
+
+    Examples
+    --------
+    >>> n = ivy.build_function_call_index([ivy.linear, ivy.dropout])
+    >>> dtypes = ivy.function_unsupported_dtypes(ivy.linear)
+    """
+    global _function_call_index
+    # the entries already parsed in this session are kept, as they're up to date
+    _function_call_index = {
+        **_load_function_call_index(path),
+        **(_function_call_index or {}),
+    }
+    if fns is None:
+        fns = [
+            v
+            for name, module in list(sys.modules.items())
+            if name.startswith("ivy.functional.ivy")
+            for v in vars(module).values()
+            if inspect.isfunction(v) and v.__module__ == name
+        ]
+    for fn in fns:
+        try:
+            _function_calls(fn)
+        except (OSError, TypeError, SyntaxError):
+            # functions without retrievable source can't be indexed
+            continue
+    _save_function_call_index(path)
+    return len(_function_call_index)
+
+
 def _check_float64(input) -> bool:
     if ivy.is_array(input):
         return ivy.dtype(input) == "float64"
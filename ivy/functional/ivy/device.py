@@ -4,10 +4,17 @@
 import os
 import gc
 import abc
+import json
+import functools
 import math
+import time
 import psutil
 import warnings
+import threading
 import types
+import collections
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type, Optional, Tuple
 
 # noinspection PyUnresolvedReferences
@@ -44,6 +51,9 @@ soft_device_mode_stack = list()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
+# the number of input shapes for which the largest split dimension is remembered
+_max_chunk_sizes_capacity = 256
+tuned_chunk_sizes = dict()
 
 
 # Extra #
@@ -1031,6 +1041,49 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _slice_nbytes(inp, axis):
+    # the number of bytes in a single slice of the input along the split axis
+    if isinstance(inp, ivy.Container):
+        return sum(_slice_nbytes(v, axis) for v in inp.cont_to_iterator_values())
+    num_slices = max(inp.shape[axis], 1)
+    return max(ivy.dtype_bits(inp.dtype), 8) // 8 * math.prod(inp.shape) // num_slices
+
+
+def _chunk_results(func, inputs_split, num_workers):
+    # yields the returns of the function for each chunk in order, with up to
+    # num_workers chunks being computed in the background while the previous
+    # ones are consumed by the caller
+    chunks = zip(*inputs_split)
+    if num_workers <= 1:
+        for inps in chunks:
+            yield func(*inps)
+        return
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = collections.deque()
+        for inps in chunks:
+            # the context is copied so that local backends apply in the workers too
+            ctx = contextvars.copy_context()
+            futures.append(executor.submit(ctx.run, func, *inps))
+            if len(futures) > num_workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
+def _preallocate_output(ret, axis, chunk_size, dim_size):
+    # returns an empty array with the full output shape to write the chunks into,
+    # or a list to collect the chunks in when they need to be concatenated instead
+    if (
+        not isinstance(ret, ivy.Array)
+        or not ivy.inplace_arrays_supported()
+        or ret.shape[axis] != chunk_size
+    ):
+        return []
+    shape = list(ret.shape)
+    shape[axis] = dim_size
+    return ivy.empty(shape=shape, dtype=ret.dtype, device=ret.device)
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1044,12 +1097,23 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: int = 1,
+    memory_budget: Optional[int] = None,
+    auto_tune: bool = False,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
     Call a function by splitting its inputs along a given axis, and calling the function
     in chunks, rather than feeding the entire input array at once. This can be useful to
     reduce memory usage of the device the arrays are on.
 
+    When concatenating array outputs with a backend which supports inplace updates, the
+    output is allocated once and each chunk is written into it, rather than holding on
+    to every chunk and concatenating them at the end.
+
+    If none of ``chunk_size``, ``max_chunk_size`` and ``memory_budget`` are given, the
+    chunk size found by :func:`tune_chunk_size` for the function, input shapes and
+    device is used when there is one.
+
     Parameters
     ----------
     func
@@ -1063,7 +1127,7 @@ def split_func_call(
         The maximum size of each of the chunks to be fed into the function.
     chunk_size
         The size of each of the chunks to be fed into the function. Specifying this arg
-        overwrites the global split factor. Default is ``None``.
+        overwrites the global split factor and the memory budget. Default is ``None``.
     input_axes
         The axes along which to split each of the inputs, before passing to the
         function. Default is ``0``.
@@ -1074,14 +1138,55 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    num_workers
+        The number of threads to call the function with. When greater than ``1``, the
+        following chunks are computed while the returns of the previous ones are being
+        unified. Default is ``1``.
+    memory_budget
+        The number of bytes which the inputs of the chunks being computed at once are
+        allowed to take up, used to derive the chunk size when ``chunk_size`` is not
+        given. Overwrites the global split factor. Default is ``None``.
+    auto_tune
+        Whether to call :func:`tune_chunk_size` first when no chunk size has been tuned
+        yet for the function, input shapes and device. Default is ``False``.
 
     Returns
     -------
     ret
         The return from the function, following input splitting and re-concattenation.
+
+    Examples
+    --------
+    >>> x = ivy.arange(12.).reshape((6, 2))
+    >>> ivy.split_func_call(lambda a: a * 2, [x], "concat", chunk_size=4, num_workers=2)
+    ivy.array([[ 0.,  2.],
+               [ 4.,  6.],
+               [ 8., 10.],
+               [12., 14.],
+               [16., 18.],
+               [20., 22.]])
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
+    if not ivy.exists(chunk_size) and ivy.exists(memory_budget):
+        slice_nbytes = sum(
+            _slice_nbytes(inp, inp_ax) for inp, inp_ax in zip(inputs, input_axes)
+        )
+        chunk_size = max(1, memory_budget // max(slice_nbytes * num_workers, 1))
+    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+        tuning_key = _tuning_key(func, inputs, device)
+        if auto_tune and tuning_key not in tuned_chunk_sizes:
+            tune_chunk_size(
+                func,
+                inputs,
+                mode,
+                input_axes=input_axes,
+                output_axes=output_axes,
+                stop_gradients=stop_gradients,
+                num_workers=num_workers,
+                device=device,
+            )
+        chunk_size = tuned_chunk_sizes.get(tuning_key)
     if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
         shape_key = "_".join([str(inp.shape) for inp in inputs])
         if shape_key in max_chunk_sizes:
@@ -1089,9 +1194,20 @@ def split_func_call(
         else:
             max_chunk_size = 0
         max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
+            [
+                (inp.cont_shape if isinstance(inp, ivy.Container) else inp.shape)[
+                    inp_ax
+                ]
+                for inp, inp_ax in zip(inputs, input_axes)
+            ]
         )
         if max_dim > max_chunk_size:
+            if (
+                shape_key not in max_chunk_sizes
+                and len(max_chunk_sizes) >= _max_chunk_sizes_capacity
+            ):
+                # evict the shape which was seen first
+                del max_chunk_sizes[next(iter(max_chunk_sizes))]
             max_chunk_sizes[shape_key] = max_dim
             max_chunk_size = max_dim
     chunk_size = ivy.default(
@@ -1129,42 +1245,301 @@ def split_func_call(
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
+    rets = _chunk_results(func, inputs_split, num_workers)
     if is_mean or is_sum:
         sums = None
-        for inps in zip(*inputs_split):
+        for ret in rets:
             if not sums:
-                sums = func(*inps)
                 sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
+                    [post_fn(r) for r in ret]
+                    if isinstance(ret, tuple)
+                    else [post_fn(ret)]
                 )
+            elif isinstance(ret, tuple):
+                for i, r in enumerate(ret):
+                    sums[i] = sums[i] + post_fn(r)
             else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
+                sums[0] = sums[0] + post_fn(ret)
         sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
         return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
+    outs = None
+    start = 0
+    for size, ret in zip(chunk_sizes, rets):
+        ret = (
+            tuple(post_fn(r) for r in ret)
+            if isinstance(ret, tuple)
+            else (post_fn(ret),)
+        )
+        if outs is None:
+            num_outputs = len(ret)
+            if output_axes is None:
+                output_axes = [input_axes[0]] * num_outputs
+            elif isinstance(output_axes, int):
+                output_axes = [output_axes] * num_outputs
+            outs = [
+                _preallocate_output(r, ax, size, dim_size)
+                for r, ax in zip(ret, output_axes)
+            ]
+        for i, r in enumerate(ret):
+            out = outs[i]
+            if isinstance(out, list):
+                out.append(r)
+                continue
+            ax = output_axes[i] % len(out.shape)
+            if r.shape[ax] != size:
+                # the chunk doesn't line up with the preallocated output, so fall
+                # back to concatenating the chunks
+                outs[i] = [out[(slice(None),) * ax + (slice(0, start),)], r]
+                continue
+            out[(slice(None),) * ax + (slice(start, start + size),)] = r
+        start += size
     ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
+        ivy.concat(out, axis=output_axes[i]) if isinstance(out, list) else out
+        for i, out in enumerate(outs)
     ]
     return ret[0] if len(ret) == 1 else ret
 
 
+def _tuning_key(func, inputs, device):
+    # the key of the tuned chunk size for the function, input shapes and device
+    name = getattr(func, "__qualname__", type(func).__qualname__)
+    if "<" in name:
+        # lambdas and local functions share their names, so are told apart by their
+        # id, and their chunk sizes aren't saved as they only hold in this session
+        name = f"{name}@{id(func):x}"
+    shape_key = "_".join([str(inp.shape) for inp in inputs])
+    device = as_ivy_dev(ivy.default(device, default_device()))
+    return "{}.{}|{}|{}".format(
+        getattr(func, "__module__", None), name, shape_key, device
+    )
+
+
+def _is_out_of_memory_error(e):
+    # the errors raised on running out of memory, along with those the exception
+    # handlers raise from them
+    seen = set()
+    while e is not None and id(e) not in seen:
+        seen.add(id(e))
+        if (
+            isinstance(e, MemoryError)
+            # torch, and tensorflow and paddle
+            or type(e).__name__ in ("OutOfMemoryError", "ResourceExhaustedError")
+            # jax, and torch before OutOfMemoryError
+            or "RESOURCE_EXHAUSTED" in str(e)
+            or "out of memory" in str(e)
+        ):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
+
+
+def _process_mem_on_dev(device):
+    # the memory (in GB) used by the process on the device, without clearing the
+    # cached memory of the backend first as used_mem_on_dev does
+    if "gpu" in device:
+        pid = os.getpid()
+        handle = _get_nvml_gpu_handle(device)
+        for process in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+            if process.pid == pid:
+                return process.usedGpuMemory / 1e9
+        return 0.0
+    return psutil.Process(pid=os.getpid()).memory_info().rss / 1e9
+
+
+def _peak_mem_used(fn, device, interval=1e-3):
+    # the peak memory (in GB) which calling fn adds to that used by the process on
+    # the device
+    if "gpu" in device and ivy.current_backend_str() == "torch":
+        import torch
+
+        native_device = as_native_dev(device)
+        torch.cuda.synchronize(native_device)
+        mem_before = torch.cuda.memory_allocated(native_device)
+        torch.cuda.reset_peak_memory_stats(native_device)
+        fn()
+        torch.cuda.synchronize(native_device)
+        return (torch.cuda.max_memory_allocated(native_device) - mem_before) / 1e9
+    # the rss and nvml keep no peak of their own, so the memory used is sampled in a
+    # thread while fn runs
+    mem_before = _process_mem_on_dev(device)
+    peak = [mem_before]
+    done = threading.Event()
+
+    def _watch():
+        while not done.wait(interval):
+            peak[0] = max(peak[0], _process_mem_on_dev(device))
+
+    watcher = threading.Thread(target=_watch, daemon=True)
+    watcher.start()
+    try:
+        fn()
+    finally:
+        done.set()
+        watcher.join()
+    return max(peak[0], _process_mem_on_dev(device)) - mem_before
+
+
+@handle_exceptions
+def tune_chunk_size(
+    func: Callable,
+    inputs: Union[ivy.Array, ivy.NativeArray],
+    mode: str = "concat",
+    /,
+    *,
+    candidates: Optional[Iterable[int]] = None,
+    max_mem: Optional[float] = None,
+    number: int = 3,
+    input_axes: Union[int, Iterable[int]] = 0,
+    output_axes: Optional[Union[int, Iterable[int]]] = None,
+    stop_gradients: bool = False,
+    num_workers: int = 1,
+    device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+) -> int:
+    """
+    Find the chunk size with which :func:`split_func_call` runs a function the fastest
+    for the given inputs, and store it in ``ivy.tuned_chunk_sizes`` to be used by
+    later calls with the same function, input shapes and device.
+
+    The candidates are tried from the smallest to the largest one. The time taken by
+    each of them is measured, along with the peak memory which a call adds to that
+    used by the process on the device when ``max_mem`` is given, and larger
+    candidates are no longer tried once one of them runs out of memory or exceeds
+    ``max_mem``. The peak is read from the
+    peak memory statistics of torch on GPUs, and is otherwise sampled every
+    millisecond, so that of very short calls may be missed. Any other error raised by
+    the function is raised again.
+
+    Parameters
+    ----------
+    func
+        The function to be called.
+    inputs
+        A list of inputs to pass into the function.
+    mode
+        The mode by which to unify the return values, must be one of
+        [ concat | mean | sum ]. Default is ``"concat"``.
+    candidates
+        The chunk sizes to try. Default is the size of the split axis halved up to
+        seven times.
+    max_mem
+        The maximum peak memory (in GB) which a call is allowed to add to the memory
+        used by the process on the device. Default is ``None``, for no limit.
+    number
+        The number of calls to time each of the candidates over. Default is ``3``.
+    input_axes
+        The axes along which to split each of the inputs, before passing to the
+        function. Default is ``0``.
+    output_axes
+        The axes along which to concat each of the returned outputs. Default is same as
+        fist input axis.
+    stop_gradients
+        Whether to stop the gradients for each computed return. Default is ``False``.
+    num_workers
+        The number of threads to call the function with. Default is ``1``.
+    device
+        The device to tune the chunk size for. Sets the default device by default.
+
+    Returns
+    -------
+    ret
+        The fastest chunk size.
+
+    Examples
+    --------
+    >>> x = ivy.random_uniform(shape=(64, 32))
+    >>> chunk_size = ivy.tune_chunk_size(ivy.tanh, [x], candidates=[8, 16, 64])
+    >>> chunk_size in (8, 16, 64)
+    True
+    """
+    device = as_ivy_dev(ivy.default(device, default_device()))
+    axis = input_axes if isinstance(input_axes, int) else list(input_axes)[0]
+    dim_size = inputs[0].shape[axis]
+    if candidates is None:
+        candidates = {max(1, dim_size >> i) for i in range(8)}
+    best_size, best_time = None, None
+    for size in sorted(candidates):
+        call = functools.partial(
+            split_func_call,
+            func,
+            inputs,
+            mode,
+            chunk_size=size,
+            input_axes=input_axes,
+            output_axes=output_axes,
+            stop_gradients=stop_gradients,
+            num_workers=num_workers,
+            device=device,
+        )
+        try:
+            # the returns are dropped straight away, so that those of the previous
+            # calls don't count towards the memory of the next ones
+            start = time.perf_counter()
+            for _ in range(number):
+                call()
+            elapsed = (time.perf_counter() - start) / number
+            # the memory is measured over a call of its own, so that sampling it
+            # doesn't slow down the timed calls
+            mem_used = _peak_mem_used(call, device) if ivy.exists(max_mem) else 0.0
+        except Exception as e:
+            # the larger chunk sizes are assumed to run out of memory as well
+            if best_size is None or not _is_out_of_memory_error(e):
+                raise
+            break
+        if ivy.exists(max_mem) and mem_used > max_mem and best_size is not None:
+            break
+        if best_time is None or elapsed < best_time:
+            best_size, best_time = size, elapsed
+    tuned_chunk_sizes[_tuning_key(func, inputs, device)] = best_size
+    return best_size
+
+
+@handle_exceptions
+def save_tuned_chunk_sizes(path: str, /) -> None:
+    """
+    Save the chunk sizes found by :func:`tune_chunk_size` to a json file, so that they
+    can be loaded by later sessions on the same machine. Those of lambdas and local
+    functions aren't saved, as they can't be told apart across sessions.
+
+    Parameters
+    ----------
+    path
+        The path of the json file to save the chunk sizes to.
+
+    Examples
+    --------
+    >>> ivy.tuned_chunk_sizes["fn|(64, 32)|cpu"] = 16
+    >>> ivy.save_tuned_chunk_sizes("chunk_sizes.json")
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {k: v for k, v in tuned_chunk_sizes.items() if "<" not in k.split("|")[0]},
+            f,
+            indent=4,
+        )
+
+
+@handle_exceptions
+def load_tuned_chunk_sizes(path: str, /) -> None:
+    """
+    Load chunk sizes saved by :func:`save_tuned_chunk_sizes` into
+    ``ivy.tuned_chunk_sizes``, overwriting those tuned for the same function, input
+    shapes and device.
+
+    Parameters
+    ----------
+    path
+        The path of the json file to load the chunk sizes from.
+
+    Examples
+    --------
+    >>> ivy.load_tuned_chunk_sizes("chunk_sizes.json")
+    >>> print(ivy.tuned_chunk_sizes)
+    {'fn|(64, 32)|cpu': 16}
+    """
+    with open(path) as f:
+        tuned_chunk_sizes.update(json.load(f))
+
+
 def _is_valid_devices_attributes(fn: Callable) -> bool:
     if hasattr(fn, "supported_devices") and hasattr(fn, "unsupported_devices"):
         fn_supported_devices = fn.supported_devices
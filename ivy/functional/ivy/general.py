@@ -61,6 +61,8 @@ trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
 trace_mode_dict["none"] = ""
 show_func_wrapper_trace_mode_stack = list()
+compose_wrappers_mode_stack = list()
+lazy_wrapping_mode_stack = list()
 min_denominator_stack = list()
 min_base_stack = list()
 tmp_dir_stack = list()
@@ -636,6 +638,124 @@ def unset_show_func_wrapper_trace_mode() -> None:
         ivy.__setattr__("show_func_wrapper_trace_mode", mode, True)
 
 
+ivy.compose_wrappers_mode = (
+    compose_wrappers_mode_stack[-1] if compose_wrappers_mode_stack else False
+)
+
+
+def _recompose_backend_wrappers(mode):
+    # wrappers are composed when the backend is set, so the current backend is
+    # set again for the new mode to take effect
+    if backend_stack:
+        ivy.set_backend(ivy.previous_backend())
+    ivy.__setattr__("compose_wrappers_mode", mode, True)
+
+
+@handle_exceptions
+def set_compose_wrappers_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to compose the wrappers of each backend function into
+    a single wrapper, which walks the arguments once per call.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to compose the function wrappers
+
+    Examples
+    --------
+    >>> ivy.set_compose_wrappers_mode(True)
+    >>> ivy.compose_wrappers_mode
+    True
+
+    >>> ivy.set_compose_wrappers_mode(False)
+    >>> ivy.compose_wrappers_mode
+    False
+    """
+    global compose_wrappers_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    compose_wrappers_mode_stack.append(mode)
+    _recompose_backend_wrappers(mode)
+
+
+@handle_exceptions
+def unset_compose_wrappers_mode() -> None:
+    """
+    Reset the mode of whether to compose the wrappers of each backend function into
+    a single wrapper to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_compose_wrappers_mode(True)
+    >>> ivy.compose_wrappers_mode
+    True
+
+    >>> ivy.unset_compose_wrappers_mode()
+    >>> ivy.compose_wrappers_mode
+    False
+    """
+    global compose_wrappers_mode_stack
+    if compose_wrappers_mode_stack:
+        compose_wrappers_mode_stack.pop(-1)
+        mode = compose_wrappers_mode_stack[-1] if compose_wrappers_mode_stack else False
+        _recompose_backend_wrappers(mode)
+
+
+ivy.lazy_wrapping_mode = (
+    lazy_wrapping_mode_stack[-1] if lazy_wrapping_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_lazy_wrapping_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to defer wrapping each backend function until it is first
+    called. The mode takes effect the next time a backend is set.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to wrap the backend functions lazily
+
+    Examples
+    --------
+    >>> ivy.set_lazy_wrapping_mode(True)
+    >>> ivy.lazy_wrapping_mode
+    True
+
+    >>> ivy.set_lazy_wrapping_mode(False)
+    >>> ivy.lazy_wrapping_mode
+    False
+    """
+    global lazy_wrapping_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    lazy_wrapping_mode_stack.append(mode)
+    ivy.__setattr__("lazy_wrapping_mode", mode, True)
+
+
+@handle_exceptions
+def unset_lazy_wrapping_mode() -> None:
+    """
+    Reset the mode of whether to defer wrapping each backend function until it is first
+    called to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_lazy_wrapping_mode(True)
+    >>> ivy.lazy_wrapping_mode
+    True
+
+    >>> ivy.unset_lazy_wrapping_mode()
+    >>> ivy.lazy_wrapping_mode
+    False
+    """
+    global lazy_wrapping_mode_stack
+    if lazy_wrapping_mode_stack:
+        lazy_wrapping_mode_stack.pop(-1)
+        mode = lazy_wrapping_mode_stack[-1] if lazy_wrapping_mode_stack else False
+        ivy.__setattr__("lazy_wrapping_mode", mode, True)
+
+
 @handle_exceptions
 @handle_backend_invalid
 @handle_nestable
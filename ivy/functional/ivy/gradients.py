@@ -26,6 +26,46 @@ from ivy.utils.exceptions import handle_exceptions
 # ------- #
 
 
+def _map_packed(fn, x, *args, segments=False):
+    """
+    Apply fn to the flat buffers of a packed container x and of the arguments, with
+    the containers among them packed like x, returning the results as packed
+    containers, or None if x isn't packed or the arguments can't be packed like it.
+
+    With segments set, fn is also passed the index of the leaf of each element of the
+    buffers along with the number of leaves, for the updates with per-leaf norms.
+    """
+    if not isinstance(x, ivy.Container) or not x.cont_is_packed:
+        return None
+    buffers = x.cont_packed_buffers
+    if not buffers:
+        return None
+    args_buffers = list()
+    for arg in args:
+        if isinstance(arg, ivy.Container):
+            try:
+                arg = arg.cont_pack(like=x)
+            except ivy.utils.exceptions.IvyException:
+                return None
+            args_buffers.append(arg.cont_packed_buffers)
+        elif ivy.is_array(arg) and len(arg.shape) > 0:
+            return None
+        else:
+            args_buffers.append([arg] * len(buffers))
+    if segments:
+        args_buffers.append(x.cont_packed_segment_ids)
+    rets = [fn(*xs) for xs in zip(buffers, *args_buffers)]
+    if isinstance(rets[0], tuple):
+        return tuple(x.cont_from_packed_buffers(ret) for ret in zip(*rets))
+    return x.cont_from_packed_buffers(rets)
+
+
+def _segment_norms(x, segments):
+    """Compute the vector norm of each leaf in a flat buffer of a packed container."""
+    segment_ids, num_segments = segments
+    return ivy.sqrt(ivy.unsorted_segment_sum(x**2, segment_ids, num_segments))
+
+
 def _get_duplicate_index_chains(xs):
     """Generate a list of duplicate index chains for a given nested structure."""
     duplicate_index_chains = ()
@@ -726,6 +766,17 @@ def adam_step(
         b: ivy.array([0.216, 0.384, 0.6])
     })
     """
+    if out is None:
+        ret = _map_packed(
+            lambda dcdw, mw, vw: ivy.adam_step(
+                dcdw, mw, vw, step, beta1=beta1, beta2=beta2, epsilon=epsilon
+            ),
+            dcdw,
+            mw,
+            vw,
+        )
+        if ret is not None:
+            return ret
     step = float(step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
@@ -859,6 +910,17 @@ def optimizer_update(
         b: ivy.array([3., 4., 5.])
     }
     """
+    if out is None:
+        ret = _map_packed(
+            lambda w, effective_grad, lr: ivy.optimizer_update(
+                w, effective_grad, lr, stop_gradients=stop_gradients
+            ),
+            w,
+            effective_grad,
+            lr,
+        )
+        if ret is not None:
+            return ret
     deltas = effective_grad * lr
     w = ivy.subtract(w, deltas, out=out)
     if stop_gradients:
@@ -1050,6 +1112,20 @@ def lars_update(
         b: ivy.array([0.90848625, 2.93616199, 4.77232409])
     }
     """
+    if out is None:
+
+        def _lars_update_packed(w, dcdw, lr, segments):
+            w_norm = _segment_norms(w, segments)
+            lr = ivy.stable_divide(w_norm * lr, _segment_norms(dcdw, segments))
+            if decay_lambda > 0:
+                lr /= w_norm * decay_lambda
+            return ivy.gradient_descent_update(
+                w, dcdw, ivy.gather(lr, segments[0]), stop_gradients=stop_gradients
+            )
+
+        ret = _map_packed(_lars_update_packed, w, dcdw, lr, segments=True)
+        if ret is not None:
+            return ret
     w_norm = ivy.vector_norm(w)
     lr = ivy.stable_divide(w_norm * lr, ivy.vector_norm(dcdw))
     if decay_lambda > 0:
@@ -1209,6 +1285,28 @@ def adam_update(
         b: ivy.array([9.00000086e-05, 4.00000063e-05, 4.00000063e-05])
     })
     """
+    if out is None:
+        ret = _map_packed(
+            lambda w, dcdw, lr, mw_tm1, vw_tm1: ivy.adam_update(
+                w,
+                dcdw,
+                lr,
+                mw_tm1,
+                vw_tm1,
+                step,
+                beta1=beta1,
+                beta2=beta2,
+                epsilon=epsilon,
+                stop_gradients=stop_gradients,
+            ),
+            w,
+            dcdw,
+            lr,
+            mw_tm1,
+            vw_tm1,
+        )
+        if ret is not None:
+            return ret
     effective_grads, mw, vw = ivy.adam_step(
         dcdw, mw_tm1, vw_tm1, step, beta1=beta1, beta2=beta2, epsilon=epsilon
     )
@@ -1376,6 +1474,30 @@ def lamb_update(
         b: ivy.array([0.00036, 0.00016, 0.00049])
     })
     """
+    if out is None:
+
+        def _lamb_update_packed(w, dcdw, lr, mw_tm1, vw_tm1, segments):
+            r1 = _segment_norms(w, segments)
+            eff_grads, mw, vw = ivy.adam_step(
+                dcdw, mw_tm1, vw_tm1, step, beta1=beta1, beta2=beta2, epsilon=epsilon
+            )
+            if decay_lambda > 0:
+                r2 = _segment_norms(eff_grads + decay_lambda * w, segments)
+            else:
+                r2 = _segment_norms(eff_grads, segments)
+            r = ivy.minimum(ivy.stable_divide(r1, r2), ivy.array(max_trust_ratio))
+            lr = ivy.gather(r, segments[0]) * lr
+            return (
+                ivy.optimizer_update(w, eff_grads, lr, stop_gradients=stop_gradients),
+                mw,
+                vw,
+            )
+
+        ret = _map_packed(
+            _lamb_update_packed, w, dcdw, lr, mw_tm1, vw_tm1, segments=True
+        )
+        if ret is not None:
+            return ret
     r1 = ivy.vector_norm(w)
     eff_grads, mw, vw = ivy.adam_step(
         dcdw, mw_tm1, vw_tm1, step, beta1=beta1, beta2=beta2, epsilon=epsilon
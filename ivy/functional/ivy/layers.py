@@ -72,6 +72,79 @@ def _in_projection(
         )
 
 
+# the number of queries and keys in the blocks which long sequences are attended in
+_attention_block_size = 512
+
+
+def _mask_block(mask, q_start, q_end, k_start, k_end):
+    # the dimensions of size 1 are broadcast over the block
+    if mask.shape[-2] != 1:
+        mask = mask[..., q_start:q_end, :]
+    if mask.shape[-1] != 1:
+        mask = mask[..., k_start:k_end]
+    return mask
+
+
+def _blockwise_attention(
+    query,
+    key,
+    value,
+    scale,
+    /,
+    *,
+    mask=None,
+    is_causal=False,
+    block_size=None,
+):
+    """
+    Attend the queries to the keys and values one block of each at a time.
+
+    The softmax is computed online, the running sums of each block of queries being
+    rescaled whenever the running maximum of their similarities grows, so only a block
+    of the *[batch_shape,num_queries,num_keys]* similarities is held at once. With
+    causal masking, the blocks of keys which are entirely masked are skipped and only
+    the blocks along the diagonal are masked.
+    """
+    block_size = _attention_block_size if block_size is None else block_size
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    masked_value = -ivy.finfo(ivy.dtype(query)).max
+    outputs = list()
+    for q_start in range(0, num_queries, block_size):
+        q_end = min(q_start + block_size, num_queries)
+        query_block = query[..., q_start:q_end, :] * scale
+        # the query i only attends to the keys up to i with causal masking
+        k_stop = min(q_end, num_keys) if is_causal else num_keys
+        running_max = running_sum = acc = None
+        for k_start in range(0, k_stop, block_size):
+            k_end = min(k_start + block_size, k_stop)
+            sim = ivy.matmul(query_block, key[..., k_start:k_end, :], transpose_b=True)
+            if ivy.exists(mask):
+                block_mask = _mask_block(mask, q_start, q_end, k_start, k_end)
+                sim = ivy.where(ivy.logical_not(block_mask), masked_value, sim)
+            elif is_causal and k_end - 1 > q_start:
+                block_mask = ivy.expand_dims(
+                    ivy.arange(q_start, q_end), axis=-1
+                ) >= ivy.arange(k_start, k_end)
+                sim = ivy.where(block_mask, sim, masked_value)
+            block_max = ivy.max(sim, axis=-1, keepdims=True)
+            if running_max is None:
+                new_max = block_max
+            else:
+                new_max = ivy.maximum(running_max, block_max)
+            probs = ivy.exp(sim - new_max)
+            block_sum = ivy.sum(probs, axis=-1, keepdims=True)
+            block_acc = ivy.matmul(probs, value[..., k_start:k_end, :])
+            if running_max is None:
+                running_sum, acc = block_sum, block_acc
+            else:
+                correction = ivy.exp(running_max - new_max)
+                running_sum = running_sum * correction + block_sum
+                acc = acc * correction + block_acc
+            running_max = new_max
+        outputs.append(acc / running_sum)
+    return ivy.concat(outputs, axis=-2)
+
+
 # Linear #
 @handle_exceptions
 @handle_nestable
@@ -421,6 +494,8 @@ dropout.mixed_backend_wrappers = {
 
 
 @handle_exceptions
+@handle_nestable
+@handle_partial_mixed_function
 @handle_array_like_without_promotion
 @handle_array_function
 def scaled_dot_product_attention(
@@ -679,29 +754,37 @@ def scaled_dot_product_attention(
     )
     embed_dim = query.shape[-1]
     scale = 1 / (embed_dim**0.5) if not scale else scale
+    if key.shape[-2] > _attention_block_size and not (training and dropout_p):
+        # long sequences are attended blockwise, within a bounded memory
+        result = _blockwise_attention(
+            query, key, value, scale, mask=mask, is_causal=is_causal
+        )
+        return result if not ivy.exists(out) else ivy.inplace_update(out, result)
     sim = ivy.einsum("... q f, ... k f -> ... q k", query, key) * scale
     sim = ivy.dropout(sim, dropout_p, training=training)
-    if ivy.exists(mask):
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
-    elif is_causal:
+    if is_causal:
         L = query.shape[-2]  # Source sequence length
         S = key.shape[-2]  # Target sequence length
-        mask = ivy.tril(ivy.ones((L, S)), k=0)
-        mask = ivy.astype(mask, ivy.bool)
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
+        mask = ivy.tril(ivy.ones((L, S), dtype=ivy.bool), k=0)
+    if ivy.exists(mask):
+        sim = ivy.where(ivy.logical_not(mask), -ivy.finfo(ivy.dtype(sim)).max, sim)
     attn = ivy.softmax(sim, axis=-1)
     result = ivy.einsum("... qk, ...kf -> ...qf", attn, value)
     return result if not ivy.exists(out) else ivy.inplace_update(out, result)
 
 
+scaled_dot_product_attention.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "handle_out_argument",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("handle_partial_mixed_function",),
+}
+
+
 @handle_exceptions
 @handle_nestable
 @handle_out_argument
@@ -839,29 +922,42 @@ def multi_head_attention(
         (0, 2, 1, 3)
     )
     k = k.reshape((batch_size, k_seq_length, num_heads, dims_per_head)).permute_dims(
-        (0, 2, 3, 1)
+        (0, 2, 1, 3)
     )
     v = v.reshape((batch_size, k_seq_length, num_heads, dims_per_head)).permute_dims(
         (0, 2, 1, 3)
     )
-    # perform bmm
-    attn_scores = ivy.matmul(q, k)
-    # scale
     scale = 1 / (dims_per_head**0.5) if not scale else scale
-    attn_scores *= scale
-    # apply attention mask
-    if ivy.exists(attention_mask) or is_causal:
-        if is_causal:
-            # create causal mask
-            attention_mask = ivy.tril(ivy.ones((q_seq_length, k_seq_length)))
-        attention_mask = attention_mask.astype("bool")
-        attn_scores = ivy.where(attention_mask, attn_scores, -ivy.inf)
-    # perform softmax
-    attn_weights = ivy.softmax(attn_scores, axis=-1)
-    # perform dropout
-    attn_weights = ivy.dropout(attn_weights, dropout, training=training)
-    # bmm with values
-    attention_out = ivy.matmul(attn_weights, v)
+    if not return_attention_weights and not (training and dropout):
+        # without the attention weights to return, the attention is left to the
+        # native fused attention of the backend if any, or attended blockwise for
+        # long sequences
+        attention_out = ivy.scaled_dot_product_attention(
+            q,
+            k,
+            v,
+            scale=scale,
+            mask=None if is_causal else attention_mask,
+            is_causal=is_causal,
+        )
+    else:
+        # perform bmm
+        attn_scores = ivy.matmul(q, k, transpose_b=True)
+        # scale
+        attn_scores *= scale
+        # apply attention mask
+        if ivy.exists(attention_mask) or is_causal:
+            if is_causal:
+                # create causal mask
+                attention_mask = ivy.tril(ivy.ones((q_seq_length, k_seq_length)))
+            attention_mask = attention_mask.astype("bool")
+            attn_scores = ivy.where(attention_mask, attn_scores, -ivy.inf)
+        # perform softmax
+        attn_weights = ivy.softmax(attn_scores, axis=-1)
+        # perform dropout
+        attn_weights = ivy.dropout(attn_weights, dropout, training=training)
+        # bmm with values
+        attention_out = ivy.matmul(attn_weights, v)
     attention_out = attention_out.permute_dims((0, 2, 1, 3)).reshape(
         (batch_size, q_seq_length, -1)
     )
@@ -2087,6 +2183,7 @@ def conv(
 
 @handle_exceptions
 @handle_nestable
+@handle_partial_mixed_function
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
 @handle_array_function
@@ -2132,15 +2229,21 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
+    output_channels = init_h.shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
+    # both biases are added once to the input kernel projections of all timesteps
+    if bias is None:
+        bias = recurrent_bias
+    elif recurrent_bias is not None:
+        bias = bias + recurrent_bias
+
     # input kernel
     Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    Wi_x = ivy.matmul(x_flat, Wi)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # recurrent kernel
     Wh = recurrent_kernel
@@ -2152,33 +2255,28 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    # unrolled time dimension with lstm steps, with the sigmoid gates activated at once
+    for Wi_xt in ivy.unstack(Wi_x, axis=-2):
+        zt = Wi_xt + ivy.matmul(ht, Wh)
+        it, ft, _, ot = ivy.split(ivy.sigmoid(zt), num_or_size_splits=4, axis=-1)
+        gt = ivy.tanh(zt[..., 2 * output_channels : 3 * output_channels])
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
+        hts_list.append(ht)
 
-    return ivy.concat(hts_list, axis=-2), ct
+    return ivy.stack(hts_list, axis=-2), ct
+
+
+lstm_update.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays", "handle_partial_mixed_function"),
+}
 
 
 # Helpers #
@@ -2342,6 +2440,94 @@ def _get_num_padded_values(i, p, n, k, s):
     )
 
 
+# the number of sorted boxes in the tiles which non-maximum suppression is run in
+_nms_tile_size = 512
+
+
+def _box_overlaps(boxes1, areas1, boxes2, areas2, iou_threshold):
+    # whether the iou of each of `boxes1` with each of `boxes2` is above the
+    # threshold, the nan iou of two boxes without area counting as an overlap
+    x1, y1, x2, y2 = (boxes1[:, i : i + 1] for i in range(4))
+    w = ivy.minimum(x2, boxes2[:, 2], use_where=False) - ivy.maximum(
+        x1, boxes2[:, 0], use_where=False
+    )
+    h = ivy.minimum(y2, boxes2[:, 3], use_where=False) - ivy.maximum(
+        y1, boxes2[:, 1], use_where=False
+    )
+    w = ivy.maximum(w, 0.0, use_where=False)
+    h = ivy.maximum(h, 0.0, use_where=False)
+    inter = w * h
+    iou = inter / (ivy.expand_dims(areas1, axis=-1) + areas2 - inter)
+    return ivy.logical_not(iou <= iou_threshold)
+
+
+def _nms_keep(boxes, iou_threshold, /, *, idxs=None, max_output_size=None):
+    # the positions of the boxes kept by greedy non-maximum suppression, the boxes
+    # being sorted by decreasing score, or by `idxs` and then by decreasing score,
+    # with only the boxes of the same `idxs` suppressing each other. The boxes are
+    # processed in tiles, which are first suppressed by the boxes kept from the
+    # previous tiles, and then by the boxes kept within them, found by suppressing
+    # the tile with the boxes kept so far until nothing changes. This gives the
+    # greedy result, as the kept boxes are settled in order, the first box never
+    # being suppressed by any before it.
+    num_boxes = boxes.shape[0]
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    kept = []
+    num_kept = 0
+    for start in range(0, num_boxes, _nms_tile_size):
+        stop = min(start + _nms_tile_size, num_boxes)
+        positions = ivy.arange(start, stop)
+        tile_boxes, tile_areas = boxes[start:stop], areas[start:stop]
+        kept_positions = ivy.concat(kept) if kept else None
+        if kept and idxs is not None:
+            # the boxes of the previous categories can't suppress the tile
+            kept_positions = kept_positions[idxs[kept_positions] >= idxs[start]]
+        if kept_positions is not None and kept_positions.shape[0]:
+            overlaps = _box_overlaps(
+                boxes[kept_positions],
+                areas[kept_positions],
+                tile_boxes,
+                tile_areas,
+                iou_threshold,
+            )
+            if idxs is not None:
+                overlaps = ivy.logical_and(
+                    overlaps,
+                    ivy.expand_dims(idxs[kept_positions], axis=-1) == idxs[start:stop],
+                )
+            alive = ivy.logical_not(ivy.any(overlaps, axis=0))
+        else:
+            alive = ivy.ones((stop - start,), dtype="bool")
+        # each box of the tile can only be suppressed by the boxes before it
+        overlaps = ivy.logical_and(
+            _box_overlaps(
+                tile_boxes, tile_areas, tile_boxes, tile_areas, iou_threshold
+            ),
+            ivy.expand_dims(positions, axis=-1) < positions,
+        )
+        if idxs is not None:
+            overlaps = ivy.logical_and(
+                overlaps,
+                ivy.expand_dims(idxs[start:stop], axis=-1) == idxs[start:stop],
+            )
+        keep = alive
+        while True:
+            suppressed = ivy.any(
+                ivy.logical_and(overlaps, ivy.expand_dims(keep, axis=-1)), axis=0
+            )
+            new_keep = ivy.logical_and(alive, ivy.logical_not(suppressed))
+            if ivy.array_equal(new_keep, keep):
+                break
+            keep = new_keep
+        kept.append(positions[keep])
+        num_kept += kept[-1].shape[0]
+        if max_output_size is not None and num_kept >= max_output_size:
+            break
+    if not kept:
+        return ivy.array([], dtype=ivy.int64)
+    return ivy.astype(ivy.concat(kept), ivy.int64)[:max_output_size]
+
+
 # TODO add paddle backend implementation back,
 #  once paddle.argsort uses a stable algorithm
 #  https://github.com/PaddlePaddle/Paddle/issues/57508
@@ -2357,64 +2543,91 @@ def nms(
     max_output_size=None,
     score_threshold=float("-inf"),
 ):
-    change_id = False
-    if score_threshold is not float("-inf") and scores is not None:
-        keep_idx = scores > score_threshold
-        boxes = boxes[keep_idx]
-        scores = scores[keep_idx]
-        change_id = True
-        nonzero = ivy.nonzero(keep_idx)[0].flatten()
     if scores is None:
-        scores = ivy.ones((boxes.shape[0],), dtype=boxes.dtype)
+        return _nms_keep(boxes, iou_threshold, max_output_size=max_output_size)
+    nonzero = ivy.nonzero(scores > score_threshold)[0]
+    # get boxes with more ious first
+    nonzero = nonzero[ivy.argsort(-1 * scores[nonzero], stable=True)]
+    ret = _nms_keep(boxes[nonzero], iou_threshold, max_output_size=max_output_size)
+    return ivy.astype(nonzero[ret], ivy.int64)
 
-    if len(boxes) < 2:
-        if len(boxes) == 1:
-            ret = ivy.array([0], dtype=ivy.int64)
-        else:
-            ret = ivy.array([], dtype=ivy.int64)
-    else:
-        x1 = boxes[:, 0]
-        y1 = boxes[:, 1]
-        x2 = boxes[:, 2]
-        y2 = boxes[:, 3]
-
-        areas = (x2 - x1) * (y2 - y1)
-        order = ivy.argsort(
-            (-1 * scores), stable=True
-        )  # get boxes with more ious first
-        keep = []
-
-        while order.size > 0:
-            i = order[0]  # pick maxmum iou box
-            keep.append(i)
-            xx1 = ivy.maximum(x1[i], x1[order[1:]])
-            yy1 = ivy.maximum(y1[i], y1[order[1:]])
-            xx2 = ivy.minimum(x2[i], x2[order[1:]])
-            yy2 = ivy.minimum(y2[i], y2[order[1:]])
-
-            w = ivy.maximum(0.0, xx2 - xx1)  # maximum width
-            h = ivy.maximum(0.0, yy2 - yy1)  # maxiumum height
-            inter = w * h
-            ovr = inter / (areas[i] + areas[order[1:]] - inter)
-            inds = ivy.nonzero(ovr <= iou_threshold)[0]
-
-            order = order[inds + 1]
-
-        ret = ivy.array(keep)
-
-    if len(ret) > 1 and scores is not None:
-        ret = sorted(
-            ret.flatten().tolist(), reverse=True, key=lambda x: (scores[x], -x)
-        )
-        ret = ivy.array(ret, dtype=ivy.int64).flatten()
 
-    if change_id and len(ret) > 0:
-        ret = ivy.array(nonzero[ret], dtype=ivy.int64).flatten()
+nms.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
+
 
-    return ret.flatten()[:max_output_size]
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+def batched_nms(
+    boxes: Union[ivy.Array, ivy.NativeArray],
+    scores: Union[ivy.Array, ivy.NativeArray],
+    idxs: Union[ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    iou_threshold: float = 0.5,
+    max_output_size: Optional[int] = None,
+    score_threshold: float = float("-inf"),
+) -> ivy.Array:
+    """
+    Perform non-maximum suppression on the boxes of several categories at once, with
+    only the boxes of the same category suppressing each other.
 
+    The categories can be the classes of the boxes, the images they belong to, or
+    both at once, by giving each pair of an image and a class its own index.
 
-nms.mixed_backend_wrappers = {
+    Parameters
+    ----------
+    boxes
+        the boxes of shape *[num_boxes, 4]*, in *(x1, y1, x2, y2)* format.
+    scores
+        the scores of the boxes, of shape *[num_boxes]*.
+    idxs
+        the indices of the categories of the boxes, of shape *[num_boxes]*.
+    iou_threshold
+        the intersection over union above which the box with the lower score is
+        suppressed. Default is ``0.5``.
+    max_output_size
+        the maximum number of boxes to keep in total. Default is ``None``, keeping
+        all the boxes which aren't suppressed.
+    score_threshold
+        the score at or below which boxes are removed before the suppression.
+        Default is ``-inf``.
+
+    Returns
+    -------
+    ret
+        the int64 indices of the kept boxes, sorted by decreasing score.
+
+    Examples
+    --------
+    >>> boxes = ivy.array([[0., 0., 2., 2.], [0., 0., 2., 1.9], [0., 0., 2., 2.]])
+    >>> scores = ivy.array([0.9, 0.8, 0.7])
+    >>> idxs = ivy.array([0, 0, 1])
+    >>> ivy.batched_nms(boxes, scores, idxs)
+    ivy.array([0, 2])
+    """
+    nonzero = ivy.nonzero(scores > score_threshold)[0]
+    # sort the boxes by category, and then by decreasing score
+    nonzero = nonzero[ivy.argsort(-1 * scores[nonzero], stable=True)]
+    nonzero = nonzero[ivy.argsort(idxs[nonzero], stable=True)]
+    ret = nonzero[_nms_keep(boxes[nonzero], iou_threshold, idxs=idxs[nonzero])]
+    # sort the kept boxes by decreasing score, and then by index
+    ret = ivy.sort(ret)
+    ret = ret[ivy.argsort(-1 * scores[ret], stable=True)]
+    return ivy.astype(ret[:max_output_size], ivy.int64)
+
+
+batched_nms.mixed_backend_wrappers = {
     "to_add": (
         "handle_backend_invalid",
         "inputs_to_native_arrays",
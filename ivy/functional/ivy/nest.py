@@ -992,6 +992,126 @@ def map(
     return rets
 
 
+_nested_map_plans = dict()
+_nested_map_plans_capacity = 256
+_nest_kinds = dict()
+
+
+class _NestedMapPlan:
+    # the structure of a nest in pre-order, with the parent, key and type of each node
+    # below the root, and the index, kind, keys (or length) and children of each nest
+
+    def __init__(self):
+        self.kinds = list()
+        self.accessors = list()
+        self.leaves = list()
+        self.nests = list()
+        self._nests = dict()
+
+    def add(self, parent, key, node, kind):
+        idx = len(self.kinds)
+        self.kinds.append(kind)
+        if parent is not None:
+            self.accessors.append((parent, key, type(node)))
+            self._nests[parent][3].append(idx)
+        if kind is None or kind == "slice":
+            self.leaves.append(idx)
+        else:
+            keys = list(node.keys()) if kind == "dict" else len(node)
+            self._nests[idx] = (idx, kind, keys, list())
+            self.nests.append(self._nests[idx])
+        return idx
+
+
+def _nest_kind(x, to_ignore, tuple_check_fn, list_check_fn, dict_check_fn, kinds):
+    # how nested_map treats x, with None for the leaves. When the check functions only
+    # depend on the type of x, the kinds of the types seen so far are cached in kinds
+    class_instance = type(x)
+    kind = kinds.get(class_instance, False) if kinds is not None else False
+    if kind is False:
+        if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
+            kind = "tuple"
+        elif list_check_fn(x, list) and not isinstance(x, to_ignore):
+            kind = "list"
+        elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
+            x, to_ignore
+        ):
+            kind = "dict"
+        elif isinstance(x, slice):
+            kind = "slice"
+        else:
+            kind = None
+        if kinds is not None:
+            kinds[class_instance] = kind
+    # TODO: Fixes iterating over tracked instances from the graph
+    # during transpilation. However, there might be a better fix
+    # than this. Remove the check below if that's the case
+    if (
+        kind not in (None, "slice")
+        and hasattr(x, "is_tracked_proxy")
+        and hasattr(class_instance, "__bases__")
+        and not set(class_instance.__bases__).intersection(set(to_ignore))
+    ):
+        return None
+    return kind
+
+
+def _map_leaf(fn, x, kind):
+    if kind == "slice":
+        # TODO: add tests for this
+        return slice(*nested_map(fn, [x.start, x.stop, x.step]))
+    return fn(x)
+
+
+def _rebuild_nest(x, kind, ret_list, keys, to_mutable, shallow):
+    class_instance = type(x)
+    if kind == "tuple":
+        if to_mutable:
+            return ret_list
+        elif hasattr(x, "_fields"):
+            # noinspection PyProtectedMember
+            return class_instance(**dict(zip(x._fields, ret_list)))
+        return class_instance(ret_list)
+    elif kind == "list":
+        if shallow:
+            x[:] = ret_list[:]
+            return x
+        return class_instance(ret_list)
+    ret = dict(zip(keys, ret_list))
+    if shallow:
+        x.update(ret)
+        return x
+    return class_instance(ret)
+
+
+def _nested_map_with_plan(fn, x, plan, to_mutable, shallow):
+    # maps the nest following the plan, or returns None if x doesn't match it
+    nodes = [x]
+    append = nodes.append
+    try:
+        for parent, key, t in plan.accessors:
+            node = nodes[parent][key]
+            if type(node) is not t:
+                return None
+            append(node)
+    except (IndexError, KeyError, TypeError):
+        return None
+    for idx, kind, keys, _ in plan.nests:
+        node = nodes[idx]
+        if list(node.keys()) != keys if kind == "dict" else len(node) != keys:
+            return None
+    rets = nodes[:]
+    kinds = plan.kinds
+    for idx in plan.leaves:
+        kind = kinds[idx]
+        rets[idx] = fn(nodes[idx]) if kind is None else _map_leaf(fn, nodes[idx], kind)
+    for idx, kind, keys, children in reversed(plan.nests):
+        rets[idx] = _rebuild_nest(
+            nodes[idx], kind, [rets[c] for c in children], keys, to_mutable, shallow
+        )
+    return (rets[0],)
+
+
 @handle_exceptions
 def nested_map(
     fn: Callable,
@@ -1004,6 +1124,7 @@ def nested_map(
     _list_check_fn: Optional[Callable] = None,
     _dict_check_fn: Optional[Callable] = None,
     shallow: bool = True,
+    cache_plan: bool = False,
 ) -> Union[ivy.Array, ivy.NativeArray, Iterable, Dict]:
     """
     Apply a function on x in a nested manner, whereby all dicts, lists and tuples are
@@ -1033,6 +1154,11 @@ def nested_map(
     shallow
         Whether to inplace update the input nest or not
         Only works if nest is a mutable type. Default is ``True``.
+    cache_plan
+        Whether to cache the traversal plan of the nest, so that later maps over nests
+        with the same structure and leaf types become a flat loop over the leaves.
+        With a cached plan, all leaves are mapped before the nests are rebuilt, so
+        nests which appear more than once are only mapped once. Default is ``False``.
 
     Returns
     -------
@@ -1110,16 +1236,20 @@ def nested_map(
     for t in ("tuple", "list", "dict"):
         if t not in include_derived:
             include_derived[t] = False
-    class_instance = type(x)
-    # TODO: Fixes iterating over tracked instances from the graph
-    # during transpilation. However, there might be a better fix
-    # than this. Remove the check below if that's the case
-    if (
-        hasattr(x, "is_tracked_proxy")
-        and hasattr(class_instance, "__bases__")
-        and not set(class_instance.__bases__).intersection(set(to_ignore))
-    ):
-        to_ignore += (class_instance,)
+    plan_key = None
+    if cache_plan and not (_tuple_check_fn or _list_check_fn or _dict_check_fn):
+        plan_key = (
+            type(x),
+            tuple(include_derived[t] for t in ("tuple", "list", "dict")),
+            to_ignore,
+            to_mutable,
+            shallow,
+        )
+        plan = _nested_map_plans.get(plan_key)
+        if plan is not None:
+            ret = _nested_map_with_plan(fn, x, plan, to_mutable, shallow)
+            if ret is not None:
+                return ret[0]
     tuple_check_fn = ivy.default(
         _tuple_check_fn,
         (
@@ -1144,73 +1274,57 @@ def nested_map(
             else (lambda x_, t_: type(x_) is t_)
         ),
     )
-    if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if to_mutable:
-            return ret_list
-        elif hasattr(x, "_fields"):
-            # noinspection PyProtectedMember
-            return class_instance(**dict(zip(x._fields, ret_list)))
-        else:
-            return class_instance(ret_list)
-    elif list_check_fn(x, list) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                fn,
-                i,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for i in x
-        ]
-        if shallow:
-            x[:] = ret_list[:]
-            return x
-        return class_instance(ret_list)
-    elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
-        x, to_ignore
-    ):
-        class_instance = type(x)
-        ret = {
-            k: nested_map(
-                fn,
-                v,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                shallow,
-            )
-            for k, v in x.items()
-        }
-        if shallow:
-            x.update(ret)
-            return x
-        return class_instance(ret)
-    elif isinstance(x, slice):
-        # TODO: add tests for this
-        return slice(*nested_map(fn, [x.start, x.stop, x.step]))
-    return fn(x)
+    kinds = None
+    if not (_tuple_check_fn or _list_check_fn or _dict_check_fn):
+        kinds = _nest_kinds.setdefault(
+            (tuple(include_derived[t] for t in ("tuple", "list", "dict")), to_ignore),
+            dict(),
+        )
+    checks = (to_ignore, tuple_check_fn, list_check_fn, dict_check_fn, kinds)
+    plan = _NestedMapPlan() if plan_key is not None else None
+    kind = _nest_kind(x, *checks)
+    idx = plan.add(None, None, x, kind) if plan else None
+    if kind is None or kind == "slice":
+        ret = _map_leaf(fn, x, kind)
+    else:
+        # the nests are traversed depth first with an explicit stack, each entry
+        # holding a nest, its kind, keys, plan index, children iterator and returns
+        keys = list(x.keys()) if kind == "dict" else None
+        stack = [(x, kind, keys, idx, iter(x.values() if keys is not None else x), [])]
+        while stack:
+            node, kind, keys, idx, children, ret_list = stack[-1]
+            for child in children:
+                child_kind = _nest_kind(child, *checks)
+                key = keys[len(ret_list)] if keys is not None else len(ret_list)
+                child_idx = plan.add(idx, key, child, child_kind) if plan else None
+                if child_kind is None or child_kind == "slice":
+                    ret_list.append(_map_leaf(fn, child, child_kind))
+                    continue
+                child_keys = list(child.keys()) if child_kind == "dict" else None
+                stack.append(
+                    (
+                        child,
+                        child_kind,
+                        child_keys,
+                        child_idx,
+                        iter(child.values() if child_keys is not None else child),
+                        [],
+                    )
+                )
+                break
+            else:
+                stack.pop()
+                ret = _rebuild_nest(node, kind, ret_list, keys, to_mutable, shallow)
+                if stack:
+                    stack[-1][5].append(ret)
+    if plan:
+        if (
+            plan_key not in _nested_map_plans
+            and len(_nested_map_plans) >= _nested_map_plans_capacity
+        ):
+            del _nested_map_plans[next(iter(_nested_map_plans))]
+        _nested_map_plans[plan_key] = plan
+    return ret
 
 
 @handle_exceptions
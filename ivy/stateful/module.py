@@ -656,9 +656,20 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
-        backend = ivy.with_backend("numpy")
-        self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-        self.submod_call_order = ivy.Container(alphabetical_keys=False, ivyh=backend)
+        self._reset_submod_tracking()
+        if not (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(submod_depth)
+            or ivy.exists(submods_to_track)
+            or ivy.exists(expected_submod_rets)
+        ):
+            # no tracking is requested, so the module is called directly, with the
+            # flags of the module having been unset at the end of the last call, and
+            # with the variables as they are, as they're only made native to be
+            # tracked
+            return self._call(*args, v=v, buffers=buffers, **kwargs)
+
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -666,12 +677,25 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             track_submod_call_order,
             expected_submod_rets,
         )
-
-        # convert variables to native arrays so that they can be tracked
-        v = ivy.to_native(v)
-        ret = self._call(*args, v=v, buffers=buffers, **kwargs)
-        self._unset_submod_flags()
-        return ret
+        try:
+            # convert variables to native arrays so that they can be tracked
+            v = ivy.to_native(v)
+            return self._call(*args, v=v, buffers=buffers, **kwargs)
+        finally:
+            self._unset_submod_flags()
+
+    def _reset_submod_tracking(self):
+        """
+        Clear the submodule returns and call order tracked during the last call,
+        reusing the containers unless they have been populated, as these may still be
+        referenced by the caller.
+        """
+        if self.submod_rets or self.submod_call_order:
+            backend = ivy.with_backend("numpy")
+            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
+            self.submod_call_order = ivy.Container(
+                alphabetical_keys=False, ivyh=backend
+            )
 
     def save_weights(self, weights_path, /):
         """
@@ -13,24 +13,37 @@ path_hooks = []
 # assumes they exist in sys.modules.
 MODULES_TO_SKIP = ["ivy.compiler", "ivy.engines"]
 
+# Modules which don't depend on the Ivy instance importing them, such that the local
+# instances compiled with `ivy.with_backend(..., shared=True)` reuse them from the
+# global Ivy, along with anything they cache, rather than executing their own copy.
+SHARED_MODULES = [
+    "ivy._version",
+    "ivy.utils.inspection",
+    "ivy.utils.backend.ast_helpers",
+]
+
 IS_COMPILING_WITH_BACKEND = False
+IS_SHARING_MODULES = False
 
 
 class LocalIvyImporter:
-    def __init__(self):
+    def __init__(self, shared=False):
         self.finder = ast_helpers.IvyPathFinder()
+        self.shared = shared
 
     def __enter__(self):
-        global IS_COMPILING_WITH_BACKEND
+        global IS_COMPILING_WITH_BACKEND, IS_SHARING_MODULES
         IS_COMPILING_WITH_BACKEND = True
+        IS_SHARING_MODULES = self.shared
         sys.meta_path.insert(0, self.finder)
         path_hooks.insert(0, self.finder)
 
     def __exit__(self, *exc):
         path_hooks.remove(self.finder)
         sys.meta_path.remove(self.finder)
-        global IS_COMPILING_WITH_BACKEND
+        global IS_COMPILING_WITH_BACKEND, IS_SHARING_MODULES
         IS_COMPILING_WITH_BACKEND = False
+        IS_SHARING_MODULES = False
 
 
 def _clear_cache():
@@ -103,7 +116,10 @@ def _import_module(name, package=None):
         path = parent_module.__spec__.submodule_search_locations
 
     # Return the one from global Ivy if the module is marked to skip
-    for module_to_skip in MODULES_TO_SKIP:
+    modules_to_skip = MODULES_TO_SKIP
+    if IS_SHARING_MODULES:
+        modules_to_skip = MODULES_TO_SKIP + SHARED_MODULES
+    for module_to_skip in modules_to_skip:
         if absolute_name.startswith(module_to_skip):
             if path is not None:
                 # Set reference to self in parent, if exist
@@ -1,12 +1,15 @@
 import ast
+import marshal
 import os
 import sys
 import traceback
 from ast import parse
 from string import Template
-from importlib.util import spec_from_file_location
+from importlib.util import spec_from_file_location, MAGIC_NUMBER
 from importlib.abc import Loader, MetaPathFinder
 
+from ivy._version import __version__
+
 
 # AST helpers ##################
 
@@ -21,6 +24,15 @@ _local_import_template = Template(
 )
 _unmodified_ivy_path = sys.modules["ivy"].__path__[0].rpartition(os.path.sep)[0]
 _compiled_modules_cache = {}
+# the transformed modules are also cached on disk for the installed version of ivy, such
+# that fresh processes don't need to transform the whole package again, and the cache
+# is disabled when this is set to None
+_bytecode_cache_dir = os.path.join(
+    os.path.expanduser("~"),
+    ".cache",
+    "ivy",
+    f"bytecode_{__version__}_{sys.implementation.cache_tag}",
+)
 
 
 def _retrive_local_modules():
@@ -255,6 +267,50 @@ class IvyPathFinder(MetaPathFinder):
         return None
 
 
+def _bytecode_cache_path(filename):
+    rel_path = os.path.relpath(filename, _unmodified_ivy_path)
+    return os.path.join(_bytecode_cache_dir, f"{rel_path}c")
+
+
+# The cached code is prefixed by the magic number of the interpreter, and by the
+# modification time and size of its source, similar to the files in __pycache__
+def _source_header(filename):
+    st = os.stat(filename)
+    return (
+        MAGIC_NUMBER
+        + (st.st_mtime_ns & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "little")
+        + (st.st_size & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "little")
+    )
+
+
+def _load_cached_bytecode(filename):
+    try:
+        header = _source_header(filename)
+        with open(_bytecode_cache_path(filename), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if data[: len(header)] != header:
+        return None
+    try:
+        return marshal.loads(data[len(header) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _cache_bytecode(filename, compiled_obj):
+    path = _bytecode_cache_path(filename)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_source_header(filename) + marshal.dumps(compiled_obj))
+        os.replace(tmp_path, path)
+    except OSError:
+        # the module is transformed again by the next process
+        pass
+
+
 class IvyLoader(Loader):
     def __init__(self, filename):
         self.filename = filename
@@ -263,17 +319,26 @@ class IvyLoader(Loader):
         if self.filename in _compiled_modules_cache:
             compiled_obj = _compiled_modules_cache[self.filename]
         else:
-            # enforce UTF-8 for compiling when installed as a package
-            # according to PEP 686
-            with open(self.filename, encoding="utf-8") as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree, local_ivy_id)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+            # the code of local ivy instances refers to the id of the instance, which
+            # is specific to the process, so it's never cached on disk
+            use_disk_cache = _bytecode_cache_dir is not None and local_ivy_id is None
+            compiled_obj = (
+                _load_cached_bytecode(self.filename) if use_disk_cache else None
+            )
+            if compiled_obj is None:
+                # enforce UTF-8 for compiling when installed as a package
+                # according to PEP 686
+                with open(self.filename, encoding="utf-8") as f:
+                    data = f.read()
+
+                ast_tree = parse(data)
+                transformer = ImportTransformer()
+                transformer.visit(ast_tree)
+                transformer.impersonate_import(ast_tree, local_ivy_id)
+                ast.fix_missing_locations(ast_tree)
+                compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+                if use_disk_cache:
+                    _cache_bytecode(self.filename, compiled_obj)
             _compiled_modules_cache[self.filename] = compiled_obj
         try:
             exec(compiled_obj, module.__dict__)
@@ -2,6 +2,9 @@
 import os
 import copy
 import types
+import asyncio
+import threading
+import contextvars
 import ivy
 import importlib
 import functools
@@ -10,7 +13,12 @@ import gc
 from ivy.utils import _importlib, verbosity
 
 # local
-from ivy.func_wrapper import _wrap_function
+from ivy.func_wrapper import (
+    _wrap_function,
+    FN_DECORATORS,
+    _backend_changed,
+    _clear_casting_unsupported_dtypes,
+)
 from ivy.utils.backend.sub_backend_handler import (
     _clear_current_sub_backends,
     fn_name_from_version_specific_fn_name,
@@ -23,6 +31,23 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+# the wrapped functions of each backend namespace, reused whenever the backend is set
+# again, keyed by (backend, namespace, function name, wrapper composition mode)
+_wrapped_backend_fns = {}
+# the names of the compositional functions added to each backend module
+_compositional_keys = {}
+# the backends set locally to the current thread or asyncio task, each along with the
+# namespace it's accessed through and the thread or task which set it
+_local_backend_stack = contextvars.ContextVar("local_backend_stack", default=())
+_local_namespaces = {}
+_num_local_backends = 0
+
+
+def _record_backend_change():
+    _backend_changed(
+        backend_stack[-1].current_backend_str() if backend_stack else "",
+        bool(_num_local_backends),
+    )
 
 
 class ContextManager:
@@ -36,6 +61,17 @@ class ContextManager:
         previous_backend()
 
 
+class LocalContextManager:
+    def __init__(self, module):
+        self.module = module
+
+    def __enter__(self):
+        return set_local_backend(self.module)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        previous_local_backend()
+
+
 _backends_subpackage_path = "ivy.functional.backends"
 _backend_dict = {}
 _backend_reverse_dict = {}
@@ -180,6 +216,10 @@ def current_backend(*args, **kwargs):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>   # noqa
     """
     global implicit_backend
+    # a backend set locally to the current thread or task has priority
+    local_stack = _local_backend_stack.get()
+    if local_stack:
+        return local_stack[-1][0]
     # if a global backend has been set with
     # set_backend then this will be returned
     if backend_stack:
@@ -199,6 +239,69 @@ def current_backend(*args, **kwargs):
     return importlib.import_module(_backend_dict[implicit_backend])
 
 
+def _wrap_and_cache_backend_function(cache_key, to_wrap, original, **kwargs):
+    wrapped = _wrap_function(cache_key[2], to_wrap, original, **kwargs)
+    _wrapped_backend_fns[cache_key] = (to_wrap, original, wrapped)
+    return wrapped
+
+
+def _lazily_wrapped_backend_function(cache_key, to_wrap, original, **kwargs):
+    """
+    Create a stub for the backend implementation `to_wrap`, which wraps it the first
+    time the stub is called and then replaces itself in the ivy namespace with the
+    wrapped function.
+    """
+    key = cache_key[2]
+    wrapped = None
+
+    @functools.wraps(to_wrap)
+    def _lazily_wrapped(*args, **kwargs_):
+        nonlocal wrapped
+        if wrapped is None:
+            wrapped = _wrap_and_cache_backend_function(
+                cache_key, to_wrap, original, **kwargs
+            )
+            for namespace in (ivy, ivy.functional):
+                if namespace.__dict__.get(key) is _lazily_wrapped:
+                    namespace.__dict__[key] = wrapped
+        return wrapped(*args, **kwargs_)
+
+    # expose the attributes of the function it will be wrapped as
+    _lazily_wrapped.__dict__.update(
+        {k: v for k, v in original.__dict__.items() if not k.startswith("_")}
+    )
+    # the stub is reused until it's replaced by the wrapped function
+    _wrapped_backend_fns[cache_key] = (to_wrap, original, _lazily_wrapped)
+    return _lazily_wrapped
+
+
+def _wrap_backend_function(backend_str, namespace, key, to_wrap, original, **kwargs):
+    """
+    Wrap the backend implementation `to_wrap` like `_wrap_function`, reusing the
+    wrapped function from when the backend was last set if neither `to_wrap`,
+    `original` nor the wrapper composition mode have changed since. In lazy wrapping
+    mode, the decorated functions of the ivy namespace which haven't been wrapped yet
+    are only wrapped once they are first called.
+    """
+    if not isinstance(to_wrap, types.FunctionType):
+        return _wrap_function(key, to_wrap, original, **kwargs)
+    composed = bool(
+        ivy.compose_wrappers_mode_stack and ivy.compose_wrappers_mode_stack[-1]
+    )
+    cache_key = (backend_str, namespace, key, composed)
+    cached = _wrapped_backend_fns.get(cache_key)
+    if cached is not None and cached[0] is to_wrap and cached[1] is original:
+        return cached[2]
+    if (
+        namespace == ivy.__name__
+        and ivy.lazy_wrapping_mode_stack
+        and ivy.lazy_wrapping_mode_stack[-1]
+        and any(attr in original.__dict__ for attr in FN_DECORATORS)
+    ):
+        return _lazily_wrapped_backend_function(cache_key, to_wrap, original, **kwargs)
+    return _wrap_and_cache_backend_function(cache_key, to_wrap, original, **kwargs)
+
+
 def _set_module_backend(
     original_dict, target, backend, invalid_dtypes=None, backend_str=None
 ):
@@ -213,8 +316,14 @@ def _set_module_backend(
                 del target.__dict__[k]
                 continue
             backend.__dict__[k] = v
-        target.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+            _compositional_keys.setdefault(backend.__name__, set()).add(k)
+        target.__dict__[k] = _wrap_backend_function(
+            backend_str,
+            target.__name__,
+            k,
+            backend.__dict__[k],
+            v,
+            compositional=compositional,
         )
         if (
             isinstance(v, types.ModuleType)
@@ -396,6 +505,7 @@ def set_backend(backend: str, dynamic: bool = False):
             ivy_original_dict = ivy.__dict__.copy()
 
         _clear_current_sub_backends()
+        _clear_casting_unsupported_dtypes()
         if isinstance(backend, str):
             temp_stack = []
             while backend_stack:
@@ -418,6 +528,7 @@ def set_backend(backend: str, dynamic: bool = False):
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
+        _record_backend_change()
         for sub_backend in ivy.available_sub_backends:
             ivy.set_sub_backend(sub_backend)
         if verbosity.level > 0:
@@ -517,6 +628,8 @@ def previous_backend():
     # if the backend stack is empty, nothing is done then we just return `None`
     if backend_stack:
         backend = backend_stack.pop(-1)  # remove last backend from the stack
+        _clear_casting_unsupported_dtypes()
+        _record_backend_change()
         if backend.current_backend_str() == "numpy":
             ivy.unset_default_device()
         elif backend.current_backend_str() == "jax":
@@ -537,7 +650,13 @@ def previous_backend():
         # to ivy namespace
         for k, v in new_backend_dict.items():
             if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
+                v = _wrap_backend_function(
+                    backend_stack[-1].current_backend_str(),
+                    ivy.__name__,
+                    k,
+                    v,
+                    ivy_original_dict[k],
+                )
             if k in ivy_original_dict:
                 ivy.__dict__[k] = v
             if k in ivy.functional.__dict__ and not k.startswith("__"):
@@ -554,6 +673,137 @@ def unset_backend():
         previous_backend()
 
 
+def _getattribute_from_local_backend(module, name):
+    local_stack = _local_backend_stack.get()
+    # the modules compiled by with_backend derive from the class of the ivy module
+    if local_stack and module is ivy:
+        namespace = local_stack[-1][1]
+        if name in namespace:
+            return namespace[name]
+    return types.ModuleType.__getattribute__(module, name)
+
+
+def _local_backend_owner():
+    # the tasks created from a task inherit its local backends without having set
+    # them, so the thread or task setting each is kept to only count it off there
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return threading.current_thread() if task is None else task
+
+
+def _local_namespace(backend):
+    """
+    Build the namespace through which the ivy module is accessed while `backend` is
+    set locally, holding the wrapped functions and the attributes of the backend.
+    """
+    backend_str = backend.current_backend_str()
+    composed = bool(
+        ivy.compose_wrappers_mode_stack and ivy.compose_wrappers_mode_stack[-1]
+    )
+    if (backend_str, composed) in _local_namespaces:
+        return _local_namespaces[(backend_str, composed)]
+    original_dict = ivy_original_dict if backend_stack else ivy.__dict__.copy()
+    set_backend_to_specific_version(backend)
+    target = types.ModuleType(ivy.__name__)
+    _set_module_backend(original_dict, target, backend)
+    compositional_keys = _compositional_keys.get(backend.__name__, ())
+    # global attributes such as the modes aren't part of the namespace, so that they
+    # keep being looked up on the ivy module itself
+    namespace = {
+        k: v
+        for k, v in target.__dict__.items()
+        if not k.startswith("__")
+        and (
+            k not in compositional_keys
+            or isinstance(original_dict[k], (types.FunctionType, types.ModuleType))
+        )
+    }
+    _local_namespaces[(backend_str, composed)] = namespace
+    return namespace
+
+
+@prevent_access_locally
+def set_local_backend(backend: str):
+    """
+    Set `backend` to be the backend of the current thread or asyncio task only.
+
+    Other threads and tasks keep using their own local backend, or the global backend
+    set with `set_backend` if they have none. Tasks created from the current one
+    inherit its local backend. While any local backend is set, attribute lookups on
+    the ivy module go through an extra context check.
+
+    Examples
+    --------
+    >>> ivy.set_backend("torch")
+    >>> ivy.set_local_backend("numpy")
+    >>> print(type(ivy.native_array([1])))
+    <class 'numpy.ndarray'>
+
+    >>> import threading
+    >>> t = threading.Thread(target=lambda: print(type(ivy.native_array([1]))))
+    >>> t.start(); t.join()
+    <class 'torch.Tensor'>
+    """
+    ivy.utils.assertions.check_false(
+        backend not in _backend_dict,
+        f"backend must be one from {list(_backend_dict.keys())}",
+    )
+    global _num_local_backends
+    backend = importlib.import_module(_backend_dict[backend])
+    with ivy.locks["backend_setter"]:
+        namespace = _local_namespace(backend)
+        if "__getattribute__" not in type(ivy).__dict__:
+            type(ivy).__getattribute__ = _getattribute_from_local_backend
+        _num_local_backends += 1
+        _record_backend_change()
+    _local_backend_stack.set(
+        _local_backend_stack.get() + ((backend, namespace, _local_backend_owner()),)
+    )
+    return ivy
+
+
+@prevent_access_locally
+def previous_local_backend():
+    """
+    Unset the backend set last with `set_local_backend` in the current thread or
+    asyncio task.
+
+    Returns
+    -------
+    ret
+        the backend that was unset, or None if there was no local backend set.
+    """
+    local_stack = _local_backend_stack.get()
+    if not local_stack:
+        return None
+    global _num_local_backends
+    _local_backend_stack.set(local_stack[:-1])
+    # a backend inherited from the task which set it stays set in that task
+    if local_stack[-1][2] is not _local_backend_owner():
+        return local_stack[-1][0]
+    with ivy.locks["backend_setter"]:
+        _num_local_backends = max(_num_local_backends - 1, 0)
+        if not _num_local_backends and "__getattribute__" in type(ivy).__dict__:
+            del type(ivy).__getattribute__
+        _record_backend_change()
+    return local_stack[-1][0]
+
+
+def local_backend(backend: str):
+    """
+    Return a context manager which sets `backend` locally to the current thread or
+    asyncio task on entering, and unsets it on exiting.
+
+    Examples
+    --------
+    >>> with ivy.local_backend("numpy"):
+    ...     x = ivy.native_array([1])
+    """
+    return LocalContextManager(backend)
+
+
 @prevent_access_locally
 def choose_random_backend(excluded=None):
     excluded = [] if excluded is None else excluded
@@ -579,12 +829,39 @@ def choose_random_backend(excluded=None):
 
 # noinspection PyProtectedMember
 @prevent_access_locally
-def with_backend(backend: str, cached: bool = True):
+def with_backend(backend: str, cached: bool = True, shared: bool = False):
+    """
+    Return a local ivy instance with `backend` set, which is isolated from the global
+    ivy and from the other local instances.
+
+    Parameters
+    ----------
+    backend
+        The backend to set in the local instance.
+    cached
+        Whether to return the last instance compiled with `backend`, if any.
+    shared
+        Whether the new instance should share the modules which don't depend on the
+        instance with the global ivy, along with the array specifications they cache,
+        and wrap the functions of its backend namespace only when they're first
+        called. This makes compiling several local instances faster and lighter.
+
+    Returns
+    -------
+    ret
+        The local ivy instance.
+    """
+    # compiling is serialised, as the local importer swaps global import state
+    with ivy.locks["backend_compiler"]:
+        return _with_backend(backend, cached, shared)
+
+
+def _with_backend(backend, cached, shared=False):
     # Use already compiled object
     if cached and backend in compiled_backends.keys():
         cached_backend = compiled_backends[backend][-1]
         return cached_backend
-    with _importlib.LocalIvyImporter():
+    with _importlib.LocalIvyImporter(shared=shared):
         ivy_pack = _importlib._import_module("ivy")
         ivy_pack._is_local_pkg = True
         ivy_pack._compiled_id = id(ivy_pack)
@@ -593,16 +870,22 @@ def with_backend(backend: str, cached: bool = True):
         )
         _handle_backend_specific_vars(ivy_pack, backend_module)
         set_backend_to_specific_version(backend_module)
+        if shared:
+            # the backend namespace is the only one bound to the instance
+            ivy_pack.lazy_wrapping_mode_stack.append(True)
         # We know for sure that the backend stack is empty
         # no need to do backend unsetting
         ivy_pack.utils.backend.handler._set_module_backend(
             ivy_pack.__dict__.copy(), ivy_pack, backend_module
         )
+        if shared:
+            ivy_pack.lazy_wrapping_mode_stack.pop()
         # TODO use a refactored code from ivy.set_backend
         for key, _ in ivy_pack.__dict__.items():
             if key in ivy_pack.functional.__dict__ and not key.startswith("__"):
                 ivy_pack.functional.__dict__[key] = ivy_pack.ivy.__dict__[key]
         ivy_pack.backend_stack.append(backend_module)
+        ivy_pack.func_wrapper._backend_changed(backend, False)
         ivy_pack.utils.backend._importlib.import_cache = copy.copy(
             _importlib.import_cache
         )
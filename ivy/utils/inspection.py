@@ -1,10 +1,16 @@
 # global
+import inspect
 from typing import get_type_hints
 
 
 # local
 import ivy
 
+# the array specifications of the functions, keyed by the code object of the function
+# they were inspected from, which is shared by the local ivy instances compiled from the
+# same source
+_array_specs = {}
+
 
 def _is_optional(typ):
     # noinspection PyBroadException
@@ -104,6 +110,17 @@ def fn_array_spec(fn):
     ret
         specification
     """
+    unwrapped = inspect.unwrap(fn)
+    code = getattr(unwrapped, "__code__", None)
+    # functions defined locally may be annotated differently by each closure
+    if code is None or "<locals>" in getattr(unwrapped, "__qualname__", "<locals>"):
+        return _fn_array_spec(fn)
+    if code not in _array_specs:
+        _array_specs[code] = _fn_array_spec(fn)
+    return _array_specs[code]
+
+
+def _fn_array_spec(fn):
     try:  # this is because it raises error if python version 3.8.0, in certain cases
         type_hints = get_type_hints(fn)
     except Exception:
@@ -118,7 +135,8 @@ def fn_array_spec(fn):
     return array_idxs
 
 
-def add_array_specs():
-    for k, v in ivy.__dict__.items():
+def add_array_specs(namespace=None):
+    namespace = ivy if namespace is None else namespace
+    for k, v in namespace.__dict__.items():
         if callable(v) and k[0].islower():
             v.array_spec = fn_array_spec(v)
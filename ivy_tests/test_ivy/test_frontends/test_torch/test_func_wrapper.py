@@ -133,6 +133,51 @@ def test_torch_outputs_to_frontend_arrays(dtype_and_x, dtype, backend_fw):
     ivy.previous_backend()
 
 
+def test_torch_outputs_to_frontend_arrays_grads_and_inplace(backend_fw):
+    ivy.set_backend(backend_fw)
+
+    # creation ops return leaves, which require grad if asked to
+    x = torch_frontend.ones(3, requires_grad=True)
+    assert x.requires_grad and x.is_leaf and x.grad_fn is None
+    y = torch_frontend.ones(3)
+    assert not y.requires_grad and y.is_leaf
+
+    # other ops on tensors requiring grad are part of the graph
+    ret = torch_frontend.add(x, y)
+    assert ret.requires_grad and not ret.is_leaf and ret.grad_fn is not None
+    ret = torch_frontend.mul(ret, 2)
+    assert ret.requires_grad and not ret.is_leaf
+    ret = torch_frontend.add(y, 1)
+    assert not ret.requires_grad and ret.is_leaf and ret.grad_fn is None
+
+    # inplace ops update and return their first input
+    x = torch_frontend.tensor([-1.0, 2.0])
+    ret = torch_frontend.nn.functional.relu(x, inplace=True)
+    assert ret is x
+    assert ivy.array_equal(x.ivy_array, ivy.array([0.0, 2.0]))
+
+    # the default dtypes of the frontend only hold during the call, even if it fails
+    def _failing_fn(*args):
+        assert ivy.default_int_dtype() == "int64"
+        raise ValueError("failing function")
+
+    try:
+        outputs_to_frontend_arrays(_failing_fn)(3)
+    except ValueError:
+        pass
+    assert ivy.default_float_dtype_stack == ivy.default_int_dtype_stack == []
+
+    # x64 is turned on again for jax, even once the default dtypes are cached
+    if backend_fw == "jax":
+        import jax
+
+        jax.config.update("jax_enable_x64", False)
+        assert torch_frontend.ones(3).dtype == "float32"
+        assert jax.config.jax_enable_x64
+
+    ivy.previous_backend()
+
+
 @given(
     dtype_and_x=helpers.dtype_and_values(
         available_dtypes=helpers.get_dtypes("valid", prune_function=False)
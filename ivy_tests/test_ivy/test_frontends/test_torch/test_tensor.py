@@ -4420,6 +4420,29 @@ def test_torch_tensor_backward(
     )
 
 
+def test_torch_tensor_backward_vjp(backend_fw):
+    ivy.set_backend(backend_fw)
+    if ivy.current_backend_str() == "paddle":
+        ivy.warnings.warn("torch.Tensor.backward() unavailable for paddle backend")
+        ivy.previous_backend()
+        return
+    x_np = np.array([[0.5, -1.0, 2.0], [1.5, 0.25, -0.5]], dtype=np.float32)
+    w_np = np.array([[1.0, 2.0], [-1.0, 0.5], [0.25, -2.0]], dtype=np.float32)
+    b_np = np.array([0.5, -0.5], dtype=np.float32)
+    x = Tensor(x_np)
+    w = Tensor(w_np, requires_grad=True)
+    b = Tensor(b_np, requires_grad=True)
+    # the bias is broadcast along the batch, and the same leaf is used twice
+    y = (x.matmul(w) + b).tanh().mean(dim=1).sum() + (b * b).sum()
+    y.backward()
+    grads = (1 - np.tanh(x_np @ w_np + b_np) ** 2) / 2
+    assert np.allclose(ivy.to_numpy(w.grad.ivy_array), x_np.T @ grads, atol=1e-5)
+    assert np.allclose(
+        ivy.to_numpy(b.grad.ivy_array), grads.sum(0) + 2 * b_np, atol=1e-5
+    )
+    ivy.previous_backend()
+
+
 @handle_frontend_method(
     class_tree=CLASS_TREE,
     init_tree="torch.tensor",
@@ -11,6 +11,7 @@ import warnings
 
 import numpy as np
 import psutil
+import pytest
 import subprocess
 from hypothesis import strategies as st, assume
 
@@ -571,6 +572,68 @@ def test_split_func_call(
         )
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    array_shape=helpers.lists(
+        x=helpers.ints(min_value=1, max_value=3),
+        min_size="num_dims",
+        max_size="num_dims",
+        size_bounds=[1, 3],
+    ),
+    dtype=helpers.get_dtypes("float", full=False),
+    num_workers=helpers.ints(min_value=1, max_value=3),
+    memory_budget=helpers.ints(min_value=1, max_value=256),
+    axis=_axis(),
+)
+def test_split_func_call_with_workers_and_memory_budget(
+    *,
+    array_shape,
+    dtype,
+    num_workers,
+    memory_budget,
+    axis,
+    backend_fw,
+):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        # inputs
+        shape = tuple(array_shape)
+        x1 = ivy_backend.asarray(np.random.uniform(size=shape).astype(dtype[0]))
+        x2 = ivy_backend.asarray(np.random.uniform(size=shape).astype(dtype[0]))
+
+        # function
+        def func(t0, t1):
+            return t0 * t1, t0 - t1
+
+        # predictions
+        kwargs = {
+            "input_axes": axis,
+            "num_workers": num_workers,
+            "memory_budget": memory_budget,
+        }
+        a, b = ivy_backend.split_func_call(func, [x1, x2], "concat", **kwargs)
+        total = ivy_backend.split_func_call(
+            lambda t0, t1: ivy_backend.sum(t0 * t1), [x1, x2], "sum", **kwargs
+        )
+
+        # true
+        a_true, b_true = func(x1, x2)
+        total_true = ivy_backend.sum(a_true)
+
+        # value test
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(a), ivy_backend.to_numpy(a_true), backend=backend_fw
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(b), ivy_backend.to_numpy(b_true), backend=backend_fw
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(total),
+            ivy_backend.to_numpy(total_true),
+            rtol=1e-3,
+            backend=backend_fw,
+        )
+
+
 @handle_test(
     fn_tree="functional.ivy.split_func_call",
     array_shape=helpers.lists(
@@ -748,6 +811,77 @@ def test_tpu_is_available(backend_fw):
         assert ivy_backend.tpu_is_available() == ground_truth
 
 
+@handle_test(fn_tree="tune_chunk_size")
+def test_tune_chunk_size(backend_fw, tmp_path):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        x = ivy_backend.random_uniform(shape=(32, 4))
+
+        def func(t):
+            return ivy_backend.tanh(t)
+
+        ivy_backend.tuned_chunk_sizes.clear()
+        chunk_size = ivy_backend.tune_chunk_size(
+            ivy_backend.tanh, [x], candidates=[4, 8, 32]
+        )
+        assert chunk_size in (4, 8, 32)
+        assert list(ivy_backend.tuned_chunk_sizes.values()) == [chunk_size]
+
+        # the tuned chunk size is used by later calls, and can be saved and reloaded
+        ret = ivy_backend.split_func_call(ivy_backend.tanh, [x], "concat")
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(ret), ivy_backend.to_numpy(func(x)), backend=backend_fw
+        )
+        path = os.path.join(tmp_path, "tuned.json")
+        ivy_backend.save_tuned_chunk_sizes(path)
+        tuned = dict(ivy_backend.tuned_chunk_sizes)
+        ivy_backend.tuned_chunk_sizes.clear()
+        ivy_backend.load_tuned_chunk_sizes(path)
+        assert ivy_backend.tuned_chunk_sizes == tuned
+
+        # local functions are told apart, and their chunk sizes aren't saved
+        ivy_backend.tuned_chunk_sizes.clear()
+        ivy_backend.tune_chunk_size(func, [x], candidates=[4, 8])
+        ivy_backend.tune_chunk_size(lambda t: func(t), [x], candidates=[4, 8])
+        assert len(ivy_backend.tuned_chunk_sizes) == 2
+        ivy_backend.save_tuned_chunk_sizes(path)
+        ivy_backend.tuned_chunk_sizes.clear()
+        ivy_backend.load_tuned_chunk_sizes(path)
+        assert not ivy_backend.tuned_chunk_sizes
+
+        # the chunk sizes running out of memory aren't chosen, while other errors are
+        # raised
+        def oom_func(t):
+            if t.shape[0] > 8:
+                raise MemoryError("out of memory")
+            return func(t)
+
+        def failing_func(t):
+            if t.shape[0] > 8:
+                raise ValueError("invalid chunk")
+            return func(t)
+
+        assert ivy_backend.tune_chunk_size(oom_func, [x], candidates=[8, 32]) == 8
+        with pytest.raises(Exception, match="invalid chunk"):
+            ivy_backend.tune_chunk_size(failing_func, [x], candidates=[8, 32])
+
+        # the chunk sizes whose calls need more memory than max_mem aren't chosen,
+        # even when the memory is released before they return
+        def mem_func(t):
+            working = ivy_backend.ones((t.shape[0], 1 << 21))
+            return t + ivy_backend.sum(working) * 0
+
+        assert (
+            ivy_backend.tune_chunk_size(mem_func, [x], candidates=[2, 32], max_mem=0.1)
+            == 2
+        )
+
+        # chunk sizes are tuned on first use when auto tuning
+        ivy_backend.tuned_chunk_sizes.clear()
+        ivy_backend.split_func_call(func, [x], "concat", auto_tune=True)
+        assert len(ivy_backend.tuned_chunk_sizes) == 1
+        ivy_backend.tuned_chunk_sizes.clear()
+
+
 @handle_test(fn_tree="used_mem_on_dev")
 def test_used_mem_on_dev(backend_fw):
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -1,6 +1,10 @@
 """Collection of tests for unified dtype functions."""
 
 # global
+import inspect
+import json
+import os
+import tempfile
 import numpy as np
 from hypothesis import strategies as st
 import typing
@@ -240,6 +244,41 @@ def test_broadcast_to(
     )
 
 
+# build_function_call_index
+@handle_test(
+    fn_tree="functional.ivy.build_function_call_index",
+    fn_name_to_index=st.sampled_from(["logit", "prelu"]),
+)
+def test_build_function_call_index(*, fn_name_to_index, backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        data_type = ivy_backend.functional.ivy.data_type
+        func = getattr(ivy.functional.ivy.experimental.activations, fn_name_to_index)
+        default_path = data_type._function_call_index_path
+        expected = ivy_backend.function_unsupported_dtypes(func)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "index.json")
+            assert (
+                ivy_backend.build_function_call_index([func, _composition_1], path=path)
+                >= 1
+            )
+            with open(path) as f:
+                index = json.load(f)
+            # the recursive queries read the calls from the index
+            ret = ivy_backend.function_unsupported_dtypes(func)
+        assert data_type._function_call_index_path == default_path
+        assert index["version"] == ivy.__version__
+        entry = index["functions"][f"{func.__module__}:{func.__qualname__}"]
+        code = inspect.unwrap(func).__code__
+        assert entry["stamp"][0] == code.co_filename
+        assert entry["stamp"][2] == code.co_firstlineno
+        assert entry["calls"] == data_type._parse_function_calls(func)
+        # only the functions of ivy are indexed
+        assert not any(
+            key.startswith(_composition_1.__module__) for key in index["functions"]
+        )
+        assert set(ret) == set(expected)
+
+
 # can_cast
 @handle_test(
     fn_tree="functional.ivy.can_cast",
@@ -523,6 +523,49 @@ def test_optimizer_update(
     )
 
 
+@pytest.mark.parametrize(
+    "update",
+    [
+        lambda ivy, w, dcdw, mw, vw: ivy.gradient_descent_update(w, dcdw, 0.1),
+        lambda ivy, w, dcdw, mw, vw: ivy.adam_update(w, dcdw, 0.1, mw, vw, 2),
+        lambda ivy, w, dcdw, mw, vw: ivy.lars_update(w, dcdw, 0.1, decay_lambda=0.1),
+        lambda ivy, w, dcdw, mw, vw: ivy.lamb_update(
+            w, dcdw, 0.1, mw, vw, 2, decay_lambda=0.1
+        ),
+    ],
+)
+def test_optimizer_update_packed(update, backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        values = np.random.default_rng(0).uniform(0.1, 1, (4, 10)).astype("float32")
+
+        def params(x):
+            return ivy_backend.Container(
+                {
+                    "a": ivy_backend.array(x[:6].reshape((2, 3))),
+                    "b": {
+                        "c": ivy_backend.array(x[6:7].reshape(())),
+                        "d": ivy_backend.array(x[7:]),
+                    },
+                }
+            )
+
+        w, dcdw, mw, vw = (params(x) for x in values)
+        ret = update(ivy_backend, w, dcdw, mw, vw)
+        packed = w.cont_pack()
+        ret_packed = update(ivy_backend, packed, dcdw, mw, vw)
+        rets = ret if isinstance(ret, tuple) else (ret,)
+        rets_packed = ret_packed if isinstance(ret_packed, tuple) else (ret_packed,)
+        for ret, ret_packed in zip(rets, rets_packed):
+            assert ret_packed.cont_is_packed
+            for x, x_packed in zip(
+                ret.cont_to_flat_list(), ret_packed.cont_to_flat_list()
+            ):
+                assert x.shape == x_packed.shape
+                assert np.allclose(
+                    ivy_backend.to_numpy(x), ivy_backend.to_numpy(x_packed), rtol=1e-5
+                )
+
+
 # stop_gradient
 @handle_test(
     fn_tree="functional.ivy.stop_gradient",
@@ -323,6 +323,24 @@ def test_nested_map(x, fn, shallow):
         assert x != x_copy
 
 
+@pytest.mark.parametrize("shallow", [True, False])
+def test_nested_map_cached_plan(shallow):
+    def nest(a):
+        return {"a": [[a, 1], (a, 3)], "b": {"c": [[a], [1]]}, "d": slice(a, 2)}
+
+    fn = lambda x: x * 2 if isinstance(x, int) else x  # noqa: E731
+    for a in range(3):
+        x = nest(a)
+        result = ivy.nested_map(fn, x, shallow=shallow, cache_plan=True)
+        assert result == ivy.nested_map(fn, nest(a), shallow=shallow)
+        assert (x == result) == shallow
+    # nests with a different structure or leaf types don't follow the cached plan
+    x = {"a": [[0, 1, 2], (0, 3)], "b": {"c": [[0.5], [1]]}, "d": slice(0, 2)}
+    result = ivy.nested_map(fn, x, shallow=shallow, cache_plan=True)
+    expected = {"a": [[0, 2, 4], (0, 6)], "b": {"c": [[0.5], [2]]}, "d": slice(0, 4)}
+    assert result == expected
+
+
 # nested_multi_map
 @pytest.mark.parametrize("func", [lambda x, _: x[0] - x[1]])
 @pytest.mark.parametrize(
@@ -5,7 +5,7 @@ import numpy as np
 # local
 import ivy
 import ivy_tests.test_ivy.helpers as helpers
-from ivy_tests.test_ivy.helpers import handle_test
+from ivy_tests.test_ivy.helpers import handle_test, BackendHandler
 
 
 # --- Helpers --- #
@@ -822,6 +822,15 @@ def test_unsorted_segment_sum(
     )
 
 
+def test_unsorted_segment_sum_negative_segment_ids(backend_fw):
+    # the elements with negative segment ids are dropped
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        ret = ivy_backend.unsorted_segment_sum(
+            ivy_backend.array([1.0, 2.0, 4.0]), ivy_backend.array([0, -1, 1]), 2
+        )
+        assert np.allclose(ivy_backend.to_numpy(ret), np.array([1.0, 4.0]))
+
+
 # vorbis_window
 @handle_test(
     fn_tree="functional.ivy.experimental.vorbis_window",
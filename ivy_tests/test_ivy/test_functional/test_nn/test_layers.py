@@ -4,6 +4,7 @@
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
+import pytest
 
 
 # local
@@ -27,6 +28,15 @@ def _assume_tf_dilation_gt_1(backend_fw, on_device, dilations):
         )
 
 
+@st.composite
+def _batched_nms_helper(draw):
+    boxes, scores, iou_threshold, max_output_size, score_threshold = draw(_nms_helper())
+    idxs = np.array(
+        draw(st.lists(st.integers(0, 3), min_size=len(boxes), max_size=len(boxes)))
+    )
+    return boxes, scores, idxs, iou_threshold, max_output_size, score_threshold
+
+
 # Dropout #
 # --------#
 
@@ -673,6 +683,36 @@ def _x_and_scaled_attention(draw, dtypes):
 # ------------ #
 
 
+@handle_test(
+    fn_tree="functional.ivy.batched_nms",
+    inputs=_batched_nms_helper(),
+    test_instance_method=st.just(False),
+    test_with_out=st.just(False),
+)
+def test_batched_nms(
+    *,
+    inputs,
+    test_flags,
+    backend_fw,
+    fn_name,
+    on_device,
+):
+    boxes, scores, idxs, iou_threshold, max_output_size, score_threshold = inputs
+    helpers.test_function(
+        input_dtypes=[ivy.float32, ivy.float32, ivy.int64],
+        test_flags=test_flags,
+        backend_to_test=backend_fw,
+        fn_name=fn_name,
+        on_device=on_device,
+        boxes=boxes,
+        scores=scores,
+        idxs=idxs,
+        iou_threshold=iou_threshold,
+        max_output_size=max_output_size,
+        score_threshold=score_threshold,
+    )
+
+
 # conv
 @handle_test(
     fn_tree="functional.ivy.conv",
@@ -1225,6 +1265,65 @@ def test_lstm_update(*, dtype_lstm, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+@pytest.mark.parametrize("batch_shape", [(), (3,), (2, 3)])
+@pytest.mark.parametrize("with_bias", [True, False])
+@pytest.mark.parametrize("with_recurrent_bias", [True, False])
+def test_lstm_update_backend(
+    batch_shape, with_bias, with_recurrent_bias, backend_fw, monkeypatch
+):
+    ivy.set_backend(backend_fw)
+    timesteps, in_channels, out_channels = 4, 3, 5
+    x = ivy.random_uniform(
+        low=-1.0, high=1.0, shape=batch_shape + (timesteps, in_channels)
+    )
+    init_h = ivy.random_uniform(low=-1.0, high=1.0, shape=batch_shape + (out_channels,))
+    init_c = ivy.random_uniform(low=-1.0, high=1.0, shape=batch_shape + (out_channels,))
+    kernel = ivy.random_uniform(
+        low=-1.0, high=1.0, shape=(in_channels, 4 * out_channels)
+    )
+    recurrent_kernel = ivy.random_uniform(
+        low=-1.0, high=1.0, shape=(out_channels, 4 * out_channels)
+    )
+    bias = ivy.random_uniform(shape=(4 * out_channels,)) if with_bias else None
+    recurrent_bias = (
+        ivy.random_uniform(shape=(4 * out_channels,)) if with_recurrent_bias else None
+    )
+    args = (x, init_h, init_c, kernel, recurrent_kernel)
+    kwargs = dict(bias=bias, recurrent_bias=recurrent_bias)
+    # the backend implementation matches the compositional one
+    hts, ct = ivy.lstm_update(*args, **kwargs)
+    expected_hts, expected_ct = ivy.functional.ivy.layers.lstm_update(*args, **kwargs)
+    assert hts.shape == batch_shape + (timesteps, out_channels)
+    assert ct.shape == batch_shape + (out_channels,)
+    helpers.assert_all_close(
+        ivy.to_numpy(hts), ivy.to_numpy(expected_hts), atol=1e-5, backend=backend_fw
+    )
+    helpers.assert_all_close(
+        ivy.to_numpy(ct), ivy.to_numpy(expected_ct), atol=1e-5, backend=backend_fw
+    )
+    # integer inputs are still handled by the compositional implementation, which
+    # the partial mixed wrapper looks up on the function it wraps
+    backend_fn = ivy.lstm_update
+    while backend_fn.__code__.co_name != "_handle_partial_mixed_function":
+        backend_fn = backend_fn.__wrapped__
+    backend_fn = backend_fn.__wrapped__
+    if hasattr(backend_fn, "partial_mixed_handler"):
+        compos_calls = []
+
+        def compos(*args, **kwargs):
+            compos_calls.append(args)
+            return compos_fn(*args, **kwargs)
+
+        compos_fn = backend_fn.compos
+        monkeypatch.setattr(backend_fn, "compos", compos)
+        int_args = [ivy.astype(arg * 4, "int32") for arg in args]
+        ivy.lstm_update(*int_args)
+        assert len(compos_calls) == 1
+        ivy.lstm_update(*args)
+        assert len(compos_calls) == 1
+    ivy.previous_backend()
+
+
 # multi_head_attention
 @handle_test(
     fn_tree="functional.ivy.multi_head_attention",
@@ -1324,6 +1423,34 @@ def test_nms(
     )
 
 
+@pytest.mark.parametrize("num_boxes", [1, 7, 30])
+def test_nms_tiled(num_boxes, backend_fw, monkeypatch):
+    ivy.set_backend(backend_fw)
+    xy = ivy.random_uniform(high=20.0, shape=(num_boxes, 2))
+    boxes = ivy.concat(
+        [xy, xy + ivy.random_uniform(low=1.0, high=10.0, shape=(num_boxes, 2))],
+        axis=1,
+    )
+    scores = ivy.random_uniform(shape=(num_boxes,))
+    expected = ivy.nms(boxes, scores, 0.3)
+    # suppress the boxes in tiles of 3
+    monkeypatch.setattr(ivy.functional.ivy.layers, "_nms_tile_size", 3)
+    ret = ivy.nms(boxes, scores, 0.3)
+    assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    # the boxes of different categories don't suppress each other
+    idxs = ivy.arange(num_boxes) % 2
+    ret = ivy.batched_nms(boxes, scores, idxs, iou_threshold=0.3)
+    expected = ivy.concat(
+        [
+            ivy.nonzero(idxs == i)[0][ivy.nms(boxes[idxs == i], scores[idxs == i], 0.3)]
+            for i in range(2)
+        ]
+    )
+    expected = expected[ivy.argsort(-1 * scores[expected], stable=True)]
+    assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    ivy.previous_backend()
+
+
 # scaled_dot_product_attention
 @handle_test(
     fn_tree="functional.ivy.scaled_dot_product_attention",
@@ -1368,3 +1495,31 @@ def test_scaled_dot_product_attention(
         is_causal=is_causal,
         training=training,
     )
+
+
+@pytest.mark.parametrize(
+    ("num_queries", "num_keys", "is_causal", "with_mask"),
+    [
+        (7, 7, False, False),
+        (7, 7, True, False),
+        (5, 9, True, False),
+        (7, 10, False, True),
+    ],
+)
+def test_scaled_dot_product_attention_blockwise(
+    num_queries, num_keys, is_causal, with_mask, backend_fw, monkeypatch
+):
+    ivy.set_backend(backend_fw)
+    query = ivy.random_uniform(shape=(2, num_queries, 4))
+    key = ivy.random_uniform(shape=(2, num_keys, 4))
+    value = ivy.random_uniform(shape=(2, num_keys, 3))
+    mask = (
+        ivy.random_uniform(shape=(num_queries, num_keys)) > 0.3 if with_mask else None
+    )
+    kwargs = {"scale": 0.5, "mask": mask, "is_causal": is_causal}
+    expected = ivy.scaled_dot_product_attention(query, key, value, **kwargs)
+    # attend the keys and values in blocks of 3
+    monkeypatch.setattr(ivy.functional.ivy.layers, "_attention_block_size", 3)
+    ret = ivy.scaled_dot_product_attention(query, key, value, **kwargs)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-5)
+    ivy.previous_backend()
@@ -1,4 +1,6 @@
 # global
+import asyncio
+import threading
 from packaging import version
 import pytest
 import importlib
@@ -204,6 +206,121 @@ def test_previous_backend(backend):
     ivy.utils.assertions.check_equal(ivy.current_backend_str(), backend, as_array=False)
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_reuse_wrapped_backend_functions(backend):
+    ivy.set_backend(backend)
+    wrapped_add = ivy.add
+    ivy.previous_backend()
+    # setting the backend again reuses the functions wrapped the first time
+    ivy.set_backend(backend)
+    assert ivy.add is wrapped_add
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    assert ivy.add is wrapped_add
+    # changing how the functions are wrapped rebuilds them
+    ivy.set_compose_wrappers_mode(True)
+    assert ivy.add is not wrapped_add
+    ivy.unset_compose_wrappers_mode()
+    assert ivy.add is wrapped_add
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_lazy_wrapping(backend):
+    ivy.unset_backend()
+    ivy.utils.backend.handler._wrapped_backend_fns.clear()
+    ivy.set_lazy_wrapping_mode(True)
+    ivy.set_backend(backend)
+    stub = ivy.add
+    assert stub.__code__.co_name == "_lazily_wrapped"
+    assert hasattr(stub, "handle_nestable")
+    x = ivy.array([1.0, 2.0])
+    assert ivy.array_equal(stub(x, x), ivy.array([2.0, 4.0]))
+    # the stub replaces itself with the wrapped function once it has been called
+    assert ivy.add is not stub and ivy.functional.add is ivy.add
+    assert ivy.add.__code__.co_name != "_lazily_wrapped"
+    assert ivy.array_equal(stub(x, x), ivy.add(x, x))
+    ivy.previous_backend()
+    ivy.unset_lazy_wrapping_mode()
+
+
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_set_local_backend(backend):
+    ivy.unset_backend()
+    backends_seen = {}
+
+    def _thread_fn(name, local):
+        if local:
+            ivy.set_local_backend(backend)
+        backends_seen[name] = ivy.current_backend_str()
+        if local:
+            x = ivy.array([1.0, 2.0])
+            backends_seen[name + "_add"] = ivy.to_numpy(ivy.add(x, x)).tolist()
+            ivy.previous_local_backend()
+
+    threads = [
+        threading.Thread(target=_thread_fn, args=("local", True)),
+        threading.Thread(target=_thread_fn, args=("global", False)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backends_seen["local"] == backend
+    assert backends_seen["local_add"] == [2.0, 4.0]
+    assert backends_seen["global"] == ""
+
+    async def _task_fn(local):
+        if local:
+            ivy.set_local_backend(backend)
+        await asyncio.sleep(0)
+        backend_str = ivy.current_backend_str()
+        if local:
+            ivy.previous_local_backend()
+        return backend_str
+
+    async def _main():
+        return await asyncio.gather(_task_fn(True), _task_fn(False))
+
+    assert asyncio.run(_main()) == [backend, ""]
+    assert ivy.current_backend_str() == ""
+    with ivy.local_backend(backend):
+        assert ivy.current_backend_str() == backend
+        assert ivy.current_backend() is importlib.import_module(_backend_dict[backend])
+    assert ivy.current_backend_str() == ""
+    assert "__getattribute__" not in type(ivy).__dict__
+
+
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_set_local_backend_inherited_by_task(backend):
+    ivy.unset_backend()
+
+    async def _child_fn():
+        # the child task inherits the local backend of its parent, and unsetting it
+        # only unsets it in the child
+        assert ivy.current_backend_str() == backend
+        assert ivy.previous_local_backend() is not None
+        assert ivy.previous_local_backend() is None
+        return ivy.current_backend_str()
+
+    async def _parent_fn():
+        ivy.set_local_backend(backend)
+        child_backend_str = await asyncio.create_task(_child_fn())
+        assert "__getattribute__" in type(ivy).__dict__
+        backend_str = ivy.current_backend_str()
+        ivy.previous_local_backend()
+        return child_backend_str, backend_str
+
+    assert asyncio.run(_parent_fn()) == ("", backend)
+    assert ivy.current_backend_str() == ""
+    assert "__getattribute__" not in type(ivy).__dict__
+    # the hook is set again by the next local backend
+    with ivy.local_backend(backend):
+        assert ivy.current_backend_str() == backend
+        assert "__getattribute__" in type(ivy).__dict__
+    assert "__getattribute__" not in type(ivy).__dict__
+
+
 @pytest.mark.parametrize(
     (
         "backend",
@@ -212,6 +329,8 @@ def test_previous_backend(backend):
     available_array_types_class,
 )
 def test_set_backend(backend, array_type):
+    # the wrapped functions are reused when the same backend is set again
+    ivy.unset_backend()
     # recording data before backend change
     stack_before = []
     func_address_before = id(ivy.sum)
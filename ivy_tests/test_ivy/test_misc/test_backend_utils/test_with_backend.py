@@ -1,4 +1,6 @@
 # Global
+import os
+import types
 import pytest
 import itertools
 from hypothesis import strategies as st, given, settings, HealthCheck
@@ -6,6 +8,8 @@ from hypothesis import strategies as st, given, settings, HealthCheck
 # Local
 import ivy
 import numpy as np
+from ivy.utils import _importlib
+from ivy.utils.backend import ast_helpers
 from ivy.utils.backend.handler import _backend_dict
 
 
@@ -62,3 +66,53 @@ def test_with_backend_cached(backend_fw):
     non_cached_local_ivy = ivy.with_backend(backend_fw)
     cached_local_ivy = ivy.with_backend(backend_fw)
     assert non_cached_local_ivy == cached_local_ivy
+
+
+def test_with_backend_bytecode_cache(backend_fw, tmp_path, monkeypatch):
+    monkeypatch.setattr(ast_helpers, "_bytecode_cache_dir", str(tmp_path))
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache", {})
+    monkeypatch.setattr(_importlib, "import_cache", {})
+    ivy.with_backend(backend_fw, cached=False)
+    init_file = os.path.join(ast_helpers._unmodified_ivy_path, "ivy", "__init__.py")
+    assert os.path.exists(os.path.join(tmp_path, "ivy", "__init__.pyc"))
+
+    # a fresh process loads the transformed modules from the disk cache
+    def _parse(*args, **kwargs):
+        raise AssertionError("module transformed again")
+
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache", {})
+    monkeypatch.setattr(_importlib, "import_cache", {})
+    monkeypatch.setattr(ast_helpers, "parse", _parse)
+    local_ivy = ivy.with_backend(backend_fw, cached=False)
+    assert np.allclose(local_ivy.to_numpy(local_ivy.array([1, 2])), [1, 2])
+
+    # the cached code is invalidated once its source is modified, which is seen
+    # through its modification time rather than by touching the installed source
+    assert ast_helpers._load_cached_bytecode(init_file) is not None
+    stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        st = stat(path, *args, **kwargs)
+        if path != init_file:
+            return st
+        return types.SimpleNamespace(st_mtime_ns=st.st_mtime_ns + 1, st_size=st.st_size)
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "stat", _stat)
+        assert ast_helpers._load_cached_bytecode(init_file) is None
+    assert ast_helpers._load_cached_bytecode(init_file) is not None
+
+
+def test_with_backend_shared(backend_fw):
+    local_ivy = ivy.with_backend(backend_fw, cached=False)
+    shared_ivy = ivy.with_backend(backend_fw, cached=False, shared=True)
+    # the modules which don't depend on the instance are shared with the global ivy
+    assert shared_ivy.utils.inspection is ivy.utils.inspection
+    assert local_ivy.utils.inspection is not ivy.utils.inspection
+    assert shared_ivy.add is not local_ivy.add and shared_ivy.Array is not ivy.Array
+    x = shared_ivy.array([1.0, 2.0])
+    assert np.allclose(shared_ivy.to_numpy(shared_ivy.add(x, x)), [2.0, 4.0])
+    cont = shared_ivy.Container(a=x, b={"c": x})
+    assert np.allclose(shared_ivy.to_numpy(cont.abs().b.c), [1.0, 2.0])
+    assert shared_ivy.add.array_spec == local_ivy.add.array_spec
+    assert shared_ivy.current_backend_str() == backend_fw
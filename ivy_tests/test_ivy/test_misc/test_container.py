@@ -1506,6 +1506,31 @@ def test_container_inplace(on_device):
             assert og_ids == op_ids  # value ids
 
 
+def test_container_key_chain_index(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device), "d": Container()},
+        }
+    )
+    assert container.cont_all_key_chains() == ["a", "b/c"]
+    assert container.cont_all_key_chains(include_empty=True) == ["a", "b/c", "b/d"]
+    assert container.cont_has_key_chain("b.c")
+    assert not container.cont_has_key_chain("b/e")
+    # changes to the sub-containers update the key-chains of the container
+    sub_container = container.b
+    sub_container["e"] = ivy.array([3], device=on_device)
+    container.b.d["f"] = ivy.array([4], device=on_device)
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d/f", "b/e"]
+    assert np.allclose(ivy.to_numpy(container["b/e"]), np.array([3]))
+    del sub_container["c"]
+    container.b.d.pop("f")
+    container.cont_set_at_key_chain("g/h", ivy.array([5], device=on_device), True)
+    assert container.cont_all_key_chains() == ["a", "b/e", "g/h"]
+    assert not container.cont_has_key_chain("b/c")
+    assert container.cont_at_key_chain("b/c", ignore_key_errors=True) is None
+
+
 @pytest.mark.parametrize("include_empty", [True, False])
 def test_container_key_chains_containing(include_empty, on_device):
     a_val = Container() if include_empty else ivy.array([1], device=on_device)
@@ -1904,6 +1929,50 @@ def test_container_overwrite_at_key_chains(on_device):
     assert exception_raised
 
 
+def test_container_pack(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([[3.0], [4.0]], device=on_device),
+                "d": ivy.array([5, 6], device=on_device),
+                "e": Container(),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    assert packed.cont_is_packed
+    assert not container.cont_is_packed
+    assert packed.cont_all_key_chains(include_empty=True) == ["a", "b/c", "b/d", "b/e"]
+    assert [buffer.shape for buffer in packed.cont_packed_buffers] == [(4,), (2,)]
+    assert np.allclose(ivy.to_numpy(packed.b.c), np.array([[3.0], [4.0]]))
+    segment_ids = [ivy.to_numpy(ids) for ids, _ in packed.cont_packed_segment_ids]
+    assert np.array_equal(segment_ids[0], np.array([0, 0, 1, 1]))
+    # elementwise operations run on the buffers and keep the layout
+    ret = -(((packed + packed) * 2 - 1) ** 2) / 2
+    assert ret.cont_is_packed
+    assert ret.cont_packed_segment_ids is packed.cont_packed_segment_ids
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[-60.5], [-112.5]]))
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([-180.5, -264.5]))
+    # containers with the same leaves can be packed alike
+    other = packed.cont_map(lambda x, _: x + 1).cont_pack(like=packed)
+    assert other.cont_pack(like=packed) is other
+    assert (other - packed).cont_is_packed
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        container.cont_prune_key_chain("a").cont_pack(like=packed)
+    # changing the container or any of its sub-containers drops the packing
+    packed.b["d"] = ivy.array([7, 8], device=on_device)
+    assert not packed.cont_is_packed
+    assert not (packed * 2).cont_is_packed
+    assert np.allclose(ivy.to_numpy((packed * 2).b.d), np.array([14, 16]))
+    # so does replacing the data of a leaf, as ivy.inplace_update does on the
+    # backends without views
+    packed = container.cont_pack()
+    packed.a.data = ivy.to_native(ivy.array([7.0, 7.0], device=on_device))
+    assert not packed.cont_is_packed
+    assert np.allclose(ivy.to_numpy((packed * 2).a), np.array([14.0, 14.0]))
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2047,6 +2116,10 @@ def test_container_prune_key_chains(on_device):
     assert _test_a_exception(container_pruned)
     assert _test_bc_exception(container_pruned)
 
+    # key-chains continuing pruned ones, and empty sub-containers left, are pruned
+    container_pruned = container.cont_prune_key_chains(["b/c", "b/d", "b", "a/e"])
+    assert list(container_pruned.keys()) == ["a"]
+
 
 def test_container_prune_key_from_key_chains(on_device):
     container = Container(
@@ -2970,6 +3043,76 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_hdf5_lazily(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazily.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(8, dtype=np.float32), device=on_device),
+            "b": {"c": ivy.array(np.ones((8, 2), dtype=np.int32), device=on_device)},
+        }
+    )
+
+    # saving with compression
+    container.cont_to_disk_as_hdf5(save_filepath, chunks=4, compression="gzip")
+    assert os.path.exists(save_filepath)
+
+    # the shapes and dtypes are known before the data is read
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(2, 6), lazy=True
+    )
+    assert not loaded_container.a.is_loaded
+    assert loaded_container.b.c.shape == (4, 2)
+    assert loaded_container.b.c.dtype == "int32"
+    assert not loaded_container.b.c.is_loaded
+
+    # the data is read on first use
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a[2:6])
+    )
+    assert loaded_container.a.is_loaded
+    # the array is initialized as any other once loaded
+    assert (
+        loaded_container.a._backend_generation == ivy.func_wrapper._backend_generation
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c + 1), ivy.to_numpy(container.b.c[2:6] + 1)
+    )
+
+    del loaded_container
+    os.remove(save_filepath)
+
+
+def test_container_to_disk_as_hdf5_chunks(on_device):
+    h5py = pytest.importorskip("h5py")
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_chunks.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(8, dtype=np.float32), device=on_device),
+            "b": {"c": ivy.array(np.ones((8, 2), dtype=np.int32), device=on_device)},
+        }
+    )
+
+    # the datasets are stored contiguously, or in chunks guessed by h5py
+    for chunks in (False, None, True):
+        container.cont_to_disk_as_hdf5(save_filepath, chunks=chunks)
+        with h5py.File(save_filepath, "r") as h5_obj:
+            if chunks is False:
+                assert h5_obj["a"].chunks is None
+            else:
+                assert h5_obj["a"].chunks is not None
+        loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+        )
+        os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2991,6 +3134,104 @@ def test_container_to_and_from_disk_as_json(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_mmap(on_device):
+    save_filepath = "container_on_disk.ivy"
+    dict_in = {
+        "a": ivy.array(np.arange(6, dtype=np.float32).reshape(2, 3), device=on_device),
+        "b": {
+            "c": ivy.array([1, 2, 3], dtype="int16", device=on_device),
+            "d": ivy.array(4.0, device=on_device),
+            "e": "string",
+        },
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_save(save_filepath, format="mmap")
+    assert os.path.exists(save_filepath)
+
+    # loading lazily
+    loaded_container = Container.cont_load(save_filepath, format="mmap")
+    assert not loaded_container.a.is_loaded
+    assert loaded_container.a.shape == (2, 3)
+    assert loaded_container.b.c.dtype == "int16"
+    assert loaded_container.b.e == "string"
+    for key_chain, value in container.cont_to_iterator():
+        if ivy.is_array(value):
+            loaded_value = loaded_container.cont_at_key_chain(key_chain)
+            assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+            assert loaded_value.shape == value.shape
+    assert loaded_container.a.is_loaded
+
+    # loading eagerly
+    loaded_container = Container.cont_from_disk_as_mmap(save_filepath, lazy=False)
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+
+    del loaded_container
+    os.remove(save_filepath)
+
+
+def test_container_to_and_from_disk_as_mmap_keeps_keys(on_device):
+    save_filepath = "container_on_disk_keys.ivy"
+    container = Container(
+        {
+            "z": ivy.array([1.0, 2.0], device=on_device),
+            "f": Container(),
+            "b": {"y": "string", "a": ivy.array(3, device=on_device)},
+        },
+        alphabetical_keys=False,
+    )
+    container.cont_to_disk_as_mmap(save_filepath)
+
+    # the empty sub-containers and the key order survive the round trip
+    loaded_container = Container.cont_from_disk_as_mmap(
+        save_filepath, alphabetical_keys=False
+    )
+    assert loaded_container.cont_all_key_chains(
+        include_empty=True
+    ) == container.cont_all_key_chains(include_empty=True)
+
+    del loaded_container
+    os.remove(save_filepath)
+
+
+def test_container_from_disk_lazily_with_ivyh(on_device, backend_fw):
+    if backend_fw == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    ivyh = ivy.with_backend(backend_fw)
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3, 4, 5], dtype="int32", device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_mmap("container_on_disk_with_ivyh.ivy")
+    container.cont_to_disk_as_hdf5("container_on_disk_with_ivyh.hdf5")
+
+    for loaded_container in [
+        Container.cont_from_disk_as_mmap(
+            "container_on_disk_with_ivyh.ivy", lazy=True, ivyh=ivyh
+        ),
+        Container.cont_from_disk_as_hdf5(
+            "container_on_disk_with_ivyh.hdf5", lazy=True, ivyh=ivyh
+        ),
+    ]:
+        # the lazily loaded arrays are arrays of the ivy handle
+        assert isinstance(loaded_container.a, ivyh.Array)
+        assert not loaded_container.a.is_loaded
+        assert loaded_container.b.c.shape == (3,)
+        assert float(ivyh.to_numpy(ivyh.sum(loaded_container.a))) == 3.0
+        assert int(ivyh.to_numpy(ivyh.sum(loaded_container.b.c))) == 12
+        assert loaded_container.a.is_loaded
+        del loaded_container
+
+    os.remove("container_on_disk_with_ivyh.ivy")
+    os.remove("container_on_disk_with_ivyh.hdf5")
+
+
 def test_container_to_and_from_disk_as_pickled(on_device):
     save_filepath = "container_on_disk.pickled"
     dict_in = {
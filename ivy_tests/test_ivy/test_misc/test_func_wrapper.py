@@ -71,6 +71,48 @@ def test_handle_array_like_without_promotion(fn, x, expected_type, backend_fw):
     ivy.previous_backend()
 
 
+def test_handle_backend_invalid(backend_fw, monkeypatch):
+    monkeypatch.setattr(ivy.func_wrapper, "_array_backends", dict())
+    monkeypatch.setattr(ivy.func_wrapper, "_array_refs", dict())
+    mixed_backend_arrays = ivy.func_wrapper._mixed_backend_arrays
+    ivy.unset_backend()
+    # arrays created before the backend was set have their backend checked while
+    # they exist
+    y = ivy.array([3.0])
+    ivy.set_backend(backend_fw)
+    try:
+        assert ivy.func_wrapper._mixed_backend_arrays
+        del y
+        assert not ivy.func_wrapper._mixed_backend_arrays
+        checked = []
+
+        def _check_array_backend(x):
+            checked.append(x)
+            return x
+
+        monkeypatch.setattr(
+            ivy.func_wrapper, "_check_array_backend", _check_array_backend
+        )
+        fn = ivy.func_wrapper.handle_backend_invalid(lambda x: x)
+        x = ivy.array([1.0, 2.0])
+        assert x._backend_generation == ivy.func_wrapper._backend_generation
+        # only arrays of the current backend exist, so the arguments aren't traversed
+        assert not ivy.func_wrapper._mixed_backend_arrays
+        fn([x, {"a": x}])
+        assert not checked
+        # while arrays of another backend exist, every array is checked
+        y = ivy.array([3.0])
+        y._backend_ref = ivy.func_wrapper._register_array(y, "other", y._backend_ref)
+        assert ivy.func_wrapper._mixed_backend_arrays
+        fn([x, {"a": x}])
+        assert len(checked) == 2
+        del y
+        assert not ivy.func_wrapper._mixed_backend_arrays
+    finally:
+        ivy.previous_backend()
+        ivy.func_wrapper._mixed_backend_arrays = mixed_backend_arrays
+
+
 @pytest.mark.parametrize(
     ("x", "mode", "jax_like", "expected"),
     [
@@ -124,6 +166,75 @@ def test_handle_complex_input(x, mode, jax_like, expected, backend_fw):
     ivy.previous_backend()
 
 
+def test_handle_nans(backend_fw):
+    ivy.set_backend(backend_fw)
+    fn = ivy.func_wrapper.handle_nans(lambda *args, **kwargs: args)
+    nan = float("nan")
+    ivy.set_nan_policy("raise_exception")
+    try:
+        # integer and bool arrays are skipped, and python nans are caught
+        fn(ivy.array([1.0, 2.0]), ivy.array([1, 2]), y=[True, 2.0])
+        for x in [
+            ivy.array([1.0, nan]),
+            ivy.array([1.0, nan]).data,
+            ivy.Container(a=ivy.array([nan])),
+            nan,
+        ]:
+            with pytest.raises(ivy.utils.exceptions.IvyException):
+                fn(ivy.array([1.0]), x=x)
+        # arrays of several dtypes are checked together
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            fn(
+                ivy.array([1.0, 2.0], dtype="float32"),
+                ivy.array([[3.0], [4.0]], dtype="float32"),
+                ivy.array([nan], dtype="float64"),
+                ivy.array([1 + 1j]),
+            )
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            fn(ivy.array([1.0]), ivy.array([complex(1.0, nan)]))
+        # only every nth call of each function is checked with a nan check interval,
+        # whichever functions are called in between
+        other_fn = ivy.func_wrapper.handle_nans(lambda *args, **kwargs: args)
+        ivy.set_nan_check_interval(3)
+        raised = 0
+        for _ in range(6):
+            try:
+                fn(ivy.array([nan]))
+            except ivy.utils.exceptions.IvyException:
+                raised += 1
+            other_fn(ivy.array([1.0]))
+        assert raised == 2
+    finally:
+        ivy.unset_nan_check_interval()
+        ivy.unset_nan_policy()
+        ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "has_containers"),
+    [
+        ((1.0, "a"), {"axis": 0}, False),
+        (([1.0, (2.0, {"a": 3.0})],), {"y": {"b": [4.0]}}, False),
+        ((ivy.Container(a=1.0),), {}, True),
+        (([1.0, (2.0, {"a": ivy.Container(a=1.0)})],), {}, True),
+        ((1.0,), {"y": {"b": [ivy.Container(a=1.0)]}}, True),
+    ],
+)
+def test_handle_nestable(args, kwargs, has_containers, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0])
+    args = (x, *args)
+    with patch.object(
+        ivy.Container, "cont_multi_map_in_function", return_value="cont_fn"
+    ):
+        # the container's version of the function is resolved at wrap time
+        fn = ivy.func_wrapper.handle_nestable(lambda *args, **kwargs: "fn")
+    ret = fn(*args, **kwargs)
+    assert isinstance(ret, str)
+    assert ret == ("cont_fn" if has_containers else "fn")
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     ("x", "weight", "expected"),
     [
@@ -173,6 +284,58 @@ def test_outputs_to_ivy_arrays(backend_fw):
     ivy.previous_backend()
 
 
+def test_cached_argument_conversion(backend_fw):
+    ivy.set_backend(backend_fw)
+    fn = ivy.inputs_to_native_arrays(lambda *args, **kwargs: (args, kwargs))
+    x = ivy.array([1.0, 2.0])
+    for _ in range(2):
+        args, kwargs = fn(x, [x, 1, (x, "a")], axis=0, y={"b": x, "c": None})
+        assert ivy.is_native_array(args[0])
+        assert ivy.is_native_array(args[1][0]) and args[1][1] == 1
+        assert ivy.is_native_array(args[1][2][0]) and args[1][2][1] == "a"
+        assert ivy.is_native_array(kwargs["y"]["b"]) and kwargs["axis"] == 0
+    # the conversion plan is learnt once per signature of the arguments
+    convert = ivy.func_wrapper._cached_nest_converter(
+        ivy.func_wrapper._leaf_to_native,
+        ivy.func_wrapper._is_native_convertible_type,
+        lambda x: ivy.args_to_native(*x[0], **x[1]),
+    )
+    for _ in range(2):
+        args, _ = convert(((x, [x, x]), {}))
+        assert all(ivy.is_native_array(a) for a in (args[0], *args[1]))
+    assert len(convert.plans) == 1
+    convert(((x, 1), {}))
+    assert len(convert.plans) == 2
+    ret = ivy.outputs_to_ivy_arrays(lambda: (x.data, [x.data, 1.0]))()
+    assert isinstance(ret[0], ivy.Array) and isinstance(ret[1][0], ivy.Array)
+    ivy.previous_backend()
+
+
+def test_casting_unsupported_dtypes_table(backend_fw):
+    ivy.set_backend(backend_fw)
+
+    @ivy.func_wrapper.with_unsupported_dtypes(
+        {"0.0.0 and above": ("float16",)}, ivy.backend_version
+    )
+    def fn(x):
+        return x
+
+    table = ivy.func_wrapper._casting_unsupported_dtypes
+    x = ivy.array([1.0, 2.0])
+    for _ in range(2):
+        assert np.allclose(ivy.to_numpy(fn(x)), [1.0, 2.0])
+    # the unsupported dtypes are resolved once for the backend and device
+    key = (
+        fn.__wrapped__,
+        ivy.current_backend_str(),
+        ivy.backend_version["version"],
+        ivy.default_device().split(":")[0],
+    )
+    assert "float16" in table[key]
+    ivy.previous_backend()
+    assert not table
+
+
 def test_to_native_arrays_and_back(backend_fw):
     ivy.set_backend(backend_fw)
     x = ivy.array(1.0)
@@ -209,3 +372,38 @@ def test_views(array_to_update, backend_fw):
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
     ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("matmul", ([[1.0, 2.0], [3.0, 4.0]], [[1.0], [2.0]]), {}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 0}),
+        ("reshape", ([[1.0, 2.0], [3.0, 4.0]], (4,)), {}),
+        ("concat", ([[1.0, 2.0], [3.0, 4.0]],), {}),
+    ],
+)
+def test_compose_wrappers(fn_name, args, kwargs, backend_fw):
+    ivy.set_backend(backend_fw)
+    args = tuple(
+        ivy.array(arg) if isinstance(arg, list) and fn_name != "concat" else arg
+        for arg in args
+    )
+    if fn_name == "concat":
+        args = ([ivy.array(arg) for arg in args[0]],)
+    expected = ivy.__dict__[fn_name](*args, **kwargs)
+    ivy.set_compose_wrappers_mode(True)
+    assert ivy.add.__code__.co_name == "_composed"
+    ret = ivy.__dict__[fn_name](*args, **kwargs)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    # containers and out arguments are handled by the full chain of wrappers
+    cont = ivy.Container(a=args[0], b=args[0])
+    assert isinstance(ivy.__dict__[fn_name](cont, *args[1:], **kwargs), ivy.Container)
+    out = ivy.zeros_like(expected)
+    ivy.__dict__[fn_name](*args, out=out, **kwargs)
+    assert np.allclose(ivy.to_numpy(out), ivy.to_numpy(expected))
+    ivy.unset_compose_wrappers_mode()
+    assert ivy.add.__code__.co_name != "_composed"
+    ivy.previous_backend()
@@ -734,6 +734,35 @@ def test_module_training_with_duplicate(batch_shape, channels, same_layer, on_de
         return
 
 
+# untracked call
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_untracked_call(batch_shape, input_channels, output_channels, on_device):
+    x = ivy.random_uniform(shape=tuple(batch_shape) + (input_channels,))
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+
+    # the state tracked by a call is cleared by the next call, even an untracked one,
+    # while the containers returned before stay intact for the callers holding them
+    module(x, track_submod_rets=True, track_submod_call_order=True)
+    sm_rets = module.submod_rets
+    num_rets = len(list(sm_rets.cont_to_iterator_keys()))
+    assert num_rets > 0
+    ret = module(x)
+    assert ret.shape == tuple(batch_shape) + (64,)
+    assert len(list(sm_rets.cont_to_iterator_keys())) == num_rets
+    assert not module.submod_rets
+    assert not module.submod_call_order
+    for submod in [module, module._dl0, module._dl1, module._dl0._l0]:
+        assert not submod.track_submod_rets()
+        assert not submod.check_submod_rets()
+    module(x, expected_submod_rets=sm_rets)
+
+
 # module with dict training
 @given(
     batch_shape=helpers.get_shape(
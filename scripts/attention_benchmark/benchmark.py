@@ -0,0 +1,85 @@
+"""
+Measure the time and peak memory taken by the compositional
+`ivy.scaled_dot_product_attention` across sequence lengths, with and without causal
+masking, with the full similarity matrix materialised and with the keys and values
+attended blockwise.
+
+Usage: python scripts/attention_benchmark/benchmark.py --backends numpy
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ivy
+from ivy.functional.ivy import layers
+
+
+def attention_cost(length, is_causal, block_size, features=64, number=3):
+    """
+    Time the self-attention of a sequence and trace its peak memory.
+
+    Parameters
+    ----------
+    length
+        the length of the sequence.
+    is_causal
+        whether to apply causal masking.
+    block_size
+        the number of queries and keys per block, above which the sequences are
+        attended blockwise.
+    features
+        the number of features of the queries, keys and values.
+    number
+        the number of runs to take the best time of.
+
+    Returns
+    -------
+    ret
+        the time taken in milliseconds and the peak memory in megabytes.
+    """
+    x = ivy.random_uniform(shape=(1, length, features))
+    default_block_size = layers._attention_block_size
+    layers._attention_block_size = block_size
+    try:
+        elapsed = []
+        for _ in range(number):
+            start = time.perf_counter()
+            layers.scaled_dot_product_attention(x, x, x, is_causal=is_causal)
+            elapsed.append(time.perf_counter() - start)
+        tracemalloc.start()
+        layers.scaled_dot_product_attention(x, x, x, is_causal=is_causal)
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        layers._attention_block_size = default_block_size
+    return min(elapsed) * 1e3, memory / 1e6
+
+
+def run(backends, lengths=(1024, 2048, 4096), number=3):
+    print(
+        f"{'backend':<12}{'length':>8}{'causal':>8}{'dense (ms)':>12}{'(MB)':>8}"
+        f"{'blockwise (ms)':>16}{'(MB)':>8}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for length in lengths:
+            for is_causal in (False, True):
+                dense = attention_cost(length, is_causal, length, number=number)
+                blockwise = attention_cost(
+                    length, is_causal, layers._attention_block_size, number=number
+                )
+                print(
+                    f"{backend:<12}{length:>8}{str(is_causal):>8}{dense[0]:>12.0f}"
+                    f"{dense[1]:>8.0f}{blockwise[0]:>16.0f}{blockwise[1]:>8.0f}"
+                )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--lengths", nargs="+", type=int, default=[1024, 2048, 4096])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.lengths, parsed.number)
@@ -0,0 +1,74 @@
+"""
+Measure the time taken by a `set_backend` / `previous_backend` round trip, with the
+wrapped functions of the backend being rebuilt on every switch, with them being reused
+from the previous time the backend was set, and with them only being wrapped on first
+use.
+
+Usage: python scripts/backend_switch_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+from ivy.utils.backend import handler
+
+
+def _round_trip(backend):
+    ivy.set_backend(backend)
+    ivy.previous_backend()
+
+
+def _uncached_round_trip(backend):
+    handler._wrapped_backend_fns.clear()
+    _round_trip(backend)
+
+
+def round_trip_time(backend, number=20):
+    """
+    Time a `set_backend` / `previous_backend` round trip for `backend`.
+
+    Parameters
+    ----------
+    backend
+        the name of the backend to switch to and back from.
+    number
+        the number of round trips to average over.
+
+    Returns
+    -------
+    ret
+        the time per round trip in milliseconds when wrapping the backend from
+        scratch, when reusing its cached wrapped functions and when wrapping its
+        functions lazily from scratch.
+    """
+    # the first switch imports the backend, which shouldn't be timed
+    _round_trip(backend)
+    uncached = timeit.timeit(lambda: _uncached_round_trip(backend), number=number)
+    _round_trip(backend)
+    cached = timeit.timeit(lambda: _round_trip(backend), number=number)
+    ivy.set_lazy_wrapping_mode(True)
+    lazy = timeit.timeit(lambda: _uncached_round_trip(backend), number=number)
+    ivy.unset_lazy_wrapping_mode()
+    return uncached / number * 1e3, cached / number * 1e3, lazy / number * 1e3
+
+
+def run(backends, number=20):
+    print(
+        f"{'backend':<12}{'uncached (ms)':>16}{'cached (ms)':>14}{'speed up':>10}"
+        f"{'lazy (ms)':>12}{'speed up':>10}"
+    )
+    for backend in backends:
+        uncached, cached, lazy = round_trip_time(backend, number)
+        print(
+            f"{backend:<12}{uncached:>16.2f}{cached:>14.2f}{uncached / cached:>9.1f}x"
+            f"{lazy:>12.2f}{uncached / lazy:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=20)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,97 @@
+"""
+Measure the time taken by the key-chain methods of `ivy.Container` on a container of
+parameters with many leaves, such as the variables of a deep model.
+
+Usage: python scripts/container_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def parameters(num_layers, num_blocks=4):
+    """
+    Build a container of parameters like the variables of a deep model.
+
+    Parameters
+    ----------
+    num_layers
+        the number of layers in each block.
+    num_blocks
+        the number of blocks.
+
+    Returns
+    -------
+    ret
+        the container, with four leaves per layer.
+    """
+    return ivy.Container(
+        {
+            f"block{b}": {
+                f"layer{i}": {
+                    "linear": {"w": ivy.zeros((2,)), "b": ivy.zeros((2,))},
+                    "norm": {"scale": ivy.ones((2,)), "offset": ivy.zeros((2,))},
+                }
+                for i in range(num_layers)
+            }
+            for b in range(num_blocks)
+        }
+    )
+
+
+def timeit(fn, number):
+    """
+    Time a function.
+
+    Parameters
+    ----------
+    fn
+        the function to time, taking no arguments.
+    number
+        the number of times to call the function.
+
+    Returns
+    -------
+    ret
+        the time taken by a call in milliseconds.
+    """
+    fn()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def run(backends, number=3):
+    print(f"{'backend':<12}{'leaves':>8}  {'method':<28}{'time (ms)':>10}")
+    for backend in backends:
+        ivy.set_backend(backend)
+        for num_layers in (100, 1000):
+            params = parameters(num_layers)
+            grads = params.cont_map(lambda x, _: x + 1)
+            key_chains = params.cont_all_key_chains()
+            to_prune = key_chains[::40]
+            methods = {
+                "cont_all_key_chains": lambda: params.cont_all_key_chains(),
+                "cont_at_key_chain (x100)": lambda: [
+                    params.cont_at_key_chain(kc) for kc in key_chains[::40][:100]
+                ],
+                "cont_prune_key_chains": lambda: params.cont_prune_key_chains(to_prune),
+                "cont_multi_map": lambda: ivy.Container.cont_multi_map(
+                    lambda xs, _: xs[0], [params, grads]
+                ),
+            }
+            for name, fn in methods.items():
+                elapsed = timeit(fn, number)
+                print(f"{backend:<12}{len(key_chains):>8}  {name:<28}{elapsed:>10.2f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
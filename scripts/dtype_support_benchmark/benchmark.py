@@ -0,0 +1,74 @@
+"""
+Measure the per-call time of functions decorated with unsupported dtypes, such as
+`ivy.acosh` on the torch backend or `ivy.atan2` on the numpy backend, with their
+unsupported dtypes being resolved on every call and with them being looked up in the
+table resolved once per function, backend, backend version and device.
+
+Usage: python scripts/dtype_support_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+from ivy import func_wrapper
+
+
+def _unresolved_call(fn, *args):
+    func_wrapper._clear_casting_unsupported_dtypes()
+    return fn(*args)
+
+
+def call_time(fn_name, resolved, number=200):
+    """
+    Time a call to the ivy function `fn_name` with two small float arrays.
+
+    Parameters
+    ----------
+    fn_name
+        the name of the ivy function to call.
+    resolved
+        whether the unsupported dtypes of the function are looked up in the resolved
+        table, rather than being resolved again on every call.
+    number
+        the number of calls to average over.
+
+    Returns
+    -------
+    ret
+        the time per call in microseconds.
+    """
+    fn = getattr(ivy, fn_name)
+    x = ivy.array([1.5, 2.5, 3.5])
+    args = (x,) if fn_name == "acosh" else (x, x)
+    fn(*args)
+    if resolved:
+        elapsed = timeit.timeit(lambda: fn(*args), number=number)
+    else:
+        elapsed = timeit.timeit(lambda: _unresolved_call(fn, *args), number=number)
+    return elapsed / number * 1e6
+
+
+def run(backends, number=200):
+    print(
+        f"{'backend':<12}{'function':<10}{'unresolved (us)':>18}{'resolved (us)':>16}"
+        f"{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for fn_name in ("acosh", "atan2"):
+            unresolved = call_time(fn_name, False, number)
+            resolved = call_time(fn_name, True, number)
+            print(
+                f"{backend:<12}{fn_name:<10}{unresolved:>18.1f}{resolved:>16.1f}"
+                f"{unresolved / resolved:>9.1f}x"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=200)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
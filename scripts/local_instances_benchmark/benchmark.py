@@ -0,0 +1,68 @@
+"""
+Measure the time taken to compile a new local ivy instance with `ivy.with_backend`, and
+the memory each instance takes, with every module of ivy being executed again for each
+instance and with the modules which don't depend on the instance being shared.
+
+Usage: python scripts/local_instances_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import ivy
+
+
+def instance_cost(backend, shared, number=3):
+    """
+    Compile `number` local ivy instances with `backend` set.
+
+    Parameters
+    ----------
+    backend
+        the name of the backend to set in the local instances.
+    shared
+        whether the instances share the modules which don't depend on them.
+    number
+        the number of instances to compile.
+
+    Returns
+    -------
+    ret
+        the time taken to compile an instance in milliseconds, and the memory taken by
+        each instance in megabytes.
+    """
+    # the first instance compiles the modules, which are cached for the next ones
+    ivy.with_backend(backend, cached=False, shared=shared)
+    start = time.perf_counter()
+    for _ in range(number):
+        ivy.with_backend(backend, cached=False, shared=shared)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    instances = [
+        ivy.with_backend(backend, cached=False, shared=shared) for _ in range(number)
+    ]
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return elapsed / number * 1e3, memory / number / 1e6
+
+
+def run(backends, number=3):
+    print(f"{'backend':<12}{'mode':<10}{'creation (ms)':>16}{'memory (MB)':>14}")
+    for backend in backends:
+        for shared in (False, True):
+            elapsed, memory = instance_cost(backend, shared, number)
+            mode = "shared" if shared else "isolated"
+            print(f"{backend:<12}{mode:<10}{elapsed:>16.0f}{memory:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,78 @@
+"""
+Measure the time taken by `ivy.lstm_update` across sequence lengths and batch sizes,
+with the time dimension unrolled by the compositional implementation through ivy
+functions, and with the backend implementation which runs the recurrence natively.
+
+Usage: python scripts/lstm_benchmark/benchmark.py --backends numpy torch jax
+"""
+
+import argparse
+import timeit
+
+import ivy
+from ivy.functional.ivy.layers import lstm_update as compositional_lstm_update
+
+
+def _lstm_inputs(timesteps, batch_size, channels):
+    x = ivy.random_uniform(shape=(batch_size, timesteps, channels))
+    init_h = ivy.zeros((batch_size, channels))
+    init_c = ivy.zeros((batch_size, channels))
+    kernel = ivy.random_uniform(shape=(channels, 4 * channels))
+    recurrent_kernel = ivy.random_uniform(shape=(channels, 4 * channels))
+    bias = ivy.random_uniform(shape=(4 * channels,))
+    return (x, init_h, init_c, kernel, recurrent_kernel), {"bias": bias}
+
+
+def lstm_time(timesteps, batch_size, channels=32, number=3):
+    """
+    Time an lstm update with the compositional and the backend implementations.
+
+    Parameters
+    ----------
+    timesteps
+        the length of the input sequences.
+    batch_size
+        the number of input sequences.
+    channels
+        the number of input and output channels.
+    number
+        the number of updates to take the best time of.
+
+    Returns
+    -------
+    ret
+        the time per update in milliseconds of the compositional and the backend
+        implementations.
+    """
+    args, kwargs = _lstm_inputs(timesteps, batch_size, channels)
+    return tuple(
+        min(timeit.repeat(lambda: fn(*args, **kwargs), number=1, repeat=number)) * 1e3
+        for fn in (compositional_lstm_update, ivy.lstm_update)
+    )
+
+
+def run(backends, timesteps=(10, 100, 1000), batch_sizes=(1, 32), number=3):
+    print(
+        f"{'backend':<12}{'timesteps':>10}{'batch':>8}{'unrolled (ms)':>16}"
+        f"{'fused (ms)':>12}{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for t in timesteps:
+            for batch_size in batch_sizes:
+                unrolled, fused = lstm_time(t, batch_size, number=number)
+                print(
+                    f"{backend:<12}{t:>10}{batch_size:>8}{unrolled:>16.1f}"
+                    f"{fused:>12.1f}{unrolled / fused:>9.1f}x"
+                )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--timesteps", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--batch_sizes", nargs="+", type=int, default=[1, 32])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.timesteps, parsed.batch_sizes, parsed.number)
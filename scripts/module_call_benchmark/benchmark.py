@@ -0,0 +1,98 @@
+"""
+Measure the per-call overhead of `ivy.Module.__call__` on a deep `ivy.Sequential` of
+small `ivy.Linear` layers, with no submodule tracking requested and with the returns
+of the submodules being tracked, relative to calling `ivy.linear` with the variables of
+the layers directly.
+
+Usage: python scripts/module_call_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _direct(weights, x):
+    for w, b in weights:
+        x = ivy.linear(x, w, bias=b)
+    return x
+
+
+def direct_time(model, x, number=20):
+    """
+    Time the computation of `model` on `x` without going through the modules.
+
+    Parameters
+    ----------
+    model
+        the sequential module of linear layers to compute.
+    x
+        the input of the module.
+    number
+        the number of calls to average over, taking the fastest of 5 repeats.
+
+    Returns
+    -------
+    ret
+        the time per call in milliseconds.
+    """
+    weights = [(layer.v.w, layer.v.b) for layer in model]
+    _direct(weights, x)
+    times = timeit.repeat(lambda: _direct(weights, x), number=number, repeat=5)
+    return min(times) / number * 1e3
+
+
+def call_time(model, x, track, number=20):
+    """
+    Time a forward call of `model` on `x`.
+
+    Parameters
+    ----------
+    model
+        the module to call.
+    x
+        the input of the module.
+    track
+        whether to track the returns of the submodules.
+    number
+        the number of calls to average over, taking the fastest of 5 repeats.
+
+    Returns
+    -------
+    ret
+        the time per call in milliseconds.
+    """
+    model(x, track_submod_rets=track)
+    times = timeit.repeat(
+        lambda: model(x, track_submod_rets=track), number=number, repeat=5
+    )
+    return min(times) / number * 1e3
+
+
+def run(backends, number=20):
+    print(
+        f"{'backend':<12}{'layers':>8}{'direct (ms)':>13}{'untracked (ms)':>16}"
+        f"{'tracked (ms)':>14}{'overhead per layer (us)':>25}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        x = ivy.random_uniform(shape=(1, 8))
+        for depth in (4, 16, 64):
+            model = ivy.Sequential(*[ivy.Linear(8, 8) for _ in range(depth)])
+            direct = direct_time(model, x, number)
+            untracked = call_time(model, x, False, number)
+            tracked = call_time(model, x, True, number)
+            print(
+                f"{backend:<12}{depth:>8}{direct:>13.2f}{untracked:>16.2f}"
+                f"{tracked:>14.2f}{(untracked - direct) / depth * 1e3:>25.1f}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=20)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
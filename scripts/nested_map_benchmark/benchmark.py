@@ -0,0 +1,79 @@
+"""
+Measure the time taken by `ivy.nested_map` to map a function over nests of parameters
+with 10, 1k and 100k leaves, traversing the whole nest on every call and following the
+traversal plan cached for the structure of the nest.
+
+Usage: python scripts/nested_map_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _nest(num_leaves):
+    # a nest of layers, each with a dict of weights and a tuple of buffers
+    x = ivy.array([1.0])
+    return {
+        f"layer{i}": {"w": x, "b": [x], "buffers": (x, {"mean": x, "var": x})}
+        for i in range(max(1, num_leaves // 5))
+    }
+
+
+def nested_map_time(nest, cache_plan, number=10):
+    """
+    Time a call to `ivy.nested_map` with the identity function over `nest`.
+
+    Parameters
+    ----------
+    nest
+        the nest to map over.
+    cache_plan
+        whether to use the cached traversal plan of the nest.
+    number
+        the number of calls to average over.
+
+    Returns
+    -------
+    ret
+        the time per call in milliseconds.
+    """
+    ivy.nested_map(lambda a: a, nest, shallow=False, cache_plan=cache_plan)
+    return (
+        timeit.timeit(
+            lambda: ivy.nested_map(
+                lambda a: a, nest, shallow=False, cache_plan=cache_plan
+            ),
+            number=number,
+        )
+        / number
+        * 1e3
+    )
+
+
+def run(backends, number=10):
+    print(
+        f"{'backend':<12}{'leaves':>10}{'traversed (ms)':>16}{'cached (ms)':>14}"
+        f"{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for num_leaves in (10, 1000, 100000):
+            nest = _nest(num_leaves)
+            leaves = len(ivy.nested_argwhere(nest, lambda a: isinstance(a, ivy.Array)))
+            traversed = nested_map_time(nest, False, number)
+            cached = nested_map_time(nest, True, number)
+            print(
+                f"{backend:<12}{leaves:>10}{traversed:>16.3f}{cached:>14.3f}"
+                f"{traversed / cached:>9.1f}x"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=10)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,143 @@
+"""
+Measure the time taken by `ivy.nms` on the candidate boxes of an image, against a
+greedy loop suppressing the boxes one kept box at a time, and by `ivy.batched_nms`
+on the boxes of several images and classes at once.
+
+Usage: python scripts/nms_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def random_boxes(num_boxes, seed=0):
+    """
+    Sample clustered candidate boxes in a 1000x1000 image, like the raw detections
+    of a detection model.
+
+    Parameters
+    ----------
+    num_boxes
+        the number of boxes to sample.
+    seed
+        the seed of the random generator.
+
+    Returns
+    -------
+    ret
+        the boxes of shape *[num_boxes, 4]* and their scores.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 1000, (max(num_boxes // 50, 1), 2))
+    xy = centers[rng.integers(0, len(centers), num_boxes)]
+    xy = xy + rng.normal(0, 10, (num_boxes, 2))
+    wh = rng.uniform(20, 100, (num_boxes, 2))
+    boxes = np.concatenate([xy - wh / 2, xy + wh / 2], axis=1).astype(np.float32)
+    return boxes, rng.uniform(size=num_boxes).astype(np.float32)
+
+
+def greedy_nms(boxes, scores, iou_threshold=0.5):
+    """
+    Suppress the boxes by keeping one box at a time, as `ivy.nms` used to.
+
+    Parameters
+    ----------
+    boxes
+        the boxes of shape *[num_boxes, 4]*.
+    scores
+        the scores of the boxes.
+    iou_threshold
+        the intersection over union above which boxes are suppressed.
+
+    Returns
+    -------
+    ret
+        the indices of the kept boxes.
+    """
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1) * (y2 - y1)
+    order = ivy.argsort(-1 * scores, stable=True)
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+        xx1 = ivy.maximum(x1[i], x1[order[1:]])
+        yy1 = ivy.maximum(y1[i], y1[order[1:]])
+        xx2 = ivy.minimum(x2[i], x2[order[1:]])
+        yy2 = ivy.minimum(y2[i], y2[order[1:]])
+        inter = ivy.maximum(0.0, xx2 - xx1) * ivy.maximum(0.0, yy2 - yy1)
+        ovr = inter / (areas[i] + areas[order[1:]] - inter)
+        order = order[ivy.nonzero(ovr <= iou_threshold)[0] + 1]
+    return ivy.array(keep)
+
+
+def timeit(fn, number):
+    """
+    Time a function.
+
+    Parameters
+    ----------
+    fn
+        the function to time, taking no arguments.
+    number
+        the number of times to call the function.
+
+    Returns
+    -------
+    ret
+        the time taken by a call in milliseconds.
+    """
+    fn()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def run(backends, number=3):
+    print(
+        f"{'backend':<12}{'boxes':>8}{'greedy (ms)':>14}{'nms (ms)':>12}"
+        f"{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for num_boxes in (1000, 5000, 10000):
+            boxes, scores = (ivy.array(x) for x in random_boxes(num_boxes))
+            greedy = timeit(lambda: greedy_nms(boxes, scores), number)
+            vectorized = timeit(lambda: ivy.nms(boxes, scores), number)
+            print(
+                f"{backend:<12}{num_boxes:>8}{greedy:>14.1f}{vectorized:>12.1f}"
+                f"{greedy / vectorized:>9.1f}x"
+            )
+        ivy.previous_backend()
+    print(f"\n{'backend':<12}{'images':>8}{'per image (ms)':>16}{'batched (ms)':>14}")
+    for backend in backends:
+        ivy.set_backend(backend)
+        num_images, num_classes = 8, 10
+        boxes, scores = random_boxes(num_images * 1000)
+        images = np.repeat(np.arange(num_images), 1000)
+        classes = np.random.default_rng(0).integers(0, num_classes, len(boxes))
+        idxs = ivy.array(images * num_classes + classes)
+        boxes, scores = ivy.array(boxes), ivy.array(scores)
+
+        def per_image():
+            for i in range(num_images * num_classes):
+                mask = idxs == i
+                ivy.nms(boxes[mask], scores[mask])
+
+        looped = timeit(per_image, number)
+        batched = timeit(lambda: ivy.batched_nms(boxes, scores, idxs), number)
+        print(f"{backend:<12}{num_images:>8}{looped:>16.1f}{batched:>14.1f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,110 @@
+"""
+Measure the time taken by an optimizer update of a container of parameters with many
+leaves, such as the variables of a deep model, with the leaves updated one at a time
+and with the container packed into flat buffers.
+
+Usage: python scripts/packed_container_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def parameters(num_layers, num_blocks=4):
+    """
+    Build a container of parameters like the variables of a deep model.
+
+    Parameters
+    ----------
+    num_layers
+        the number of layers in each block.
+    num_blocks
+        the number of blocks.
+
+    Returns
+    -------
+    ret
+        the container, with four leaves per layer.
+    """
+    return ivy.Container(
+        {
+            f"block{b}": {
+                f"layer{i}": {
+                    "linear": {"w": ivy.ones((32, 32)), "b": ivy.zeros((32,))},
+                    "norm": {"scale": ivy.ones((32,)), "offset": ivy.zeros((32,))},
+                }
+                for i in range(num_layers)
+            }
+            for b in range(num_blocks)
+        }
+    )
+
+
+def timeit(fn, number):
+    """
+    Time a function.
+
+    Parameters
+    ----------
+    fn
+        the function to time, taking no arguments.
+    number
+        the number of times to call the function.
+
+    Returns
+    -------
+    ret
+        the time taken by a call in milliseconds.
+    """
+    fn()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def run(backends, number=3):
+    print(
+        f"{'backend':<12}{'leaves':>8}  {'update':<26}{'per leaf (ms)':>15}"
+        f"{'packed (ms)':>13}{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for num_layers in (25, 250):
+            params = parameters(num_layers)
+            grads = params * 0.1
+            mw, vw = grads, grads**2
+            packed = params.cont_pack()
+            # the state of the optimizers stays packed after their first update
+            packed_grads, packed_mw, packed_vw = (
+                x.cont_pack(like=packed) for x in (grads, mw, vw)
+            )
+            updates = {
+                "gradient_descent_update": lambda w, g, m, v: (
+                    ivy.gradient_descent_update(w, g, 0.1)
+                ),
+                "adam_update": lambda w, g, m, v: ivy.adam_update(w, g, 0.1, m, v, 1),
+                "lars_update": lambda w, g, m, v: ivy.lars_update(w, g, 0.1),
+                "lamb_update": lambda w, g, m, v: ivy.lamb_update(w, g, 0.1, m, v, 1),
+            }
+            num_leaves = len(params.cont_all_key_chains())
+            for name, update in updates.items():
+                per_leaf = timeit(lambda: update(params, grads, mw, vw), number)
+                with_packed = timeit(
+                    lambda: update(packed, packed_grads, packed_mw, packed_vw), number
+                )
+                print(
+                    f"{backend:<12}{num_leaves:>8}  {name:<26}{per_leaf:>15.1f}"
+                    f"{with_packed:>13.1f}{per_leaf / with_packed:>9.1f}x"
+                )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
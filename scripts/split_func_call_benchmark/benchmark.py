@@ -0,0 +1,72 @@
+"""
+Measure the time taken by `split_func_call` to call a function in chunks, with the
+chunks being computed one after the other and with them being pipelined over a pool of
+worker threads.
+
+Usage: python scripts/split_func_call_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _func(x):
+    return ivy.tanh(ivy.matmul(x, ivy.matrix_transpose(x)))
+
+
+def split_time(x, chunk_size, num_workers, number=5):
+    """
+    Time a chunked call of a function over the first axis of `x`.
+
+    Parameters
+    ----------
+    x
+        the input to split into chunks.
+    chunk_size
+        the size of each of the chunks.
+    num_workers
+        the number of threads to compute the chunks with.
+    number
+        the number of calls to average over.
+
+    Returns
+    -------
+    ret
+        the time per call in milliseconds.
+    """
+    return (
+        timeit.timeit(
+            lambda: ivy.split_func_call(
+                _func, [x], "concat", chunk_size=chunk_size, num_workers=num_workers
+            ),
+            number=number,
+        )
+        / number
+        * 1e3
+    )
+
+
+def run(backends, number=5, workers=(1, 2, 4)):
+    print(
+        f"{'backend':<12}{'chunk size':>12}"
+        + "".join(f"{f'{w} worker(s) (ms)':>20}" for w in workers)
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        x = ivy.random_uniform(shape=(64, 256, 256))
+        for chunk_size in (4, 16):
+            times = [split_time(x, chunk_size, w, number) for w in workers]
+            print(
+                f"{backend:<12}{chunk_size:>12}" + "".join(f"{t:>20.2f}" for t in times)
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=5)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,75 @@
+"""
+Measure the per-call overhead of `outputs_to_frontend_arrays` in the torch frontend,
+which scopes the default dtypes of the frontend around creation functions and tracks
+the gradients of the returned tensors, wrapping functions which return a precomputed
+array so that only the wrapper is timed.
+
+Usage: python scripts/torch_frontend_wrapper_benchmark/benchmark.py --backends numpy
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def overhead(fn, args, number=2000):
+    """
+    Time a call to `fn` wrapped with `outputs_to_frontend_arrays`.
+
+    Parameters
+    ----------
+    fn
+        the function to wrap.
+    args
+        the positional arguments to call the function with.
+    number
+        the number of calls to average over, taking the fastest of 5 repeats.
+
+    Returns
+    -------
+    ret
+        the time per call of the wrapped function in microseconds.
+    """
+    from ivy.functional.frontends.torch.func_wrapper import (
+        outputs_to_frontend_arrays,
+    )
+
+    wrapped = outputs_to_frontend_arrays(fn)
+    wrapped(*args)
+    times = timeit.repeat(lambda: wrapped(*args), number=number, repeat=5)
+    return min(times) / number * 1e6
+
+
+def run(backends, number=2000):
+    print(f"{'backend':<12}{'call':<24}{'overhead (us)':>15}")
+    for backend in backends:
+        ivy.set_backend(backend)
+        import ivy.functional.frontends.torch as torch_frontend
+
+        ret = ivy.array([1.0, 2.0, 3.0])
+
+        def zeros(*size, **kwargs):
+            return ret
+
+        def add(input, other, **kwargs):
+            return ret
+
+        x = torch_frontend.tensor([1.0, 2.0, 3.0])
+        w = torch_frontend.tensor([1.0, 2.0, 3.0], requires_grad=True)
+        for name, fn, args in (
+            ("creation", zeros, ((2, 3),)),
+            ("op", add, (x, x)),
+            ("op requiring grad", add, (x, w)),
+        ):
+            elapsed = overhead(fn, args, number)
+            print(f"{backend:<12}{name:<24}{elapsed:>15.1f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=2000)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
@@ -0,0 +1,81 @@
+"""
+Measure the time taken by `ivy.with_backend` to compile a local ivy instance in a fresh
+process, with the transformed modules of ivy being cached on disk, on a cold cache and
+on a warm cache, and without the disk cache.
+
+Usage: python scripts/with_backend_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+_startup_code = """
+import time
+import ivy
+from ivy.utils.backend import ast_helpers
+
+ast_helpers._bytecode_cache_dir = {cache_dir!r}
+start = time.perf_counter()
+ivy.with_backend({backend!r})
+print(time.perf_counter() - start)
+"""
+
+
+def startup_time(backend, cache_dir):
+    """
+    Time `ivy.with_backend(backend)` in a fresh python process.
+
+    Parameters
+    ----------
+    backend
+        the name of the backend to compile the local ivy instance with.
+    cache_dir
+        the directory of the disk cache of transformed modules, or None to disable it.
+
+    Returns
+    -------
+    ret
+        the time taken in milliseconds.
+    """
+    ret = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _startup_code.format(backend=backend, cache_dir=cache_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    return float(ret.stdout.strip().splitlines()[-1]) * 1e3
+
+
+def run(backends, number=3):
+    print(
+        f"{'backend':<12}{'no cache (ms)':>16}{'cold (ms)':>12}{'warm (ms)':>12}"
+        f"{'speed up':>10}"
+    )
+    for backend in backends:
+        uncached = min(startup_time(backend, None) for _ in range(number))
+        cold, warm = [], []
+        for _ in range(number):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cold.append(startup_time(backend, cache_dir))
+                warm.append(startup_time(backend, cache_dir))
+        cold, warm = min(cold), min(warm)
+        print(
+            f"{backend:<12}{uncached:>16.0f}{cold:>12.0f}{warm:>12.0f}"
+            f"{uncached / warm:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=3)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)
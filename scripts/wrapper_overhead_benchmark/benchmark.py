@@ -0,0 +1,220 @@
+"""
+Measure the per-call overhead which ivy's function wrappers add on top of the backend
+implementation of a function, with and without the wrappers being composed, the cost
+of converting the arguments with and without the cached conversion plans, and the cost
+of checking the backend of the arrays passed, with only arrays of the current backend
+existing and with arrays of other backends possibly existing, and the cost of the
+nan check with each array being checked by a separate ivy op and with the arrays being
+checked at once by the backend, on every call and on every tenth call.
+
+Usage: python scripts/wrapper_overhead_benchmark/benchmark.py --backends numpy torch
+"""
+
+import argparse
+import timeit
+
+import ivy
+
+
+def _cases():
+    x = ivy.random_uniform(shape=(4,))
+    m = ivy.random_uniform(shape=(4, 4))
+    return [
+        ("add", (x, x), {}),
+        ("matmul", (m, m), {}),
+        ("sum", (m,), {"axis": 0}),
+        ("reshape", (m, (16,)), {}),
+        ("concat", ([x] * 8,), {"axis": 0}),
+        ("split", (m,), {"num_or_size_splits": 4}),
+    ]
+
+
+def _time_per_call(fn, args, kwargs, number):
+    return timeit.timeit(lambda: fn(*args, **kwargs), number=number) / number * 1e6
+
+
+def wrapper_overhead(fn_name, args, kwargs, number=1000):
+    """
+    Time a call to the ivy function `fn_name` and to its raw backend implementation.
+
+    Parameters
+    ----------
+    fn_name
+        the name of the function in the ivy namespace.
+    args
+        the positional arguments, with ivy arrays.
+    kwargs
+        the keyword arguments, with ivy arrays.
+    number
+        the number of calls to average over.
+
+    Returns
+    -------
+    ret
+        the time per call in microseconds for the wrapped function and for the
+        backend implementation.
+    """
+    native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
+    backend_fn = ivy.current_backend().__dict__[fn_name]
+    raw = _time_per_call(backend_fn, native_args, native_kwargs, number)
+    wrapped = _time_per_call(ivy.__dict__[fn_name], args, kwargs, number)
+    return wrapped, raw
+
+
+def conversion_overhead(args, kwargs, number=1000):
+    """
+    Time the conversion of the arguments to native arrays by traversing the whole nest,
+    and by replaying the cached conversion plan of the arguments' signature.
+
+    Parameters
+    ----------
+    args
+        the positional arguments, with ivy arrays.
+    kwargs
+        the keyword arguments, with ivy arrays.
+    number
+        the number of conversions to average over.
+
+    Returns
+    -------
+    ret
+        the time per conversion in microseconds when traversing the nest and when
+        using the cached conversion plan.
+    """
+    converter = ivy.func_wrapper._cached_nest_converter(
+        ivy.func_wrapper._leaf_to_native,
+        ivy.func_wrapper._is_native_convertible_type,
+        lambda x: ivy.args_to_native(*x[0], **x[1]),
+    )
+    traversed = _time_per_call(ivy.args_to_native, args, kwargs, number)
+    cached = _time_per_call(lambda *a, **kw: converter((a, kw)), args, kwargs, number)
+    return traversed, cached
+
+
+def backend_check_overhead(args, kwargs, number=1000):
+    """
+    Time the check of the backend of the arrays in the arguments by
+    `handle_backend_invalid`, with only arrays of the current backend existing, and
+    with arrays of another backend possibly existing, in which case the arrays are
+    found in the arguments and have their backend generation checked.
+
+    Parameters
+    ----------
+    args
+        the positional arguments, with ivy arrays.
+    kwargs
+        the keyword arguments, with ivy arrays.
+    number
+        the number of checks to average over.
+
+    Returns
+    -------
+    ret
+        the time per check in microseconds with a single backend and with mixed
+        backends.
+    """
+    fn = ivy.func_wrapper.handle_backend_invalid(lambda *a, **kw: None)
+    single = _time_per_call(fn, args, kwargs, number)
+    array_backends = ivy.func_wrapper._array_backends
+    ivy.func_wrapper._register_array_backend("other")
+    mixed = _time_per_call(fn, args, kwargs, number)
+    array_backends.discard("other")
+    ivy.func_wrapper._update_mixed_backend_arrays()
+    return single, mixed
+
+
+def _unfused_has_nans(x):
+    # the nan check with each array checked by a separate ivy op and host sync
+    return ivy.nested_any(x, lambda y: ivy.is_array(y) and bool(ivy.isnan(y).any()))
+
+
+def nan_check_overhead(args, kwargs, number=1000):
+    """
+    Time the nan check of the arrays in the arguments by `handle_nans` with the
+    `raise_exception` policy, with each array checked by a separate ivy op, with the
+    arrays checked at once by the backend, and with only every tenth call checked.
+
+    Parameters
+    ----------
+    args
+        the positional arguments, with ivy arrays.
+    kwargs
+        the keyword arguments, with ivy arrays.
+    number
+        the number of checks to average over.
+
+    Returns
+    -------
+    ret
+        the time per check in microseconds with separate ivy ops, fused in the
+        backend, and fused in the backend on every tenth call.
+    """
+    unfused = _time_per_call(
+        lambda *a, **kw: _unfused_has_nans(a) or _unfused_has_nans(kw),
+        args,
+        kwargs,
+        number,
+    )
+    fn = ivy.func_wrapper.handle_nans(lambda *a, **kw: None)
+    ivy.set_nan_policy("raise_exception")
+    fused = _time_per_call(fn, args, kwargs, number)
+    ivy.set_nan_check_interval(10)
+    sampled = _time_per_call(fn, args, kwargs, number)
+    ivy.unset_nan_check_interval()
+    ivy.unset_nan_policy()
+    return unfused, fused, sampled
+
+
+def run(backends, number=1000):
+    print(
+        f"{'backend':<12}{'op':<10}{'raw (us)':>12}{'chain (us)':>14}"
+        f"{'composed (us)':>16}{'speed up':>10}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for fn_name, args, kwargs in _cases():
+            chain, raw = wrapper_overhead(fn_name, args, kwargs, number)
+            ivy.set_compose_wrappers_mode(True)
+            composed, _ = wrapper_overhead(fn_name, args, kwargs, number)
+            ivy.unset_compose_wrappers_mode()
+            speed_up = chain / composed
+            print(
+                f"{backend:<12}{fn_name:<10}{raw:>12.2f}{chain:>14.2f}"
+                f"{composed:>16.2f}{speed_up:>9.1f}x"
+            )
+        ivy.previous_backend()
+    print(f"\n{'backend':<12}{'op':<10}{'traversed (us)':>16}{'cached (us)':>14}")
+    for backend in backends:
+        ivy.set_backend(backend)
+        for fn_name, args, kwargs in _cases():
+            traversed, cached = conversion_overhead(args, kwargs, number)
+            print(f"{backend:<12}{fn_name:<10}{traversed:>16.2f}{cached:>14.2f}")
+        ivy.previous_backend()
+    print(f"\n{'backend':<12}{'op':<10}{'single (us)':>14}{'mixed (us)':>14}")
+    for backend in backends:
+        ivy.set_backend(backend)
+        for fn_name, args, kwargs in _cases():
+            single, mixed = backend_check_overhead(args, kwargs, number)
+            print(f"{backend:<12}{fn_name:<10}{single:>14.2f}{mixed:>14.2f}")
+        ivy.previous_backend()
+    print(
+        f"\n{'backend':<12}{'op':<10}{'unfused (us)':>14}{'fused (us)':>12}"
+        f"{'every 10th (us)':>17}"
+    )
+    for backend in backends:
+        ivy.set_backend(backend)
+        for fn_name, args, kwargs in _cases():
+            unfused, fused, sampled = nan_check_overhead(args, kwargs, number)
+            print(
+                f"{backend:<12}{fn_name:<10}{unfused:>14.2f}{fused:>12.2f}"
+                f"{sampled:>17.2f}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=1000)
+    parsed = parser.parse_args()
+    run(parsed.backends, parsed.number)